@@ -4,34 +4,190 @@ from __future__ import annotations
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.typing import ConfigType
 
-from .const import CONF_DEVICE_NAME, DOMAIN, MANUFACTURER, MODEL
+from .const import (
+    CONF_LIGHTWEIGHT,
+    CONF_METER_ENTITY,
+    CONF_PART_NUMBER,
+    CONF_SOURCE_ENTITY,
+    CONF_TAGS,
+    CONF_TEMPLATE,
+    CONF_WEAR_ENTITY,
+    DOMAIN,
+    MANUFACTURER,
+    MODEL,
+)
+from .due_index import async_get_due_index
+from .entity_map import ConsumableEntityMap
+from .inventory import async_get_inventory
+from .meter import ConsumableMeter
+from .models import (
+    ConsumableTrackerData,
+    consumable_key,
+    entry_devices,
+    parse_last_replaced,
+)
+from .services import async_setup_services
+from .source import ConsumableSource
+from .store import (
+    ConsumableTrackerStore,
+    async_get_history_store,
+    async_get_last_replaced_store,
+    async_get_meter_store,
+    async_get_wear_store,
+    async_load_definitions,
+    async_migrate_definitions,
+    async_remove_store,
+)
+from .tags import async_get_tag_index
+from .templates import async_get_templates
+from .wear import ConsumableWear
+from .websocket_api import async_setup_websocket_api
 
-PLATFORMS = ["date", "sensor", "button"]
+PLATFORMS = ["date", "datetime", "sensor", "button", "number"]
+# Lightweight entries only create sensors and keep last replaced values in a store
+LIGHTWEIGHT_PLATFORMS = ["sensor"]
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Consumable Tracker services."""
+    async_setup_services(hass)
+    async_setup_websocket_api(hass)
+    return True
+
+
+def _platforms(entry: ConfigEntry) -> list[str]:
+    """Return the platforms of a config entry."""
+    return LIGHTWEIGHT_PLATFORMS if entry.data.get(CONF_LIGHTWEIGHT) else PLATFORMS
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Consumable Tracker from a config entry."""
+    await async_migrate_definitions(hass, entry)
+    templates = await async_get_templates(hass)
+    devices = entry_devices(
+        entry, await async_load_definitions(hass, entry), templates.resolve
+    )
     hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = entry.data
+    entity_map = ConsumableEntityMap(hass, entry.entry_id, devices)
+    data = ConsumableTrackerData(devices=devices, entity_map=entity_map)
+    hass.data[DOMAIN][entry.entry_id] = data
+    entry.async_on_unload(entity_map.async_start())
 
-    # Create device
-    device_registry = dr.async_get(hass)
-    device_registry.async_get_or_create(
-        config_entry_id=entry.entry_id,
-        identifiers={(DOMAIN, entry.entry_id)},
-        name=entry.data[CONF_DEVICE_NAME],
-        manufacturer=MANUFACTURER,
-        model=MODEL,
+    if entry.data.get(CONF_LIGHTWEIGHT):
+        store = async_get_last_replaced_store(hass, entry)
+        stored = await store.async_load()
+        # Keep only the values of consumables that still exist
+        store.data = {}
+        for device in devices:
+            for index, consumable in enumerate(device.consumables):
+                key = consumable_key(device.key, index)
+                if key in stored and (
+                    value := parse_last_replaced(consumable, stored[key])
+                ):
+                    store.data[key] = stored[key]
+                    data.last_replaced[key] = value
+        data.last_replaced_store = store
+
+    # Keep the undo history of consumables that still exist
+    history_store = async_get_history_store(hass, entry)
+    history = await history_store.async_load()
+    history_store.data = {
+        key: values for key, values in history.items() if key in data.consumables
+    }
+    data.history_store = history_store
+
+    # Likewise for the consumption of consumables tracked by capacity and the
+    # fits of consumables with a degradation signal
+    meter_store = await _async_load_consumable_store(
+        async_get_meter_store(hass, entry), data, CONF_METER_ENTITY
     )
+    wear_store = await _async_load_consumable_store(
+        async_get_wear_store(hass, entry), data, CONF_WEAR_ENTITY
+    )
+
+    # Index consumables by due date, track the spare parts stock of consumables
+    # with a part number, note template users, bind tags, and follow linked
+    # source sensors, meters and degradation signals
+    due_index = async_get_due_index(hass)
+    inventory = await async_get_inventory(hass)
+    tag_index = async_get_tag_index(hass)
+    for device in devices:
+        for index, consumable in enumerate(device.consumables):
+            key = consumable_key(device.key, index)
+            entry.async_on_unload(
+                due_index.async_register(entry.entry_id, key, consumable)
+            )
+            if consumable.get(CONF_PART_NUMBER):
+                entry.async_on_unload(
+                    inventory.async_register(entry.entry_id, key, consumable)
+                )
+            if template_id := consumable.get(CONF_TEMPLATE):
+                entry.async_on_unload(
+                    templates.async_register(entry.entry_id, key, template_id)
+                )
+            if consumable.get(CONF_TAGS):
+                entry.async_on_unload(
+                    tag_index.async_register(entry.entry_id, key, consumable)
+                )
+            if consumable.get(CONF_SOURCE_ENTITY):
+                source = ConsumableSource(hass, entry.entry_id, key, consumable)
+                entry.async_on_unload(source.async_start())
+            if consumable.get(CONF_METER_ENTITY):
+                meter = ConsumableMeter(hass, key, consumable, meter_store)
+                data.meters[key] = meter
+                entry.async_on_unload(meter.async_start())
+            if consumable.get(CONF_WEAR_ENTITY):
+                wear = ConsumableWear(hass, key, consumable, wear_store)
+                data.wear[key] = wear
+                entry.async_on_unload(wear.async_start())
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # Create devices, and drop any that were removed from a hub
+    device_registry = dr.async_get(hass)
+    device_keys = {device.key for device in devices}
+    for device in devices:
+        device_registry.async_get_or_create(
+            config_entry_id=entry.entry_id,
+            identifiers={(DOMAIN, device.key)},
+            name=device.name,
+            manufacturer=MANUFACTURER,
+            model=MODEL,
+        )
+    for device_entry in dr.async_entries_for_config_entry(
+        device_registry, entry.entry_id
+    ):
+        if not any(
+            domain == DOMAIN and key in device_keys
+            for domain, key in device_entry.identifiers
+        ):
+            device_registry.async_update_device(
+                device_entry.id, remove_config_entry_id=entry.entry_id
+            )
+
+    await hass.config_entries.async_forward_entry_setups(entry, _platforms(entry))
     entry.async_on_unload(entry.add_update_listener(update_listener))
 
     return True
 
 
+async def _async_load_consumable_store(
+    store: ConsumableTrackerStore, data: ConsumableTrackerData, option: str
+) -> ConsumableTrackerStore:
+    """Load a store keyed by consumable, keeping consumables with the option."""
+    stored = await store.async_load()
+    store.data = {
+        key: values
+        for key, values in stored.items()
+        if key in data.consumables and data.consumables[key][1].get(option)
+    }
+    return store
+
+
 async def update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update."""
     await hass.config_entries.async_reload(entry.entry_id)
@@ -39,9 +195,16 @@ async def update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unload_ok = await hass.config_entries.async_unload_platforms(
+        entry, _platforms(entry)
+    )
 
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored consumable definitions of a deleted entry."""
+    await async_remove_store(hass, entry)
@@ -2,24 +2,30 @@
 
 from __future__ import annotations
 
-from datetime import date
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
 
 if TYPE_CHECKING:
+    from collections.abc import MutableMapping
+
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import (
     CONF_CONSUMABLE_NAME,
-    CONF_CONSUMABLES,
-    CONF_DEVICE_NAME,
     DOMAIN,
     MANUFACTURER,
     MODEL,
 )
+from .models import (
+    ConsumableDevice,
+    ConsumableTrackerData,
+    async_replace,
+    async_replace_many,
+    consumable_key,
+)
 
 
 async def async_setup_entry(
@@ -28,11 +34,14 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the button platform."""
-    consumables = entry.data.get(CONF_CONSUMABLES, [])
+    data: ConsumableTrackerData = hass.data[DOMAIN][entry.entry_id]
     entities = []
 
-    for index, consumable in enumerate(consumables):
-        entities.append(ConsumableReplacedButton(entry, consumable, index))
+    for device in data.devices:
+        for index, consumable in enumerate(device.consumables):
+            entities.append(ConsumableReplacedButton(entry, device, consumable, index))
+        if device.consumables:
+            entities.append(DeviceReplacedButton(entry, device))
 
     async_add_entities(entities)
 
@@ -42,16 +51,24 @@ class ConsumableReplacedButton(ButtonEntity):
 
     _attr_icon = "mdi:restore"
     _attr_has_entity_name = True
+    _attr_should_poll = False
 
-    def __init__(self, entry: ConfigEntry, consumable: dict, index: int) -> None:
+    def __init__(
+        self,
+        entry: ConfigEntry,
+        device: ConsumableDevice,
+        consumable: MutableMapping[str, Any],
+        index: int,
+    ) -> None:
         """Initialize the button."""
         self._entry = entry
+        self._device = device
         self._consumable = consumable
         self._index = index
-        self._attr_unique_id = f"{entry.entry_id}_consumable_{index}_replaced"
+        self._attr_unique_id = f"{device.key}_consumable_{index}_replaced"
         self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": entry.data[CONF_DEVICE_NAME],
+            "identifiers": {(DOMAIN, device.key)},
+            "name": device.name,
             "manufacturer": MANUFACTURER,
             "model": MODEL,
         }
@@ -59,13 +76,41 @@ class ConsumableReplacedButton(ButtonEntity):
 
     async def async_press(self) -> None:
         """Handle the button press."""
-        # Find the corresponding date entity and set it to today
-        date_id = f"{self._entry.entry_id}_consumable_{self._index}_last_replaced"
-
-        # Get all date entities
-        entity_component = self.hass.data.get("entity_components", {}).get("date")
-        if entity_component:
-            for entity in entity_component.entities:
-                if hasattr(entity, "unique_id") and entity.unique_id == date_id:
-                    await entity.async_set_value(date.today())
-                    break
+        await async_replace(
+            self.hass,
+            self._entry.entry_id,
+            consumable_key(self._device.key, self._index),
+            self._consumable,
+        )
+
+
+class DeviceReplacedButton(ButtonEntity):
+    """Button to mark every consumable of a device as replaced at once."""
+
+    _attr_icon = "mdi:restore-alert"
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    _attr_name = "Mark all as replaced"
+
+    def __init__(self, entry: ConfigEntry, device: ConsumableDevice) -> None:
+        """Initialize the button."""
+        self._entry = entry
+        self._device = device
+        self._attr_unique_id = f"{device.key}_replaced_all"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, device.key)},
+            "name": device.name,
+            "manufacturer": MANUFACTURER,
+            "model": MODEL,
+        }
+
+    async def async_press(self) -> None:
+        """Handle the button press."""
+        async_replace_many(
+            self.hass,
+            self._entry.entry_id,
+            [
+                consumable_key(self._device.key, index)
+                for index in range(len(self._device.consumables))
+            ],
+        )
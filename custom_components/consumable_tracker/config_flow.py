@@ -2,55 +2,251 @@
 
 from __future__ import annotations
 
+import csv
+import uuid
 from typing import TYPE_CHECKING
 
 import voluptuous as vol
+import yaml
 from homeassistant import config_entries
 from homeassistant.core import callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers import selector
+from voluptuous.humanize import humanize_error
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
     from typing import Any
 
-    from homeassistant.config_entries import ConfigFlowResult
+    from homeassistant.config_entries import ConfigEntry, ConfigFlowResult
+    from homeassistant.core import HomeAssistant
+
+    from .templates import ConsumableTemplates
 
 from .const import (
+    CONF_BULK_ADD,
+    CONF_CAPACITY,
     CONF_CONSUMABLE_NAME,
     CONF_CONSUMABLES,
+    CONF_COST,
     CONF_DEVICE_NAME,
+    CONF_DEVICE_UID,
+    CONF_DEVICES,
+    CONF_HUB,
     CONF_ICON_NORMAL,
     CONF_ICON_OVERDUE,
     CONF_ICON_WARNING,
     CONF_LIFETIME_DAYS,
+    CONF_LIFETIME_HOURS,
+    CONF_LIGHTWEIGHT,
+    CONF_METER_ENTITY,
+    CONF_PART_NUMBER,
+    CONF_PRESET,
+    CONF_REORDER_POINT,
+    CONF_SEARCH,
+    CONF_SOURCE_ENTITY,
+    CONF_TAGS,
+    CONF_TEMPLATE,
+    CONF_USE_CATALOG,
     CONF_WARNING_DAYS,
+    CONF_WARNING_HOURS,
+    CONF_WEAR_ENTITY,
+    CONF_WEAR_THRESHOLD,
     DEFAULT_ICON_NORMAL,
     DEFAULT_ICON_OVERDUE,
     DEFAULT_ICON_WARNING,
     DEFAULT_LIFETIME_DAYS,
+    DEFAULT_REORDER_POINT,
     DEFAULT_WARNING_DAYS,
     DOMAIN,
 )
+from .models import build_consumable, consumable_key, entry_devices, is_hub, uses_hours
+from .presets import ATTR_CATEGORY, ATTR_PRESET_ID, async_get_preset_catalog
+from .store import (
+    async_load_definitions,
+    async_move_consumable_data,
+    async_save_definitions,
+)
+from .templates import async_get_templates
 
+# Sensors reporting a consumable's remaining life as a percentage, the total
+# consumption of a consumable tracked by capacity, or a degradation signal
+SENSOR_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(domain="sensor")
+)
+# IDs of the NFC tags that mark a consumable as replaced when scanned
+TAGS_SELECTOR = selector.TextSelector(selector.TextSelectorConfig(multiple=True))
+BULK_SELECTOR = selector.TextSelector(selector.TextSelectorConfig(multiline=True))
 
-def _build_consumable_dict(user_input: dict) -> dict:
-    """Build a consumable dictionary from user input."""
-    return {
-        CONF_CONSUMABLE_NAME: user_input[CONF_CONSUMABLE_NAME],
-        CONF_LIFETIME_DAYS: user_input[CONF_LIFETIME_DAYS],
-        CONF_WARNING_DAYS: user_input[CONF_WARNING_DAYS],
-        CONF_ICON_NORMAL: user_input.get(CONF_ICON_NORMAL, DEFAULT_ICON_NORMAL),
-        CONF_ICON_WARNING: user_input.get(CONF_ICON_WARNING, DEFAULT_ICON_WARNING),
-        CONF_ICON_OVERDUE: user_input.get(CONF_ICON_OVERDUE, DEFAULT_ICON_OVERDUE),
+# Consumables listed per page of the options flow
+PAGE_SIZE = 20
+
+# Columns of a bulk table, in order
+BULK_COLUMNS = (
+    CONF_CONSUMABLE_NAME,
+    CONF_LIFETIME_DAYS,
+    CONF_WARNING_DAYS,
+    CONF_COST,
+    CONF_PART_NUMBER,
+)
+# A consumable entered in bulk, with the ranges of the add consumable form
+BULK_ROW_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_CONSUMABLE_NAME): vol.All(cv.string, vol.Length(min=1)),
+        vol.Required(CONF_LIFETIME_DAYS, default=DEFAULT_LIFETIME_DAYS): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=730)
+        ),
+        vol.Required(CONF_WARNING_DAYS, default=DEFAULT_WARNING_DAYS): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=365)
+        ),
+        vol.Optional(CONF_LIFETIME_HOURS): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=8760)
+        ),
+        vol.Optional(CONF_WARNING_HOURS): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=8759)
+        ),
+        vol.Optional(CONF_COST): vol.All(vol.Coerce(float), vol.Range(min=0)),
+        vol.Optional(CONF_PART_NUMBER): cv.string,
+        vol.Optional(CONF_REORDER_POINT): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=100)
+        ),
+        vol.Optional(CONF_ICON_NORMAL): cv.string,
+        vol.Optional(CONF_ICON_WARNING): cv.string,
+        vol.Optional(CONF_ICON_OVERDUE): cv.string,
     }
+)
+
+
+def _preset_choices(matches: list[dict[str, Any]]) -> dict[str, str]:
+    """Return the labels of matching presets by ID."""
+    choices = {}
+    for preset in matches:
+        name, category = preset[CONF_CONSUMABLE_NAME], preset[ATTR_CATEGORY]
+        choices[preset[ATTR_PRESET_ID]] = f"{name} ({category})"
+    return choices
+
+
+def _parse_bulk(text: str) -> tuple[list[dict[str, Any]], list[str]]:
+    """Parse consumables entered in bulk, with an error per invalid row.
+
+    The text is either a YAML list of consumables or a table with a row per
+    consumable and the columns in BULK_COLUMNS, of which only the name is
+    required. Comments and blank lines are skipped in both. The YAML is loaded
+    as plain data, without Home Assistant's tags such as !include or !secret.
+    """
+    lines = [
+        line
+        for line in text.splitlines()
+        if line.strip() and not line.lstrip().startswith("#")
+    ]
+    table = not lines or not lines[0].lstrip().startswith("-")
+    rows: list[Any]
+    if table:
+        rows = list(csv.reader(lines, skipinitialspace=True))
+    else:
+        try:
+            parsed = yaml.safe_load(text)
+        except yaml.YAMLError as err:
+            return [], [f"Invalid YAML: {err}"]
+        rows = parsed if isinstance(parsed, list) else [parsed]
+
+    consumables: list[dict[str, Any]] = []
+    errors: list[str] = []
+    for number, row in enumerate(rows, start=1):
+        if table:
+            if len(row) > len(BULK_COLUMNS):
+                errors.append(
+                    f"Row {number}: too many columns, expected at most "
+                    f"{len(BULK_COLUMNS)}"
+                )
+                continue
+            row = {
+                column: cell
+                for column, cell in zip(BULK_COLUMNS, row, strict=False)
+                if cell.strip()
+            }
+        try:
+            validated = BULK_ROW_SCHEMA(row)
+        except vol.Invalid as err:
+            errors.append(f"Row {number}: {humanize_error(row, err)}")
+            continue
+        if row_errors := _validate_consumable_input(validated):
+            errors.extend(
+                f"Row {number}: {field} {error.replace('_', ' ')}"
+                for field, error in row_errors.items()
+            )
+            continue
+        consumables.append(build_consumable(validated))
+    if not rows:
+        errors.append("No consumables entered")
+    return consumables, errors
+
+
+def _bulk_schema(user_input: dict[str, Any] | None) -> vol.Schema:
+    """Return the schema of a bulk add form, keeping the entered text."""
+    text = user_input[CONF_CONSUMABLES] if user_input is not None else None
+    return vol.Schema(
+        {
+            vol.Required(
+                CONF_CONSUMABLES, description={"suggested_value": text}
+            ): BULK_SELECTOR
+        }
+    )
 
 
 def _validate_consumable_input(user_input: dict) -> dict[str, str]:
     """Validate consumable input and return errors dict."""
     errors: dict[str, str] = {}
-    if user_input[CONF_WARNING_DAYS] >= user_input[CONF_LIFETIME_DAYS]:
+    if lifetime_hours := user_input.get(CONF_LIFETIME_HOURS):
+        if user_input.get(CONF_WARNING_HOURS, 0) >= lifetime_hours:
+            errors[CONF_WARNING_HOURS] = "warning_exceeds_lifetime"
+    elif user_input[CONF_WARNING_DAYS] >= user_input[CONF_LIFETIME_DAYS]:
         errors[CONF_WARNING_DAYS] = "warning_exceeds_lifetime"
+    if user_input.get(CONF_METER_ENTITY) and not user_input.get(CONF_CAPACITY):
+        errors[CONF_CAPACITY] = "capacity_required"
+    if user_input.get(CONF_WEAR_ENTITY) and user_input.get(CONF_WEAR_THRESHOLD) is None:
+        errors[CONF_WEAR_THRESHOLD] = "wear_threshold_required"
     return errors
 
 
+async def _async_move_consumables(
+    hass: HomeAssistant, entry: ConfigEntry, moves: dict[str, str | None]
+) -> None:
+    """Move the entities and data of consumables whose keys changed.
+
+    Keys are indexes within a device, so deleting a consumable shifts the keys
+    of those after it. Entities of deleted consumables, moved to None, are
+    removed. Moves must be in increasing index order, so each key is free by
+    the time a consumable moves into it.
+    """
+    if not moves:
+        return
+    registry = er.async_get(hass)
+    entities = er.async_entries_for_config_entry(registry, entry.entry_id)
+
+    def consumable_entities(key: str) -> list[er.RegistryEntry]:
+        """Return the entities of a consumable."""
+        return [
+            entity
+            for entity in entities
+            if entity.unique_id == key or entity.unique_id.startswith(f"{key}_")
+        ]
+
+    for key, new_key in moves.items():
+        if new_key is None:
+            for entity in consumable_entities(key):
+                registry.async_remove(entity.entity_id)
+    for key, new_key in moves.items():
+        if new_key is not None:
+            for entity in consumable_entities(key):
+                registry.async_update_entity(
+                    entity.entity_id,
+                    new_unique_id=new_key + entity.unique_id.removeprefix(key),
+                )
+    await async_move_consumable_data(hass, entry, moves)
+
+
 class ConsumableTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Consumable Tracker."""
 
@@ -59,7 +255,13 @@ class ConsumableTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     def __init__(self) -> None:
         """Initialize the config flow."""
         self.device_name: str | None = None
+        self.lightweight = False
+        self.use_catalog = False
+        self.bulk_add = False
         self.consumables: list[dict[str, object]] = []
+        # Fields filled in from the catalog preset picked for the next consumable
+        self._preset: dict[str, Any] = {}
+        self._preset_matches: list[dict[str, Any]] = []
 
     async def async_step_user(
         self,
@@ -70,11 +272,30 @@ class ConsumableTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             self.device_name = user_input[CONF_DEVICE_NAME]
-            return await self.async_step_add_consumable()
+            self.lightweight = user_input.get(CONF_LIGHTWEIGHT, False)
+            self.use_catalog = user_input.get(CONF_USE_CATALOG, False)
+            self.bulk_add = user_input.get(CONF_BULK_ADD, False)
+            if user_input.get(CONF_HUB):
+                # Hubs start empty; devices are added from the options flow
+                await self.async_set_unique_id(self.device_name)
+                self._abort_if_unique_id_configured()
+                return self.async_create_entry(
+                    title=self.device_name,
+                    data={
+                        CONF_DEVICE_NAME: self.device_name,
+                        CONF_DEVICES: [],
+                        CONF_LIGHTWEIGHT: self.lightweight,
+                    },
+                )
+            return await self._async_step_next_consumable()
 
         data_schema = vol.Schema(
             {
                 vol.Required(CONF_DEVICE_NAME): str,
+                vol.Optional(CONF_HUB, default=False): bool,
+                vol.Optional(CONF_LIGHTWEIGHT, default=False): bool,
+                vol.Optional(CONF_USE_CATALOG, default=False): bool,
+                vol.Optional(CONF_BULK_ADD, default=False): bool,
             }
         )
 
@@ -98,37 +319,63 @@ class ConsumableTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             errors = _validate_consumable_input(user_input)
 
             if not errors:
-                self.consumables.append(_build_consumable_dict(user_input))
+                self.consumables.append(build_consumable(user_input))
+                self._preset = {}
 
                 if user_input.get("add_another"):
                     # Show form again for next consumable
-                    return await self.async_step_add_consumable()
+                    return await self._async_step_next_consumable()
 
-                # Create the entry
-                assert self.device_name is not None
-                await self.async_set_unique_id(self.device_name)
-                self._abort_if_unique_id_configured()
-
-                return self.async_create_entry(
-                    title=self.device_name,
-                    data={
-                        CONF_DEVICE_NAME: self.device_name,
-                        CONF_CONSUMABLES: self.consumables,
-                    },
-                )
+                return await self._async_create_device_entry()
 
+        preset = self._preset
         data_schema = vol.Schema(
             {
-                vol.Required(CONF_CONSUMABLE_NAME): str,
                 vol.Required(
-                    CONF_LIFETIME_DAYS, default=DEFAULT_LIFETIME_DAYS
+                    CONF_CONSUMABLE_NAME,
+                    description={"suggested_value": preset.get(CONF_CONSUMABLE_NAME)},
+                ): str,
+                vol.Required(
+                    CONF_LIFETIME_DAYS,
+                    default=preset.get(CONF_LIFETIME_DAYS, DEFAULT_LIFETIME_DAYS),
                 ): vol.All(vol.Coerce(int), vol.Range(min=1, max=730)),
-                vol.Required(CONF_WARNING_DAYS, default=DEFAULT_WARNING_DAYS): vol.All(
-                    vol.Coerce(int), vol.Range(min=0, max=365)
+                vol.Required(
+                    CONF_WARNING_DAYS,
+                    default=preset.get(CONF_WARNING_DAYS, DEFAULT_WARNING_DAYS),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=365)),
+                vol.Optional(
+                    CONF_LIFETIME_HOURS,
+                    description={"suggested_value": preset.get(CONF_LIFETIME_HOURS)},
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=8760)),
+                vol.Optional(
+                    CONF_WARNING_HOURS,
+                    description={"suggested_value": preset.get(CONF_WARNING_HOURS)},
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=8759)),
+                vol.Optional(CONF_COST): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                vol.Optional(CONF_PART_NUMBER): str,
+                vol.Optional(
+                    CONF_REORDER_POINT, default=DEFAULT_REORDER_POINT
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
+                vol.Optional(CONF_SOURCE_ENTITY): SENSOR_SELECTOR,
+                vol.Optional(CONF_METER_ENTITY): SENSOR_SELECTOR,
+                vol.Optional(CONF_CAPACITY): vol.All(
+                    vol.Coerce(float), vol.Range(min=0, min_included=False)
                 ),
-                vol.Optional(CONF_ICON_NORMAL, default=DEFAULT_ICON_NORMAL): str,
-                vol.Optional(CONF_ICON_WARNING, default=DEFAULT_ICON_WARNING): str,
-                vol.Optional(CONF_ICON_OVERDUE, default=DEFAULT_ICON_OVERDUE): str,
+                vol.Optional(CONF_WEAR_ENTITY): SENSOR_SELECTOR,
+                vol.Optional(CONF_WEAR_THRESHOLD): vol.Coerce(float),
+                vol.Optional(CONF_TAGS): TAGS_SELECTOR,
+                vol.Optional(
+                    CONF_ICON_NORMAL,
+                    default=preset.get(CONF_ICON_NORMAL, DEFAULT_ICON_NORMAL),
+                ): str,
+                vol.Optional(
+                    CONF_ICON_WARNING,
+                    default=preset.get(CONF_ICON_WARNING, DEFAULT_ICON_WARNING),
+                ): str,
+                vol.Optional(
+                    CONF_ICON_OVERDUE,
+                    default=preset.get(CONF_ICON_OVERDUE, DEFAULT_ICON_OVERDUE),
+                ): str,
                 vol.Required("add_another", default=False): bool,
             }
         )
@@ -145,6 +392,95 @@ class ConsumableTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             description_placeholders={"description": description},
         )
 
+    async def _async_create_device_entry(self) -> ConfigFlowResult:
+        """Create the entry of a device with the consumables added."""
+        assert self.device_name is not None
+        await self.async_set_unique_id(self.device_name)
+        self._abort_if_unique_id_configured()
+
+        return self.async_create_entry(
+            title=self.device_name,
+            data={
+                CONF_DEVICE_NAME: self.device_name,
+                CONF_CONSUMABLES: self.consumables,
+                CONF_LIGHTWEIGHT: self.lightweight,
+            },
+        )
+
+    async def async_step_bulk_add(
+        self,
+        user_input: dict[str, Any] | None = None,
+    ) -> ConfigFlowResult:
+        """Add every consumable of the device in one submission."""
+        errors: dict[str, str] = {}
+        row_errors: list[str] = []
+
+        if user_input is not None:
+            consumables, row_errors = _parse_bulk(user_input[CONF_CONSUMABLES])
+            if not row_errors:
+                self.consumables.extend(consumables)
+                return await self._async_create_device_entry()
+            errors["base"] = "invalid_rows"
+
+        return self.async_show_form(
+            step_id="bulk_add",
+            data_schema=_bulk_schema(user_input),
+            errors=errors,
+            description_placeholders={"row_errors": "\n".join(row_errors)},
+        )
+
+    async def _async_step_next_consumable(self) -> ConfigFlowResult:
+        """Add the next consumable, from the catalog if asked for."""
+        if self.bulk_add:
+            return await self.async_step_bulk_add()
+        if self.use_catalog:
+            return await self.async_step_search_presets()
+        return await self.async_step_add_consumable()
+
+    async def async_step_search_presets(
+        self,
+        user_input: dict[str, Any] | None = None,
+    ) -> ConfigFlowResult:
+        """Search the catalog of common consumables."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            if not (query := user_input.get(CONF_SEARCH, "").strip()):
+                # Nothing to look up; fill in the consumable by hand
+                return await self.async_step_add_consumable()
+            catalog = await async_get_preset_catalog(self.hass)
+            self._preset_matches = catalog.search(query)
+            if self._preset_matches:
+                return await self.async_step_pick_preset()
+            errors[CONF_SEARCH] = "no_presets"
+
+        return self.async_show_form(
+            step_id="search_presets",
+            data_schema=vol.Schema({vol.Optional(CONF_SEARCH): str}),
+            errors=errors,
+        )
+
+    async def async_step_pick_preset(
+        self,
+        user_input: dict[str, Any] | None = None,
+    ) -> ConfigFlowResult:
+        """Pick one of the presets matching the search."""
+        if user_input is not None:
+            catalog = await async_get_preset_catalog(self.hass)
+            self._preset = catalog.definition(user_input[CONF_PRESET])
+            return await self.async_step_add_consumable()
+
+        return self.async_show_form(
+            step_id="pick_preset",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_PRESET): vol.In(
+                        _preset_choices(self._preset_matches)
+                    )
+                }
+            ),
+        )
+
     @staticmethod
     @callback
     def async_get_options_flow(
@@ -160,41 +496,167 @@ class ConsumableTrackerOptionsFlow(config_entries.OptionsFlow):
     def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
         """Initialize options flow."""
         self._config_entry = config_entry
-        self.consumables: list[dict[str, object]] = list(
-            config_entry.data.get(CONF_CONSUMABLES, [])
-        )
+        self.consumables: list[dict[str, object]] = []
         self.editing_index: int | None = None
+        self._hub = False
+        self.devices: list[dict[str, Any]] = []
+        self.device_index: int | None = None
+        self._templates: ConsumableTemplates | None = None
+        self._preset: dict[str, Any] = {}
+        self._preset_matches: list[dict[str, Any]] = []
+        # Search and page narrowing the consumables listed and offered
+        self._filter = ""
+        self._page = 0
+        self._loaded = False
+        # Current index of each stored consumable by device, None once deleted
+        self._positions: dict[str, list[int | None]] = {}
+
+    async def _async_load(self) -> None:
+        """Load the entry's consumable definitions from its store."""
+        definitions = await async_load_definitions(self.hass, self._config_entry)
+        self._hub = is_hub(definitions)
+        self.consumables = list(definitions.get(CONF_CONSUMABLES, []))
+        self.devices = list(definitions.get(CONF_DEVICES, []))
+        self._positions = {
+            device.key: [*range(len(device.consumables))]
+            for device in entry_devices(self._config_entry, definitions)
+        }
+        self._templates = await async_get_templates(self.hass)
+        self._loaded = True
+
+    def _device_key(self) -> str:
+        """Return the key of the device whose consumables are managed."""
+        if self.device_index is None:
+            return self._config_entry.entry_id
+        uid = self.devices[self.device_index][CONF_DEVICE_UID]
+        return f"{self._config_entry.entry_id}_{uid}"
+
+    async def _async_save(self, definitions: dict[str, Any]) -> None:
+        """Save the definitions, moving consumables whose keys changed first."""
+        await _async_move_consumables(
+            self.hass,
+            self._config_entry,
+            {
+                consumable_key(device_key, index): None
+                if position is None
+                else consumable_key(device_key, position)
+                for device_key, positions in self._positions.items()
+                for index, position in enumerate(positions)
+                if position != index
+            },
+        )
+        await async_save_definitions(self.hass, self._config_entry, definitions)
+
+    def _resolve(self, consumable: dict[str, Any]) -> Mapping[str, Any]:
+        """Return a consumable with the fields of its template filled in."""
+        assert self._templates is not None
+        return self._templates.resolve(consumable)
+
+    def _matching(self) -> list[int]:
+        """Return the indexes of the consumables matching the search."""
+        search = self._filter.casefold()
+        return [
+            index
+            for index, consumable in enumerate(self.consumables)
+            if search in self._resolve(consumable)[CONF_CONSUMABLE_NAME].casefold()
+        ]
+
+    def _page_of(self, matching: list[int]) -> list[int]:
+        """Return the indexes of the consumables on the current page."""
+        # Deleting the last consumables of the last page moves back a page
+        self._page = min(self._page, max(len(matching) - 1, 0) // PAGE_SIZE)
+        start = self._page * PAGE_SIZE
+        return matching[start : start + PAGE_SIZE]
+
+    def _consumable_names(self) -> dict[str, str]:
+        """Return the name of each consumable on the current page by index."""
+        return {
+            str(index): self._resolve(self.consumables[index])[CONF_CONSUMABLE_NAME]
+            for index in self._page_of(self._matching())
+        }
 
     async def async_step_init(
         self,
         user_input: dict[str, Any] | None = None,
     ) -> ConfigFlowResult:
         """Manage the options - choose what to do."""
+        if not self._loaded:
+            await self._async_load()
+
+        if self._hub and self.device_index is None:
+            return await self.async_step_devices()
+
         if user_input is not None:
             action = user_input.get("action")
             if action == "add":
                 return await self.async_step_add_consumable()
+            elif action == "add_preset":
+                return await self.async_step_search_presets()
+            elif action == "bulk_add":
+                return await self.async_step_bulk_add()
+            elif action == "add_template":
+                return await self.async_step_add_from_template()
             elif action == "edit":
                 return await self.async_step_select_consumable()
+            elif action == "edit_many":
+                return await self.async_step_edit_many()
             elif action == "delete":
                 return await self.async_step_delete_consumable()
+            elif action == "search":
+                return await self.async_step_search_consumables()
+            elif action == "next_page":
+                self._page += 1
+            elif action == "previous_page":
+                self._page -= 1
+            elif action == "done" and self.device_index is not None:
+                # Back to the hub's devices
+                self.devices[self.device_index] = {
+                    **self.devices[self.device_index],
+                    CONF_CONSUMABLES: self.consumables,
+                }
+                self.device_index = None
+                self._filter = ""
+                self._page = 0
+                return await self.async_step_devices()
             elif action == "done":
-                # Save and finish
-                self.hass.config_entries.async_update_entry(
-                    self._config_entry,
-                    data={
-                        CONF_DEVICE_NAME: self._config_entry.data[CONF_DEVICE_NAME],
-                        CONF_CONSUMABLES: self.consumables,
-                    },
-                )
+                # Save every change of the flow in a single write
+                await self._async_save({CONF_CONSUMABLES: self.consumables})
                 return self.async_create_entry(title="", data={})
 
+        # Only the current page is rendered, however many consumables there are
+        matching = self._matching()
+        page = self._page_of(matching)
         consumable_list = "\n".join(
             [
                 f"- {c[CONF_CONSUMABLE_NAME]} ({c[CONF_LIFETIME_DAYS]} days)"
-                for c in self.consumables
+                for c in (self._resolve(self.consumables[index]) for index in page)
             ]
         )
+        if len(matching) > len(page) or self._filter:
+            start = self._page * PAGE_SIZE
+            consumable_list += (
+                f"\n\nShowing {start + 1 if page else 0}-{start + len(page)}"
+                f" of {len(matching)}"
+            )
+            if self._filter:
+                consumable_list += f" matching '{self._filter}'"
+
+        assert self._templates is not None
+        actions = {
+            "add": "Add new consumable",
+            "add_preset": "Add consumable from the catalog",
+            "bulk_add": "Add many consumables at once",
+        }
+        if self._templates.names():
+            actions["add_template"] = "Add consumable from a template"
+        actions["edit"] = "Edit existing consumable"
+        actions["edit_many"] = "Edit several consumables at once"
+        actions["delete"] = "Delete consumables"
+        actions["search"] = "Search consumables"
+        if self._page > 0:
+            actions["previous_page"] = "Previous page"
+        if (self._page + 1) * PAGE_SIZE < len(matching):
+            actions["next_page"] = "Next page"
 
         return self.async_show_form(
             step_id="init",
@@ -202,10 +664,10 @@ class ConsumableTrackerOptionsFlow(config_entries.OptionsFlow):
                 {
                     vol.Required("action"): vol.In(
                         {
-                            "add": "Add new consumable",
-                            "edit": "Edit existing consumable",
-                            "delete": "Delete consumable",
-                            "done": "Save and finish",
+                            **actions,
+                            "done": "Back to devices"
+                            if self.device_index is not None
+                            else "Save and finish",
                         }
                     )
                 }
@@ -217,6 +679,107 @@ class ConsumableTrackerOptionsFlow(config_entries.OptionsFlow):
             },
         )
 
+    async def async_step_devices(
+        self,
+        user_input: dict[str, Any] | None = None,
+    ) -> ConfigFlowResult:
+        """Manage the devices of a hub."""
+        if user_input is not None:
+            action = user_input.get("action")
+            if action == "add_device":
+                return await self.async_step_add_device()
+            elif action == "edit_device":
+                return await self.async_step_select_device()
+            elif action == "delete_device":
+                return await self.async_step_delete_device()
+            elif action == "done":
+                # Save every device in a single store write
+                await self._async_save({CONF_DEVICES: self.devices})
+                return self.async_create_entry(title="", data={})
+
+        device_list = "\n".join(
+            [
+                f"- {d[CONF_DEVICE_NAME]} ({len(d.get(CONF_CONSUMABLES, []))} consumables)"
+                for d in self.devices
+            ]
+        )
+
+        return self.async_show_form(
+            step_id="devices",
+            data_schema=vol.Schema(
+                {
+                    vol.Required("action"): vol.In(
+                        {
+                            "add_device": "Add new device",
+                            "edit_device": "Manage a device's consumables",
+                            "delete_device": "Delete device",
+                            "done": "Save and finish",
+                        }
+                    )
+                }
+            ),
+            description_placeholders={
+                "devices": device_list if device_list else "No devices yet"
+            },
+        )
+
+    async def async_step_add_device(
+        self,
+        user_input: dict[str, Any] | None = None,
+    ) -> ConfigFlowResult:
+        """Add a device to a hub."""
+        if user_input is not None:
+            self.devices.append(
+                {
+                    CONF_DEVICE_UID: uuid.uuid4().hex,
+                    CONF_DEVICE_NAME: user_input[CONF_DEVICE_NAME],
+                    CONF_CONSUMABLES: [],
+                }
+            )
+            self.device_index = len(self.devices) - 1
+            self.consumables = []
+            return await self.async_step_init()
+
+        return self.async_show_form(
+            step_id="add_device",
+            data_schema=vol.Schema({vol.Required(CONF_DEVICE_NAME): str}),
+        )
+
+    async def async_step_select_device(
+        self,
+        user_input: dict[str, Any] | None = None,
+    ) -> ConfigFlowResult:
+        """Select which hub device to manage."""
+        if user_input is not None:
+            self.device_index = int(user_input["device"])
+            self.consumables = list(
+                self.devices[self.device_index].get(CONF_CONSUMABLES, [])
+            )
+            return await self.async_step_init()
+
+        choices = {str(i): d[CONF_DEVICE_NAME] for i, d in enumerate(self.devices)}
+
+        return self.async_show_form(
+            step_id="select_device",
+            data_schema=vol.Schema({vol.Required("device"): vol.In(choices)}),
+        )
+
+    async def async_step_delete_device(
+        self,
+        user_input: dict[str, Any] | None = None,
+    ) -> ConfigFlowResult:
+        """Delete a device from a hub."""
+        if user_input is not None:
+            self.devices.pop(int(user_input["device"]))
+            return await self.async_step_devices()
+
+        choices = {str(i): d[CONF_DEVICE_NAME] for i, d in enumerate(self.devices)}
+
+        return self.async_show_form(
+            step_id="delete_device",
+            data_schema=vol.Schema({vol.Required("device"): vol.In(choices)}),
+        )
+
     async def async_step_add_consumable(
         self,
         user_input: dict[str, Any] | None = None,
@@ -228,21 +791,58 @@ class ConsumableTrackerOptionsFlow(config_entries.OptionsFlow):
             errors = _validate_consumable_input(user_input)
 
             if not errors:
-                self.consumables.append(_build_consumable_dict(user_input))
+                self.consumables.append(build_consumable(user_input))
+                self._preset = {}
                 return await self.async_step_init()
 
+        preset = self._preset
         data_schema = vol.Schema(
             {
-                vol.Required(CONF_CONSUMABLE_NAME): str,
                 vol.Required(
-                    CONF_LIFETIME_DAYS, default=DEFAULT_LIFETIME_DAYS
+                    CONF_CONSUMABLE_NAME,
+                    description={"suggested_value": preset.get(CONF_CONSUMABLE_NAME)},
+                ): str,
+                vol.Required(
+                    CONF_LIFETIME_DAYS,
+                    default=preset.get(CONF_LIFETIME_DAYS, DEFAULT_LIFETIME_DAYS),
                 ): vol.All(vol.Coerce(int), vol.Range(min=1, max=730)),
-                vol.Required(CONF_WARNING_DAYS, default=DEFAULT_WARNING_DAYS): vol.All(
-                    vol.Coerce(int), vol.Range(min=0, max=365)
+                vol.Required(
+                    CONF_WARNING_DAYS,
+                    default=preset.get(CONF_WARNING_DAYS, DEFAULT_WARNING_DAYS),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=365)),
+                vol.Optional(
+                    CONF_LIFETIME_HOURS,
+                    description={"suggested_value": preset.get(CONF_LIFETIME_HOURS)},
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=8760)),
+                vol.Optional(
+                    CONF_WARNING_HOURS,
+                    description={"suggested_value": preset.get(CONF_WARNING_HOURS)},
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=8759)),
+                vol.Optional(CONF_COST): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                vol.Optional(CONF_PART_NUMBER): str,
+                vol.Optional(
+                    CONF_REORDER_POINT, default=DEFAULT_REORDER_POINT
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
+                vol.Optional(CONF_SOURCE_ENTITY): SENSOR_SELECTOR,
+                vol.Optional(CONF_METER_ENTITY): SENSOR_SELECTOR,
+                vol.Optional(CONF_CAPACITY): vol.All(
+                    vol.Coerce(float), vol.Range(min=0, min_included=False)
                 ),
-                vol.Optional(CONF_ICON_NORMAL, default=DEFAULT_ICON_NORMAL): str,
-                vol.Optional(CONF_ICON_WARNING, default=DEFAULT_ICON_WARNING): str,
-                vol.Optional(CONF_ICON_OVERDUE, default=DEFAULT_ICON_OVERDUE): str,
+                vol.Optional(CONF_WEAR_ENTITY): SENSOR_SELECTOR,
+                vol.Optional(CONF_WEAR_THRESHOLD): vol.Coerce(float),
+                vol.Optional(CONF_TAGS): TAGS_SELECTOR,
+                vol.Optional(
+                    CONF_ICON_NORMAL,
+                    default=preset.get(CONF_ICON_NORMAL, DEFAULT_ICON_NORMAL),
+                ): str,
+                vol.Optional(
+                    CONF_ICON_WARNING,
+                    default=preset.get(CONF_ICON_WARNING, DEFAULT_ICON_WARNING),
+                ): str,
+                vol.Optional(
+                    CONF_ICON_OVERDUE,
+                    default=preset.get(CONF_ICON_OVERDUE, DEFAULT_ICON_OVERDUE),
+                ): str,
             }
         )
 
@@ -250,6 +850,89 @@ class ConsumableTrackerOptionsFlow(config_entries.OptionsFlow):
             step_id="add_consumable", data_schema=data_schema, errors=errors
         )
 
+    async def async_step_search_presets(
+        self,
+        user_input: dict[str, Any] | None = None,
+    ) -> ConfigFlowResult:
+        """Search the catalog of common consumables."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            if not (query := user_input.get(CONF_SEARCH, "").strip()):
+                # Nothing to look up; fill in the consumable by hand
+                return await self.async_step_add_consumable()
+            catalog = await async_get_preset_catalog(self.hass)
+            self._preset_matches = catalog.search(query)
+            if self._preset_matches:
+                return await self.async_step_pick_preset()
+            errors[CONF_SEARCH] = "no_presets"
+
+        return self.async_show_form(
+            step_id="search_presets",
+            data_schema=vol.Schema({vol.Optional(CONF_SEARCH): str}),
+            errors=errors,
+        )
+
+    async def async_step_pick_preset(
+        self,
+        user_input: dict[str, Any] | None = None,
+    ) -> ConfigFlowResult:
+        """Pick one of the presets matching the search."""
+        if user_input is not None:
+            catalog = await async_get_preset_catalog(self.hass)
+            self._preset = catalog.definition(user_input[CONF_PRESET])
+            return await self.async_step_add_consumable()
+
+        return self.async_show_form(
+            step_id="pick_preset",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_PRESET): vol.In(
+                        _preset_choices(self._preset_matches)
+                    )
+                }
+            ),
+        )
+
+    async def async_step_bulk_add(
+        self,
+        user_input: dict[str, Any] | None = None,
+    ) -> ConfigFlowResult:
+        """Add many consumables in one submission."""
+        errors: dict[str, str] = {}
+        row_errors: list[str] = []
+
+        if user_input is not None:
+            consumables, row_errors = _parse_bulk(user_input[CONF_CONSUMABLES])
+            if not row_errors:
+                self.consumables.extend(consumables)
+                return await self.async_step_init()
+            errors["base"] = "invalid_rows"
+
+        return self.async_show_form(
+            step_id="bulk_add",
+            data_schema=_bulk_schema(user_input),
+            errors=errors,
+            description_placeholders={"row_errors": "\n".join(row_errors)},
+        )
+
+    async def async_step_add_from_template(
+        self,
+        user_input: dict[str, Any] | None = None,
+    ) -> ConfigFlowResult:
+        """Add a consumable that refers to a shared template."""
+        assert self._templates is not None
+        if user_input is not None:
+            self.consumables.append({CONF_TEMPLATE: user_input[CONF_TEMPLATE]})
+            return await self.async_step_init()
+
+        return self.async_show_form(
+            step_id="add_from_template",
+            data_schema=vol.Schema(
+                {vol.Required(CONF_TEMPLATE): vol.In(self._templates.names())}
+            ),
+        )
+
     async def async_step_select_consumable(
         self,
         user_input: dict[str, Any] | None = None,
@@ -259,9 +942,7 @@ class ConsumableTrackerOptionsFlow(config_entries.OptionsFlow):
             self.editing_index = int(user_input["consumable"])
             return await self.async_step_edit_consumable()
 
-        choices = {
-            str(i): c[CONF_CONSUMABLE_NAME] for i, c in enumerate(self.consumables)
-        }
+        choices = self._consumable_names()
 
         return self.async_show_form(
             step_id="select_consumable",
@@ -280,12 +961,24 @@ class ConsumableTrackerOptionsFlow(config_entries.OptionsFlow):
             errors = _validate_consumable_input(user_input)
 
             if not errors:
-                self.consumables[self.editing_index] = _build_consumable_dict(
-                    user_input
-                )
+                consumable = build_consumable(user_input)
+                stored = self.consumables[self.editing_index]
+                if isinstance(template_id := stored.get(CONF_TEMPLATE), str):
+                    # Keep only what differs from the template
+                    assert self._templates is not None
+                    template = self._templates.get(template_id) or {}
+                    consumable = {
+                        CONF_TEMPLATE: template_id,
+                        **{
+                            key: value
+                            for key, value in consumable.items()
+                            if template.get(key) != value
+                        },
+                    }
+                self.consumables[self.editing_index] = consumable
                 return await self.async_step_init()
 
-        consumable = self.consumables[self.editing_index]
+        consumable = self._resolve(self.consumables[self.editing_index])
         data_schema = vol.Schema(
             {
                 vol.Required(
@@ -297,6 +990,54 @@ class ConsumableTrackerOptionsFlow(config_entries.OptionsFlow):
                 vol.Required(
                     CONF_WARNING_DAYS, default=consumable[CONF_WARNING_DAYS]
                 ): vol.All(vol.Coerce(int), vol.Range(min=0, max=365)),
+                vol.Optional(
+                    CONF_LIFETIME_HOURS,
+                    description={
+                        "suggested_value": consumable.get(CONF_LIFETIME_HOURS)
+                    },
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=8760)),
+                vol.Optional(
+                    CONF_WARNING_HOURS,
+                    description={"suggested_value": consumable.get(CONF_WARNING_HOURS)},
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=8759)),
+                vol.Optional(
+                    CONF_COST,
+                    description={"suggested_value": consumable.get(CONF_COST)},
+                ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                vol.Optional(
+                    CONF_PART_NUMBER,
+                    description={"suggested_value": consumable.get(CONF_PART_NUMBER)},
+                ): str,
+                vol.Optional(
+                    CONF_REORDER_POINT,
+                    default=consumable.get(CONF_REORDER_POINT, DEFAULT_REORDER_POINT),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
+                vol.Optional(
+                    CONF_SOURCE_ENTITY,
+                    description={"suggested_value": consumable.get(CONF_SOURCE_ENTITY)},
+                ): SENSOR_SELECTOR,
+                vol.Optional(
+                    CONF_METER_ENTITY,
+                    description={"suggested_value": consumable.get(CONF_METER_ENTITY)},
+                ): SENSOR_SELECTOR,
+                vol.Optional(
+                    CONF_CAPACITY,
+                    description={"suggested_value": consumable.get(CONF_CAPACITY)},
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, min_included=False)),
+                vol.Optional(
+                    CONF_WEAR_ENTITY,
+                    description={"suggested_value": consumable.get(CONF_WEAR_ENTITY)},
+                ): SENSOR_SELECTOR,
+                vol.Optional(
+                    CONF_WEAR_THRESHOLD,
+                    description={
+                        "suggested_value": consumable.get(CONF_WEAR_THRESHOLD)
+                    },
+                ): vol.Coerce(float),
+                vol.Optional(
+                    CONF_TAGS,
+                    description={"suggested_value": consumable.get(CONF_TAGS)},
+                ): TAGS_SELECTOR,
                 vol.Optional(
                     CONF_ICON_NORMAL,
                     default=consumable.get(CONF_ICON_NORMAL, DEFAULT_ICON_NORMAL),
@@ -320,17 +1061,99 @@ class ConsumableTrackerOptionsFlow(config_entries.OptionsFlow):
         self,
         user_input: dict[str, Any] | None = None,
     ) -> ConfigFlowResult:
-        """Delete a consumable."""
+        """Delete the selected consumables."""
         if user_input is not None:
-            index = int(user_input["consumable"])
-            self.consumables.pop(index)
+            selected = {int(index) for index in user_input[CONF_CONSUMABLES]}
+            # Consumables added in the flow come last, so deleting them moves
+            # no stored consumable
+            device_key = self._device_key()
+            self._positions[device_key] = [
+                None
+                if position is None or position in selected
+                else position - sum(index < position for index in selected)
+                for position in self._positions.get(device_key, [])
+            ]
+            self.consumables = [
+                consumable
+                for index, consumable in enumerate(self.consumables)
+                if index not in selected
+            ]
             return await self.async_step_init()
 
-        choices = {
-            str(i): c[CONF_CONSUMABLE_NAME] for i, c in enumerate(self.consumables)
-        }
+        choices = self._consumable_names()
 
         return self.async_show_form(
             step_id="delete_consumable",
-            data_schema=vol.Schema({vol.Required("consumable"): vol.In(choices)}),
+            data_schema=vol.Schema(
+                {vol.Required(CONF_CONSUMABLES): cv.multi_select(choices)}
+            ),
+        )
+
+    async def async_step_search_consumables(
+        self,
+        user_input: dict[str, Any] | None = None,
+    ) -> ConfigFlowResult:
+        """Narrow the consumables listed and offered to those matching a search."""
+        if user_input is not None:
+            self._filter = user_input.get(CONF_SEARCH, "").strip()
+            self._page = 0
+            return await self.async_step_init()
+
+        return self.async_show_form(
+            step_id="search_consumables",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_SEARCH, description={"suggested_value": self._filter}
+                    ): str
+                }
+            ),
+        )
+
+    async def async_step_edit_many(
+        self,
+        user_input: dict[str, Any] | None = None,
+    ) -> ConfigFlowResult:
+        """Apply the same settings to the selected consumables."""
+        errors: dict[str, str] = {}
+        choices = self._consumable_names()
+
+        if user_input is not None:
+            selected = [int(index) for index in user_input[CONF_CONSUMABLES]]
+            changes = {
+                key: user_input[key]
+                for key in (CONF_LIFETIME_DAYS, CONF_WARNING_DAYS, CONF_COST)
+                if key in user_input
+            }
+            for index in selected:
+                consumable = {**self._resolve(self.consumables[index]), **changes}
+                if (
+                    CONF_LIFETIME_DAYS in changes or CONF_WARNING_DAYS in changes
+                ) and uses_hours(consumable):
+                    errors["base"] = "hours_selected"
+                elif consumable[CONF_WARNING_DAYS] >= consumable[CONF_LIFETIME_DAYS]:
+                    errors[CONF_WARNING_DAYS] = "warning_exceeds_lifetime"
+
+            if not errors:
+                for index in selected:
+                    self.consumables[index] = {**self.consumables[index], **changes}
+                return await self.async_step_init()
+
+        return self.async_show_form(
+            step_id="edit_many",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_CONSUMABLES): cv.multi_select(choices),
+                    vol.Optional(CONF_LIFETIME_DAYS): vol.All(
+                        vol.Coerce(int), vol.Range(min=1, max=730)
+                    ),
+                    vol.Optional(CONF_WARNING_DAYS): vol.All(
+                        vol.Coerce(int), vol.Range(min=0, max=365)
+                    ),
+                    vol.Optional(CONF_COST): vol.All(
+                        vol.Coerce(float), vol.Range(min=0)
+                    ),
+                }
+            ),
+            errors=errors,
         )
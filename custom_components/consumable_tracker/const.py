@@ -6,16 +6,76 @@ MANUFACTURER = "Consumable Tracker"
 MODEL = "Multi-Consumable Device"
 
 CONF_DEVICE_NAME = "device_name"
+CONF_DEVICES = "devices"
+CONF_DEVICE_UID = "device_uid"
+CONF_HUB = "hub"
+CONF_LIGHTWEIGHT = "lightweight"
+CONF_USE_CATALOG = "use_catalog"
+CONF_BULK_ADD = "bulk_add"
+CONF_STORAGE_KEY = "storage_key"
 CONF_CONSUMABLES = "consumables"
 CONF_CONSUMABLE_NAME = "consumable_name"
 CONF_LIFETIME_DAYS = "lifetime_days"
 CONF_WARNING_DAYS = "warning_days"
+CONF_LIFETIME_HOURS = "lifetime_hours"
+CONF_WARNING_HOURS = "warning_hours"
+CONF_COST = "cost"
+CONF_PART_NUMBER = "part_number"
+CONF_REORDER_POINT = "reorder_point"
+CONF_SOURCE_ENTITY = "source_entity"
+CONF_METER_ENTITY = "meter_entity"
+CONF_CAPACITY = "capacity"
+CONF_WEAR_ENTITY = "wear_entity"
+CONF_WEAR_THRESHOLD = "wear_threshold"
+CONF_TAGS = "tags"
+CONF_TEMPLATE = "template"
+CONF_PRESET = "preset"
+CONF_SEARCH = "search"
 CONF_ICON_NORMAL = "icon_normal"
 CONF_ICON_WARNING = "icon_warning"
 CONF_ICON_OVERDUE = "icon_overdue"
 
 DEFAULT_LIFETIME_DAYS = 90
 DEFAULT_WARNING_DAYS = 15
+DEFAULT_REORDER_POINT = 1
+# Previous last replaced values kept per consumable for undo
+UNDO_HISTORY_SIZE = 10
 DEFAULT_ICON_NORMAL = "mdi:gauge-full"
 DEFAULT_ICON_WARNING = "mdi:gauge-low"
 DEFAULT_ICON_OVERDUE = "mdi:gauge-empty"
+
+ATTR_LAST_REPLACED = "last_replaced"
+ATTR_REPLACEMENTS = "replacements"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_MONTHS = "months"
+ATTR_HORIZON_DAYS = "horizon_days"
+ATTR_LABEL_ID = "label_id"
+ATTR_STATUS = "status"
+ATTR_TEMPLATE_ID = "template_id"
+
+SERVICE_DELETE_TEMPLATE = "delete_template"
+SERVICE_GET_DUE = "get_due"
+SERVICE_IMPORT_REPLACEMENTS = "import_replacements"
+SERVICE_PROJECT_COSTS = "project_costs"
+SERVICE_REPLACE = "replace"
+SERVICE_REPLACE_DEVICE = "replace_device"
+SERVICE_SAVE_TEMPLATE = "save_template"
+SERVICE_SET_LAST_REPLACED = "set_last_replaced"
+SERVICE_UNDO_REPLACED = "undo_replaced"
+
+STATUS_NORMAL = "normal"
+STATUS_WARNING = "warning"
+STATUS_OVERDUE = "overdue"
+
+SIGNAL_STATUS_CHANGED = f"{DOMAIN}_status_changed_{{}}"
+SIGNAL_PERCENTAGE_CHANGED = f"{DOMAIN}_percentage_changed_{{}}"
+SIGNAL_REPLACED = f"{DOMAIN}_replaced_{{}}"
+SIGNAL_REPLACEMENT_UNDONE = f"{DOMAIN}_replacement_undone_{{}}"
+SIGNAL_LAST_REPLACED_CHANGED = f"{DOMAIN}_last_replaced_changed_{{}}"
+SIGNAL_CONSUMABLE_UPDATED = f"{DOMAIN}_consumable_updated_{{}}"
+SIGNAL_PART_UPDATED = f"{DOMAIN}_part_updated_{{}}"
+SIGNAL_SOURCE_UPDATED = f"{DOMAIN}_source_updated_{{}}"
+SIGNAL_METER_UPDATED = f"{DOMAIN}_meter_updated_{{}}"
+SIGNAL_WEAR_UPDATED = f"{DOMAIN}_wear_updated_{{}}"
+# Sent for every consumable, unlike the per-consumable signals above
+SIGNAL_SNAPSHOT_UPDATED = f"{DOMAIN}_snapshot_updated"
@@ -0,0 +1,65 @@
+"""Maintenance cost projection for Consumable Tracker."""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.util import dt as dt_util
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+from .const import CONF_COST, CONF_LIFETIME_DAYS
+
+MAX_PROJECTION_MONTHS = 120
+
+
+def month_starts(start: date, months: int) -> list[date]:
+    """Return the first days of the months from start's month onwards.
+
+    The list has one more entry than months, closing the last month.
+    """
+    starts = []
+    for offset in range(months + 1):
+        year, month = divmod(start.month - 1 + offset, 12)
+        starts.append(date(start.year + year, month + 1, 1))
+    return starts
+
+
+def project_costs(
+    consumables: Iterable[tuple[Mapping[str, Any], date | None]],
+    today: date,
+    months: int,
+) -> list[float]:
+    """Return the projected replacement spend for each month.
+
+    Each consumable is replaced when due (or today, if overdue or never
+    replaced) and then every lifetime. Instead of stepping through its
+    schedule, the number of replacements before each month boundary is worked
+    out directly, and the differences between boundaries give the monthly
+    counts.
+    """
+    boundaries = [boundary.toordinal() for boundary in month_starts(today, months)]
+    spend = [0.0] * months
+
+    for consumable, last_replaced in consumables:
+        cost = consumable.get(CONF_COST)
+        if not cost:
+            continue
+        lifetime = consumable[CONF_LIFETIME_DAYS]
+        if isinstance(last_replaced, datetime):
+            last_replaced = dt_util.as_local(last_replaced).date()
+        first_due = today.toordinal()
+        if last_replaced is not None:
+            first_due = max(last_replaced.toordinal() + lifetime, first_due)
+
+        # Replacements due before each boundary
+        due_before = [
+            -(-(boundary - first_due) // lifetime) if boundary > first_due else 0
+            for boundary in boundaries
+        ]
+        for month in range(months):
+            spend[month] += (due_before[month + 1] - due_before[month]) * cost
+
+    return [round(amount, 2) for amount in spend]
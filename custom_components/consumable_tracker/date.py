@@ -3,25 +3,33 @@
 from __future__ import annotations
 
 from datetime import date
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.date import DateEntity
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.restore_state import RestoreEntity
 
 if TYPE_CHECKING:
+    from collections.abc import MutableMapping
+
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import (
     CONF_CONSUMABLE_NAME,
-    CONF_CONSUMABLES,
-    CONF_DEVICE_NAME,
     DOMAIN,
     MANUFACTURER,
     MODEL,
 )
+from .models import (
+    ConsumableDevice,
+    ConsumableTrackerData,
+    async_set_last_replaced,
+    consumable_key,
+    uses_hours,
+)
 
 
 async def async_setup_entry(
@@ -30,11 +38,15 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the date platform."""
-    consumables = entry.data.get(CONF_CONSUMABLES, [])
+    data: ConsumableTrackerData = hass.data[DOMAIN][entry.entry_id]
     entities = []
 
-    for index, consumable in enumerate(consumables):
-        entities.append(ConsumableLastReplacedDate(entry, consumable, index))
+    for device in data.devices:
+        for index, consumable in enumerate(device.consumables):
+            if not uses_hours(consumable):
+                entities.append(
+                    ConsumableLastReplacedDate(entry, device, consumable, index)
+                )
 
     async_add_entities(entities)
 
@@ -44,16 +56,24 @@ class ConsumableLastReplacedDate(RestoreEntity, DateEntity):
 
     _attr_has_entity_name = True
     _attr_entity_category = EntityCategory.DIAGNOSTIC
-
-    def __init__(self, entry: ConfigEntry, consumable: dict, index: int) -> None:
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        entry: ConfigEntry,
+        device: ConsumableDevice,
+        consumable: MutableMapping[str, Any],
+        index: int,
+    ) -> None:
         """Initialize the date entity."""
         self._entry = entry
+        self._device = device
         self._consumable = consumable
         self._index = index
-        self._attr_unique_id = f"{entry.entry_id}_consumable_{index}_last_replaced"
+        self._attr_unique_id = f"{device.key}_consumable_{index}_last_replaced"
         self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": entry.data[CONF_DEVICE_NAME],
+            "identifiers": {(DOMAIN, device.key)},
+            "name": device.name,
             "manufacturer": MANUFACTURER,
             "model": MODEL,
         }
@@ -72,7 +92,25 @@ class ConsumableLastReplacedDate(RestoreEntity, DateEntity):
             except (ValueError, TypeError):
                 self._attr_native_value = None
 
-    async def async_set_value(self, value: date) -> None:
-        """Update the date."""
+        self._async_publish()
+
+    async def async_set_value(self, value: date | None) -> None:
+        """Update the date, or clear it."""
+        self.async_write_value(value)
+        self._async_publish()
+
+    @callback
+    def async_write_value(self, value: date | None) -> None:
+        """Update the date without sharing it, for batches that share it."""
         self._attr_native_value = value
         self.async_write_ha_state()
+
+    @callback
+    def _async_publish(self) -> None:
+        """Share the value with the consumable's sensor."""
+        async_set_last_replaced(
+            self.hass,
+            self._entry.entry_id,
+            consumable_key(self._device.key, self._index),
+            self._attr_native_value,
+        )
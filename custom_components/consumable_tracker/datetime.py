@@ -0,0 +1,122 @@
+"""Datetime platform for Consumable Tracker."""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.datetime import DateTimeEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
+from homeassistant.helpers.entity import EntityCategory
+from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.util import dt as dt_util
+
+if TYPE_CHECKING:
+    from collections.abc import MutableMapping
+
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import (
+    CONF_CONSUMABLE_NAME,
+    DOMAIN,
+    MANUFACTURER,
+    MODEL,
+)
+from .models import (
+    ConsumableDevice,
+    ConsumableTrackerData,
+    async_set_last_replaced,
+    consumable_key,
+    uses_hours,
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the datetime platform."""
+    data: ConsumableTrackerData = hass.data[DOMAIN][entry.entry_id]
+    entities = []
+
+    for device in data.devices:
+        for index, consumable in enumerate(device.consumables):
+            if uses_hours(consumable):
+                entities.append(
+                    ConsumableLastReplacedDateTime(entry, device, consumable, index)
+                )
+
+    async_add_entities(entities)
+
+
+class ConsumableLastReplacedDateTime(RestoreEntity, DateTimeEntity):
+    """Datetime entity for when an hour-precision consumable was last replaced."""
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        entry: ConfigEntry,
+        device: ConsumableDevice,
+        consumable: MutableMapping[str, Any],
+        index: int,
+    ) -> None:
+        """Initialize the datetime entity."""
+        self._entry = entry
+        self._device = device
+        self._consumable = consumable
+        self._index = index
+        self._attr_unique_id = f"{device.key}_consumable_{index}_last_replaced"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, device.key)},
+            "name": device.name,
+            "manufacturer": MANUFACTURER,
+            "model": MODEL,
+        }
+        self._attr_name = f"{consumable[CONF_CONSUMABLE_NAME]} last replaced"
+        self._attr_native_value = None
+
+    async def async_added_to_hass(self) -> None:
+        """Restore last state."""
+        await super().async_added_to_hass()
+
+        last_state = await self.async_get_last_state()
+        if last_state and last_state.state not in ["unknown", "unavailable"]:
+            try:
+                self._attr_native_value = dt_util.parse_datetime(last_state.state)
+            except (ValueError, TypeError):
+                self._attr_native_value = None
+
+        self._async_publish()
+
+    async def async_set_value(self, value: date | None) -> None:
+        """Update the datetime, or clear it."""
+        self.async_write_value(value)
+        self._async_publish()
+
+    @callback
+    def async_write_value(self, value: date | None) -> None:
+        """Update the datetime without sharing it, for batches that share it.
+
+        A date counts from the start of that day.
+        """
+        if value is not None and not isinstance(value, datetime):
+            value = dt_util.start_of_local_day(value)
+        self._attr_native_value = value
+        self.async_write_ha_state()
+
+    @callback
+    def _async_publish(self) -> None:
+        """Share the value, in UTC like the entity state, with the sensor."""
+        value = self._attr_native_value
+        async_set_last_replaced(
+            self.hass,
+            self._entry.entry_id,
+            consumable_key(self._device.key, self._index),
+            dt_util.as_utc(value) if value is not None else None,
+        )
@@ -0,0 +1,85 @@
+"""Device conditions for Consumable Tracker."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import voluptuous as vol
+from homeassistant.const import (
+    CONF_CONDITION,
+    CONF_DEVICE_ID,
+    CONF_DOMAIN,
+    CONF_ENTITY_ID,
+    CONF_TYPE,
+)
+from homeassistant.core import callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import entity_registry as er
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.condition import ConditionCheckerType
+    from homeassistant.helpers.typing import ConfigType, TemplateVarsType
+
+from .const import DOMAIN, STATUS_OVERDUE, STATUS_WARNING
+from .device_trigger import async_get_consumable_entities
+from .models import ConsumableTrackerData
+
+CONDITION_IS_WARNING = "is_warning"
+CONDITION_IS_OVERDUE = "is_overdue"
+
+CONDITION_STATUSES = {
+    CONDITION_IS_WARNING: STATUS_WARNING,
+    CONDITION_IS_OVERDUE: STATUS_OVERDUE,
+}
+
+CONDITION_SCHEMA = cv.DEVICE_CONDITION_BASE_SCHEMA.extend(
+    {
+        vol.Required(CONF_ENTITY_ID): cv.entity_id_or_uuid,
+        vol.Required(CONF_TYPE): vol.In(CONDITION_STATUSES),
+    }
+)
+
+
+async def async_get_conditions(
+    hass: HomeAssistant, device_id: str
+) -> list[dict[str, Any]]:
+    """List device conditions for Consumable Tracker devices."""
+    return [
+        {
+            CONF_CONDITION: "device",
+            CONF_DOMAIN: DOMAIN,
+            CONF_DEVICE_ID: device_id,
+            CONF_ENTITY_ID: entity.id,
+            CONF_TYPE: condition_type,
+        }
+        for entity in async_get_consumable_entities(hass, device_id)
+        for condition_type in CONDITION_STATUSES
+    ]
+
+
+@callback
+def async_condition_from_config(
+    hass: HomeAssistant, config: ConfigType
+) -> ConditionCheckerType:
+    """Create a function to test a device condition."""
+    target_status = CONDITION_STATUSES[config[CONF_TYPE]]
+    entity_id = er.async_resolve_entity_id(er.async_get(hass), config[CONF_ENTITY_ID])
+    entity = er.async_get(hass).async_get(entity_id) if entity_id else None
+    if entity is None:
+        raise vol.Invalid(f"Unknown consumable entity {config[CONF_ENTITY_ID]}")
+
+    config_entry_id = entity.config_entry_id
+    key = entity.unique_id
+
+    @callback
+    def test_is_status(hass: HomeAssistant, variables: TemplateVarsType) -> bool:
+        """Test if the consumable is in the target status."""
+        data: ConsumableTrackerData | None = hass.data.get(DOMAIN, {}).get(
+            config_entry_id
+        )
+        return data is not None and data.statuses.get(key) == target_status
+
+    return test_is_status
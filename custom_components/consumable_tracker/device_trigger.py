@@ -0,0 +1,145 @@
+"""Device triggers for Consumable Tracker."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import voluptuous as vol
+from homeassistant.components.device_automation import DEVICE_TRIGGER_BASE_SCHEMA
+from homeassistant.const import (
+    CONF_DEVICE_ID,
+    CONF_DOMAIN,
+    CONF_ENTITY_ID,
+    CONF_PLATFORM,
+    CONF_TYPE,
+)
+from homeassistant.core import HassJob, callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+    from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
+    from homeassistant.helpers.typing import ConfigType
+
+from .const import (
+    DOMAIN,
+    SIGNAL_REPLACED,
+    SIGNAL_STATUS_CHANGED,
+    STATUS_OVERDUE,
+    STATUS_WARNING,
+)
+from .models import ConsumableTrackerData
+
+TRIGGER_ENTERED_WARNING = "entered_warning"
+TRIGGER_BECAME_OVERDUE = "became_overdue"
+TRIGGER_REPLACED = "replaced"
+
+STATUS_TRIGGERS = {
+    TRIGGER_ENTERED_WARNING: STATUS_WARNING,
+    TRIGGER_BECAME_OVERDUE: STATUS_OVERDUE,
+}
+TRIGGER_TYPES = {*STATUS_TRIGGERS, TRIGGER_REPLACED}
+
+TRIGGER_SCHEMA = DEVICE_TRIGGER_BASE_SCHEMA.extend(
+    {
+        vol.Required(CONF_ENTITY_ID): cv.entity_id_or_uuid,
+        vol.Required(CONF_TYPE): vol.In(TRIGGER_TYPES),
+    }
+)
+
+
+@callback
+def async_get_consumable_entities(
+    hass: HomeAssistant, device_id: str
+) -> list[er.RegistryEntry]:
+    """Return the days remaining sensors of a device's consumables."""
+    entity_registry = er.async_get(hass)
+    entities = []
+
+    for entity in er.async_entries_for_device(entity_registry, device_id):
+        if entity.platform != DOMAIN or entity.domain != "sensor":
+            continue
+        data: ConsumableTrackerData | None = hass.data.get(DOMAIN, {}).get(
+            entity.config_entry_id
+        )
+        if data is not None and entity.unique_id in data.statuses:
+            entities.append(entity)
+
+    return entities
+
+
+async def async_get_triggers(
+    hass: HomeAssistant, device_id: str
+) -> list[dict[str, Any]]:
+    """List device triggers for Consumable Tracker devices."""
+    return [
+        {
+            CONF_PLATFORM: "device",
+            CONF_DOMAIN: DOMAIN,
+            CONF_DEVICE_ID: device_id,
+            CONF_ENTITY_ID: entity.id,
+            CONF_TYPE: trigger_type,
+        }
+        for entity in async_get_consumable_entities(hass, device_id)
+        for trigger_type in (
+            TRIGGER_ENTERED_WARNING,
+            TRIGGER_BECAME_OVERDUE,
+            TRIGGER_REPLACED,
+        )
+    ]
+
+
+async def async_attach_trigger(
+    hass: HomeAssistant,
+    config: ConfigType,
+    action: TriggerActionType,
+    trigger_info: TriggerInfo,
+) -> CALLBACK_TYPE:
+    """Attach a trigger."""
+    trigger_data = trigger_info["trigger_data"]
+    trigger_type = config[CONF_TYPE]
+    entity_id = er.async_resolve_entity_id(er.async_get(hass), config[CONF_ENTITY_ID])
+    entity = er.async_get(hass).async_get(entity_id) if entity_id else None
+    if entity is None:
+        raise vol.Invalid(f"Unknown consumable entity {config[CONF_ENTITY_ID]}")
+
+    job = HassJob(action, f"Consumable Tracker device trigger {trigger_info}")
+    trigger_payload = {
+        **trigger_data,
+        CONF_PLATFORM: "device",
+        CONF_DOMAIN: DOMAIN,
+        CONF_DEVICE_ID: config[CONF_DEVICE_ID],
+        CONF_ENTITY_ID: entity_id,
+        CONF_TYPE: trigger_type,
+        "description": f"{entity_id} {trigger_type.replace('_', ' ')}",
+    }
+
+    if trigger_type == TRIGGER_REPLACED:
+
+        @callback
+        def async_handle_replaced() -> None:
+            """Call the trigger action when the consumable is replaced."""
+            hass.async_run_hass_job(job, {"trigger": trigger_payload})
+
+        return async_dispatcher_connect(
+            hass, SIGNAL_REPLACED.format(entity.unique_id), async_handle_replaced
+        )
+
+    target_status = STATUS_TRIGGERS[trigger_type]
+
+    @callback
+    def async_handle_status_changed(status: str, previous: str | None) -> None:
+        """Call the trigger action when the consumable enters the status."""
+        # The first status computed after setup is not a transition
+        if previous is not None and status == target_status:
+            hass.async_run_hass_job(job, {"trigger": trigger_payload})
+
+    return async_dispatcher_connect(
+        hass,
+        SIGNAL_STATUS_CHANGED.format(entity.unique_id),
+        async_handle_status_changed,
+    )
@@ -0,0 +1,127 @@
+"""Index of consumables ordered by due date for Consumable Tracker."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right, insort
+from datetime import date, datetime, time, timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.util import dt as dt_util
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+
+    from .models import ConsumableTrackerData
+
+from .const import (
+    CONF_LIFETIME_DAYS,
+    CONF_LIFETIME_HOURS,
+    DOMAIN,
+    SIGNAL_CONSUMABLE_UPDATED,
+    SIGNAL_LAST_REPLACED_CHANGED,
+)
+
+DATA_DUE_INDEX = f"{DOMAIN}_due_index"
+
+# (due timestamp, entry ID, consumable key)
+DueIndexItem = tuple[float, str, str]
+
+
+def consumable_due(consumable: Mapping[str, Any], last_replaced: date) -> datetime:
+    """Return when a consumable replaced at last_replaced is due again."""
+    if isinstance(last_replaced, datetime):
+        return last_replaced + timedelta(hours=consumable[CONF_LIFETIME_HOURS])
+    return datetime.combine(
+        last_replaced + timedelta(days=consumable[CONF_LIFETIME_DAYS]),
+        time.min,
+        dt_util.DEFAULT_TIME_ZONE,
+    )
+
+
+def due_isoformat(consumable: Mapping[str, Any], last_replaced: date) -> str:
+    """Return when a consumable is due, as a date unless tracked by the hour."""
+    due = consumable_due(consumable, last_replaced)
+    if isinstance(last_replaced, datetime):
+        return due.isoformat()
+    return due.date().isoformat()
+
+
+class ConsumableDueIndex:
+    """Consumables of all config entries, ordered by when they are due.
+
+    Each consumable is moved within the index when its last replaced date or
+    lifetime changes, so queries by horizon are a bisect instead of a scan.
+    Consumables that were never replaced have no due date and are not indexed.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        self._hass = hass
+        self._order: list[DueIndexItem] = []
+        self._items: dict[tuple[str, str], DueIndexItem] = {}
+
+    @callback
+    def async_register(
+        self, entry_id: str, key: str, consumable: Mapping[str, Any]
+    ) -> CALLBACK_TYPE:
+        """Keep a consumable indexed until unregistered."""
+
+        @callback
+        def async_update() -> None:
+            """Move the consumable to its current due date."""
+            data: ConsumableTrackerData = self._hass.data[DOMAIN][entry_id]
+            last_replaced = data.last_replaced.get(key)
+            due = (
+                consumable_due(consumable, last_replaced).timestamp()
+                if last_replaced is not None
+                else None
+            )
+            self._async_set(entry_id, key, due)
+
+        unsubs = [
+            async_dispatcher_connect(
+                self._hass, SIGNAL_LAST_REPLACED_CHANGED.format(key), async_update
+            ),
+            async_dispatcher_connect(
+                self._hass, SIGNAL_CONSUMABLE_UPDATED.format(key), async_update
+            ),
+        ]
+        async_update()
+
+        @callback
+        def async_unregister() -> None:
+            """Stop indexing the consumable."""
+            for unsub in unsubs:
+                unsub()
+            self._async_set(entry_id, key, None)
+
+        return async_unregister
+
+    @callback
+    def _async_set(self, entry_id: str, key: str, due: float | None) -> None:
+        """Set or clear the due timestamp of a consumable."""
+        if (old := self._items.pop((entry_id, key), None)) is not None:
+            del self._order[bisect_left(self._order, old)]
+        if due is not None:
+            item = (due, entry_id, key)
+            self._items[(entry_id, key)] = item
+            insort(self._order, item)
+
+    def due_before(self, cutoff: datetime | None) -> list[DueIndexItem]:
+        """Return the consumables due before the cutoff, soonest first."""
+        if cutoff is None:
+            return list(self._order)
+        end = bisect_right(self._order, cutoff.timestamp(), key=lambda item: item[0])
+        return self._order[:end]
+
+
+@callback
+def async_get_due_index(hass: HomeAssistant) -> ConsumableDueIndex:
+    """Return the due date index shared by all config entries."""
+    if DATA_DUE_INDEX not in hass.data:
+        hass.data[DATA_DUE_INDEX] = ConsumableDueIndex(hass)
+    return hass.data[DATA_DUE_INDEX]
@@ -0,0 +1,130 @@
+"""Entity ID resolution for Consumable Tracker config entries."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+from homeassistant.helpers import entity_registry as er
+
+if TYPE_CHECKING:
+    from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant
+
+    from .models import ConsumableDevice
+
+from .const import DOMAIN
+from .models import consumable_key, uses_hours
+
+ROLE_SENSOR = "sensor"
+ROLE_LAST_REPLACED = "last_replaced"
+ROLE_BUTTON = "button"
+
+
+@dataclass
+class ConsumableEntityIds:
+    """Entity IDs of a consumable's entities, None until registered."""
+
+    sensor: str | None = None
+    last_replaced: str | None = None
+    button: str | None = None
+
+
+class ConsumableEntityMap:
+    """Map an entry's consumables to the entity IDs of their entities.
+
+    The map is built in one pass over the entry's registry entries when it
+    starts and then kept current from entity registry events, so platforms look
+    entity IDs up here instead of querying the registry.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, entry_id: str, devices: list[ConsumableDevice]
+    ) -> None:
+        """Initialize the map."""
+        self._hass = hass
+        self._entry_id = entry_id
+        self._entity_ids: dict[str, ConsumableEntityIds] = {}
+        # (domain, unique ID) and entity ID of each entity -> (key, role)
+        self._roles: dict[tuple[str, str], tuple[str, str]] = {}
+        self._resolved: dict[str, tuple[str, str]] = {}
+
+        for device in devices:
+            for index, consumable in enumerate(device.consumables):
+                key = consumable_key(device.key, index)
+                date_domain = "datetime" if uses_hours(consumable) else "date"
+                self._entity_ids[key] = ConsumableEntityIds()
+                self._roles[("sensor", key)] = (key, ROLE_SENSOR)
+                self._roles[(date_domain, f"{key}_last_replaced")] = (
+                    key,
+                    ROLE_LAST_REPLACED,
+                )
+                self._roles[("button", f"{key}_replaced")] = (key, ROLE_BUTTON)
+
+    def get(self, key: str) -> ConsumableEntityIds:
+        """Return the entity IDs of a consumable."""
+        return self._entity_ids[key]
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Resolve the registered entities and follow registry changes."""
+        entity_registry = er.async_get(self._hass)
+        for entity in er.async_entries_for_config_entry(
+            entity_registry, self._entry_id
+        ):
+            self._set(entity)
+
+        return self._hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED,
+            self._async_registry_updated,
+            event_filter=self._async_filter_registry_event,
+        )
+
+    @callback
+    def _async_filter_registry_event(
+        self, event_data: er.EventEntityRegistryUpdatedData
+    ) -> bool:
+        """Return whether a registry event may concern the entry's entities.
+
+        New entities can't be told apart before looking them up, but changes to
+        other integrations' existing entities are skipped without a lookup.
+        """
+        # Only updates that rename an entity carry its old entity ID
+        data: Mapping[str, Any] = event_data
+        return (
+            data["action"] == "create"
+            or data["entity_id"] in self._resolved
+            or data.get("old_entity_id") in self._resolved
+        )
+
+    @callback
+    def _async_registry_updated(
+        self, event: Event[er.EventEntityRegistryUpdatedData]
+    ) -> None:
+        """Update the map when one of the entry's entities changes."""
+        data: Mapping[str, Any] = event.data
+        action = data["action"]
+        entity_id = data["entity_id"]
+
+        if action == "remove":
+            if (role := self._resolved.pop(entity_id, None)) is not None:
+                key, name = role
+                setattr(self._entity_ids[key], name, None)
+            return
+
+        if (old_entity_id := data.get("old_entity_id")) is not None:
+            self._resolved.pop(old_entity_id, None)
+
+        entity = er.async_get(self._hass).async_get(entity_id)
+        if entity is not None and entity.platform == DOMAIN:
+            self._set(entity)
+
+    @callback
+    def _set(self, entity: er.RegistryEntry) -> None:
+        """Record the entity ID of one of the entry's entities."""
+        if (role := self._roles.get((entity.domain, entity.unique_id))) is None:
+            return
+        key, name = role
+        setattr(self._entity_ids[key], name, entity.entity_id)
+        self._resolved[entity.entity_id] = role
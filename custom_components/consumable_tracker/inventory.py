@@ -0,0 +1,213 @@
+"""Spare parts inventory for Consumable Tracker."""
+
+from __future__ import annotations
+
+import heapq
+from datetime import date, datetime, time, timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import (
+    async_dispatcher_connect,
+    async_dispatcher_send,
+)
+from homeassistant.util import dt as dt_util
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+
+    from .models import ConsumableTrackerData
+
+from .const import (
+    CONF_LIFETIME_DAYS,
+    CONF_LIFETIME_HOURS,
+    CONF_PART_NUMBER,
+    CONF_REORDER_POINT,
+    DEFAULT_REORDER_POINT,
+    DOMAIN,
+    SIGNAL_CONSUMABLE_UPDATED,
+    SIGNAL_LAST_REPLACED_CHANGED,
+    SIGNAL_PART_UPDATED,
+    SIGNAL_REPLACED,
+    SIGNAL_REPLACEMENT_UNDONE,
+)
+from .models import async_mark_spare_taken, uses_hours
+from .store import ConsumableTrackerStore
+
+DATA_INVENTORY = f"{DOMAIN}_inventory"
+STORAGE_KEY = f"{DOMAIN}.inventory"
+
+ATTR_ON_HAND = "on_hand"
+
+
+class ConsumableInventory:
+    """Stock of spare parts, shared by every consumable using the same part.
+
+    Consumables are indexed by part number, so a replacement only updates the
+    stock and forecast of the replaced consumable's part.
+    """
+
+    def __init__(self, hass: HomeAssistant, store: ConsumableTrackerStore) -> None:
+        """Initialize the inventory."""
+        self._hass = hass
+        self._store = store
+        # Part number -> (entry ID, consumable key) -> consumable
+        self._parts: dict[str, dict[tuple[str, str], Mapping[str, Any]]] = {}
+        self._stock_out: dict[str, date | None] = {}
+
+    async def async_load(self) -> None:
+        """Load the stored stock."""
+        await self._store.async_load()
+
+    @property
+    def _stock(self) -> dict[str, dict[str, Any]]:
+        """Return the stored stock of every part."""
+        assert self._store.data is not None
+        return self._store.data
+
+    def on_hand(self, part_number: str) -> int:
+        """Return how many spares of a part are on hand."""
+        return self._stock.get(part_number, {}).get(ATTR_ON_HAND, 0)
+
+    def reorder_point(self, part_number: str) -> int:
+        """Return the stock level at which a part should be reordered."""
+        return max(
+            (
+                consumable.get(CONF_REORDER_POINT, DEFAULT_REORDER_POINT)
+                for consumable in self._parts.get(part_number, {}).values()
+            ),
+            default=DEFAULT_REORDER_POINT,
+        )
+
+    def stock_out(self, part_number: str) -> date | None:
+        """Return the first date a replacement can't be covered from stock."""
+        return self._stock_out.get(part_number)
+
+    @callback
+    def async_register(
+        self, entry_id: str, key: str, consumable: Mapping[str, Any]
+    ) -> CALLBACK_TYPE:
+        """Track the stock of a consumable's part until unregistered."""
+        part_number: str = consumable[CONF_PART_NUMBER]
+        self._parts.setdefault(part_number, {})[(entry_id, key)] = consumable
+
+        @callback
+        def async_replaced() -> None:
+            """Take a spare from stock, if any, when the consumable is replaced."""
+            if (on_hand := self.on_hand(part_number)) > 0:
+                self.async_set_on_hand(part_number, on_hand - 1)
+                async_mark_spare_taken(self._hass, entry_id, key)
+
+        @callback
+        def async_replacement_undone(spare_taken: bool) -> None:
+            """Return the spare to stock when a replacement that took one is undone."""
+            if spare_taken:
+                self.async_set_on_hand(part_number, self.on_hand(part_number) + 1)
+
+        @callback
+        def async_schedule_changed() -> None:
+            """Update the forecast when the consumable's schedule or lifetime changes."""
+            self._async_update_forecast(part_number)
+
+        unsubs = [
+            async_dispatcher_connect(
+                self._hass, SIGNAL_REPLACED.format(key), async_replaced
+            ),
+            async_dispatcher_connect(
+                self._hass,
+                SIGNAL_REPLACEMENT_UNDONE.format(key),
+                async_replacement_undone,
+            ),
+            async_dispatcher_connect(
+                self._hass,
+                SIGNAL_LAST_REPLACED_CHANGED.format(key),
+                async_schedule_changed,
+            ),
+            async_dispatcher_connect(
+                self._hass,
+                SIGNAL_CONSUMABLE_UPDATED.format(key),
+                async_schedule_changed,
+            ),
+        ]
+        self._async_update_forecast(part_number)
+
+        @callback
+        def async_unregister() -> None:
+            """Stop tracking the consumable."""
+            for unsub in unsubs:
+                unsub()
+            consumers = self._parts[part_number]
+            consumers.pop((entry_id, key), None)
+            if not consumers:
+                del self._parts[part_number]
+                self._stock_out.pop(part_number, None)
+            else:
+                # The remaining consumables now have the stock to themselves
+                self._async_update_forecast(part_number)
+
+        return async_unregister
+
+    @callback
+    def async_set_on_hand(self, part_number: str, on_hand: int) -> None:
+        """Set how many spares of a part are on hand."""
+        self._stock.setdefault(part_number, {})[ATTR_ON_HAND] = on_hand
+        self._store.async_schedule_save()
+        self._async_update_forecast(part_number)
+
+    @callback
+    def _async_update_forecast(self, part_number: str) -> None:
+        """Recompute the stock-out date of a part and notify its entities."""
+        self._stock_out[part_number] = self._forecast(part_number)
+        async_dispatcher_send(self._hass, SIGNAL_PART_UPDATED.format(part_number))
+
+    def _forecast(self, part_number: str) -> date | None:
+        """Return when the replacements of a part's consumables exhaust its stock.
+
+        Each consumable is replaced when due (or now, if overdue) and then every
+        lifetime. Merging those schedules, the replacement after the last spare
+        on hand is the stock-out.
+        """
+        now = dt_util.now()
+        schedule: list[tuple[datetime, int, timedelta]] = []
+        for index, ((entry_id, key), consumable) in enumerate(
+            self._parts.get(part_number, {}).items()
+        ):
+            if uses_hours(consumable):
+                lifetime = timedelta(hours=consumable[CONF_LIFETIME_HOURS])
+            else:
+                lifetime = timedelta(days=consumable[CONF_LIFETIME_DAYS])
+
+            data: ConsumableTrackerData | None = self._hass.data.get(DOMAIN, {}).get(
+                entry_id
+            )
+            last = data.last_replaced.get(key) if data is not None else None
+            if last is None:
+                due = now
+            elif isinstance(last, datetime):
+                due = max(last + lifetime, now)
+            else:
+                start = datetime.combine(last, time.min, dt_util.DEFAULT_TIME_ZONE)
+                due = max(start + lifetime, now)
+            # The index breaks ties without comparing lifetimes
+            schedule.append((due, index, lifetime))
+
+        if not schedule:
+            return None
+
+        heapq.heapify(schedule)
+        for _ in range(self.on_hand(part_number)):
+            due, index, lifetime = schedule[0]
+            heapq.heapreplace(schedule, (due + lifetime, index, lifetime))
+        return dt_util.as_local(schedule[0][0]).date()
+
+
+async def async_get_inventory(hass: HomeAssistant) -> ConsumableInventory:
+    """Return the spare parts inventory shared by all config entries."""
+    inventory: ConsumableInventory | None = hass.data.get(DATA_INVENTORY)
+    if inventory is None:
+        store = ConsumableTrackerStore(hass, STORAGE_KEY)
+        inventory = hass.data[DATA_INVENTORY] = ConsumableInventory(hass, store)
+    await inventory.async_load()
+    return inventory
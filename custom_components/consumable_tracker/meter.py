@@ -0,0 +1,187 @@
+"""Capacity tracking from cumulative meters for Consumable Tracker."""
+
+from __future__ import annotations
+
+import logging
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.dispatcher import (
+    async_dispatcher_connect,
+    async_dispatcher_send,
+)
+from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.util import dt as dt_util
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from homeassistant.core import (
+        CALLBACK_TYPE,
+        Event,
+        EventStateChangedData,
+        HomeAssistant,
+        State,
+    )
+
+    from .store import ConsumableTrackerStore
+
+from .const import (
+    CONF_CAPACITY,
+    CONF_METER_ENTITY,
+    SIGNAL_METER_UPDATED,
+    SIGNAL_REPLACED,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Days of consumption the rate is averaged over
+RATE_DAYS = 14
+# Seconds between meter readings reaching the sensor
+REFRESH_COOLDOWN = 60
+
+ATTR_USED = "used"
+ATTR_READING = "reading"
+ATTR_DAILY = "daily"
+
+
+def _meter_reading(state: State | None) -> float | None:
+    """Return the total reported by a meter state, if any."""
+    if state is None:
+        return None
+    try:
+        return float(state.state)
+    except ValueError:
+        return None
+
+
+class ConsumableMeter:
+    """Consumption of a consumable, measured by a total increasing meter.
+
+    Only the difference between meter readings is added, so a reading costs
+    the same however long the consumable has been in use. A reading below the
+    previous one means the meter was reset, and counts from zero. The used
+    amount and daily totals for the rate are checkpointed in the entry's meter
+    store, keyed by consumable.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        key: str,
+        consumable: Mapping[str, Any],
+        store: ConsumableTrackerStore,
+    ) -> None:
+        """Initialize the meter."""
+        self._hass = hass
+        self._key = key
+        self._consumable = consumable
+        self._store = store
+        self._entity_id: str = consumable[CONF_METER_ENTITY]
+        # The sensor is refreshed at most once per cooldown, however often the
+        # meter updates
+        self._refresh = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=REFRESH_COOLDOWN,
+            immediate=True,
+            function=self._async_notify,
+        )
+
+    @property
+    def _state(self) -> dict[str, Any]:
+        """Return the stored consumption of the consumable."""
+        assert self._store.data is not None
+        return self._store.data.setdefault(
+            self._key, {ATTR_USED: 0.0, ATTR_READING: None, ATTR_DAILY: {}}
+        )
+
+    @property
+    def used(self) -> float:
+        """Return how much was consumed since the last replacement."""
+        return self._state[ATTR_USED]
+
+    @property
+    def rate(self) -> float:
+        """Return the average consumption per day over the recent days."""
+        daily: dict[str, float] = self._state[ATTR_DAILY]
+        if not daily:
+            return 0.0
+        start = dt_util.start_of_local_day(date.fromisoformat(min(daily)))
+        days = max((dt_util.now() - start) / timedelta(days=1), 1)
+        return sum(daily.values()) / days
+
+    def remaining(self) -> timedelta | None:
+        """Return how long the remaining capacity lasts at the current rate."""
+        left = self._consumable[CONF_CAPACITY] - self.used
+        if left <= 0:
+            return timedelta(0)
+        if (rate := self.rate) <= 0:
+            return None
+        return timedelta(days=left / rate)
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Follow the meter until the returned callback is called."""
+        # Catch up on consumption while Home Assistant was stopped
+        reading = _meter_reading(self._hass.states.get(self._entity_id))
+        if reading is not None:
+            self._async_add_reading(reading)
+
+        unsubs = [
+            async_track_state_change_event(
+                self._hass, [self._entity_id], self._handle_state_change
+            ),
+            async_dispatcher_connect(
+                self._hass, SIGNAL_REPLACED.format(self._key), self._handle_replaced
+            ),
+        ]
+
+        @callback
+        def async_stop() -> None:
+            """Stop following the meter."""
+            for unsub in unsubs:
+                unsub()
+            self._refresh.async_shutdown()
+
+        return async_stop
+
+    @callback
+    def _handle_state_change(self, event: Event[EventStateChangedData]) -> None:
+        """Handle the meter reporting a new total."""
+        reading = _meter_reading(event.data["new_state"])
+        if reading is not None:
+            self._async_add_reading(reading)
+            self._refresh.async_schedule_call()
+
+    @callback
+    def _handle_replaced(self) -> None:
+        """Start counting from zero for the new consumable."""
+        self._state[ATTR_USED] = 0.0
+        self._store.async_schedule_save()
+        self._async_notify()
+
+    @callback
+    def _async_add_reading(self, reading: float) -> None:
+        """Add the consumption since the previous reading."""
+        state = self._state
+        previous: float | None = state[ATTR_READING]
+        state[ATTR_READING] = reading
+        if previous is not None:
+            consumed = reading - previous if reading >= previous else reading
+            if consumed > 0:
+                state[ATTR_USED] += consumed
+                daily: dict[str, float] = state[ATTR_DAILY]
+                today = dt_util.now().date()
+                daily[today.isoformat()] = daily.get(today.isoformat(), 0) + consumed
+                oldest = (today - timedelta(days=RATE_DAYS - 1)).isoformat()
+                for day in [day for day in daily if day < oldest]:
+                    del daily[day]
+        self._store.async_schedule_save()
+
+    @callback
+    def _async_notify(self) -> None:
+        """Tell the consumable's sensor its consumption changed."""
+        async_dispatcher_send(self._hass, SIGNAL_METER_UPDATED.format(self._key))
@@ -0,0 +1,389 @@
+"""Runtime data models for the Consumable Tracker integration."""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Callable, Mapping, MutableMapping
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.util import dt as dt_util
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+    from .date import ConsumableLastReplacedDate
+    from .datetime import ConsumableLastReplacedDateTime
+    from .entity_map import ConsumableEntityMap
+    from .meter import ConsumableMeter
+    from .store import ConsumableTrackerStore
+    from .wear import ConsumableWear
+
+from .const import (
+    CONF_CAPACITY,
+    CONF_CONSUMABLE_NAME,
+    CONF_CONSUMABLES,
+    CONF_COST,
+    CONF_DEVICE_NAME,
+    CONF_DEVICE_UID,
+    CONF_DEVICES,
+    CONF_ICON_NORMAL,
+    CONF_ICON_OVERDUE,
+    CONF_ICON_WARNING,
+    CONF_LIFETIME_DAYS,
+    CONF_LIFETIME_HOURS,
+    CONF_METER_ENTITY,
+    CONF_PART_NUMBER,
+    CONF_REORDER_POINT,
+    CONF_SOURCE_ENTITY,
+    CONF_TAGS,
+    CONF_WARNING_DAYS,
+    CONF_WARNING_HOURS,
+    CONF_WEAR_ENTITY,
+    CONF_WEAR_THRESHOLD,
+    DEFAULT_ICON_NORMAL,
+    DEFAULT_ICON_OVERDUE,
+    DEFAULT_ICON_WARNING,
+    DEFAULT_REORDER_POINT,
+    DOMAIN,
+    SIGNAL_LAST_REPLACED_CHANGED,
+    SIGNAL_REPLACED,
+    SIGNAL_REPLACEMENT_UNDONE,
+    UNDO_HISTORY_SIZE,
+)
+
+# Fields of an undo history entry
+ATTR_PREVIOUS = "previous"
+ATTR_SPARE_TAKEN = "spare_taken"
+
+
+def consumable_key(device_key: str, index: int) -> str:
+    """Return the key identifying a consumable within the integration.
+
+    The key doubles as the unique ID of the consumable's days remaining sensor.
+    """
+    return f"{device_key}_consumable_{index}"
+
+
+def uses_hours(consumable: Mapping[str, Any]) -> bool:
+    """Return whether a consumable tracks its lifetime with hour precision."""
+    return consumable.get(CONF_LIFETIME_HOURS) is not None
+
+
+def parse_last_replaced(
+    consumable: Mapping[str, Any], value: str
+) -> date | datetime | None:
+    """Parse a stored last replaced value of a consumable."""
+    if not uses_hours(consumable):
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            return None
+    parsed = dt_util.parse_datetime(value)
+    return dt_util.as_utc(parsed) if parsed is not None else None
+
+
+def build_consumable(user_input: Mapping[str, Any]) -> dict[str, Any]:
+    """Build a consumable definition from user input."""
+    consumable = {
+        CONF_CONSUMABLE_NAME: user_input[CONF_CONSUMABLE_NAME],
+        CONF_LIFETIME_DAYS: user_input[CONF_LIFETIME_DAYS],
+        CONF_WARNING_DAYS: user_input[CONF_WARNING_DAYS],
+        CONF_ICON_NORMAL: user_input.get(CONF_ICON_NORMAL, DEFAULT_ICON_NORMAL),
+        CONF_ICON_WARNING: user_input.get(CONF_ICON_WARNING, DEFAULT_ICON_WARNING),
+        CONF_ICON_OVERDUE: user_input.get(CONF_ICON_OVERDUE, DEFAULT_ICON_OVERDUE),
+    }
+
+    if lifetime_hours := user_input.get(CONF_LIFETIME_HOURS):
+        # Hour precision; keep the day fields as rounded equivalents
+        warning_hours = user_input.get(CONF_WARNING_HOURS, 0)
+        consumable[CONF_LIFETIME_HOURS] = lifetime_hours
+        consumable[CONF_WARNING_HOURS] = warning_hours
+        consumable[CONF_LIFETIME_DAYS] = math.ceil(lifetime_hours / 24)
+        consumable[CONF_WARNING_DAYS] = warning_hours // 24
+
+    if (cost := user_input.get(CONF_COST)) is not None:
+        consumable[CONF_COST] = cost
+
+    if part_number := user_input.get(CONF_PART_NUMBER):
+        consumable[CONF_PART_NUMBER] = part_number
+        consumable[CONF_REORDER_POINT] = user_input.get(
+            CONF_REORDER_POINT, DEFAULT_REORDER_POINT
+        )
+
+    if source_entity := user_input.get(CONF_SOURCE_ENTITY):
+        consumable[CONF_SOURCE_ENTITY] = source_entity
+
+    if meter_entity := user_input.get(CONF_METER_ENTITY):
+        consumable[CONF_METER_ENTITY] = meter_entity
+        consumable[CONF_CAPACITY] = user_input[CONF_CAPACITY]
+
+    if tags := [tag for tag in user_input.get(CONF_TAGS, []) if tag]:
+        consumable[CONF_TAGS] = tags
+
+    if wear_entity := user_input.get(CONF_WEAR_ENTITY):
+        consumable[CONF_WEAR_ENTITY] = wear_entity
+        consumable[CONF_WEAR_THRESHOLD] = user_input[CONF_WEAR_THRESHOLD]
+
+    return consumable
+
+
+def is_hub(definitions: Mapping[str, Any]) -> bool:
+    """Return whether a config entry's definitions host many devices."""
+    return CONF_DEVICES in definitions
+
+
+@dataclass(frozen=True)
+class ConsumableDevice:
+    """A device whose consumables are tracked by a config entry.
+
+    The key is both the device registry identifier and the prefix of the unique
+    IDs of the device's entities.
+    """
+
+    key: str
+    name: str
+    # Definitions, or views over them and their templates
+    consumables: list[MutableMapping[str, Any]]
+
+
+def entry_devices(
+    entry: ConfigEntry,
+    definitions: Mapping[str, Any],
+    resolve: Callable[[dict[str, Any]], MutableMapping[str, Any]] | None = None,
+) -> list[ConsumableDevice]:
+    """Return the devices hosted by a config entry.
+
+    Consumables are passed through resolve, if given, to fill in the fields of
+    the templates they refer to.
+    """
+
+    def consumables(definition: Mapping[str, Any]) -> list[MutableMapping[str, Any]]:
+        """Return the consumables of a device's definition."""
+        stored = definition.get(CONF_CONSUMABLES, [])
+        return stored if resolve is None else [resolve(item) for item in stored]
+
+    if not is_hub(definitions):
+        return [
+            ConsumableDevice(
+                key=entry.entry_id,
+                name=entry.data[CONF_DEVICE_NAME],
+                consumables=consumables(definitions),
+            )
+        ]
+
+    return [
+        ConsumableDevice(
+            key=f"{entry.entry_id}_{device[CONF_DEVICE_UID]}",
+            name=device[CONF_DEVICE_NAME],
+            consumables=consumables(device),
+        )
+        for device in definitions[CONF_DEVICES]
+    ]
+
+
+@dataclass
+class ConsumableTrackerData:
+    """Runtime data for a Consumable Tracker config entry."""
+
+    devices: list[ConsumableDevice] = field(default_factory=list)
+    # Consumable key -> device and definition, filled in from the devices
+    consumables: dict[str, tuple[ConsumableDevice, MutableMapping[str, Any]]] = field(
+        init=False, default_factory=dict
+    )
+    entity_map: ConsumableEntityMap | None = None
+    statuses: dict[str, str] = field(default_factory=dict)
+    # Percentage of lifetime remaining, None until first replaced
+    percentages: dict[str, int | None] = field(default_factory=dict)
+    last_replaced: dict[str, date] = field(default_factory=dict)
+    # Lightweight entries keep last replaced values here instead of in entities
+    last_replaced_store: ConsumableTrackerStore | None = None
+    # Previous last replaced values of each consumable, oldest first
+    history_store: ConsumableTrackerStore | None = None
+    # Remaining life reported by the consumables' linked source sensors
+    source_levels: dict[str, float] = field(default_factory=dict)
+    # Meters of consumables tracked by capacity
+    meters: dict[str, ConsumableMeter] = field(default_factory=dict)
+    # Wear estimates of consumables with a degradation signal
+    wear: dict[str, ConsumableWear] = field(default_factory=dict)
+    # Compact current state of each consumable, kept up to date by its sensor
+    snapshots: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        """Index the consumables by key."""
+        for device in self.devices:
+            for index, consumable in enumerate(device.consumables):
+                self.consumables[consumable_key(device.key, index)] = (
+                    device,
+                    consumable,
+                )
+
+
+@callback
+def async_set_last_replaced(
+    hass: HomeAssistant, entry_id: str, key: str, value: date | None
+) -> None:
+    """Record when a consumable was last replaced and notify its sensor."""
+    data: ConsumableTrackerData = hass.data[DOMAIN][entry_id]
+    if value is None:
+        data.last_replaced.pop(key, None)
+    else:
+        data.last_replaced[key] = value
+
+    if (store := data.last_replaced_store) is not None and store.data is not None:
+        if value is None:
+            store.data.pop(key, None)
+        else:
+            store.data[key] = value.isoformat()
+        store.async_schedule_save()
+
+    async_dispatcher_send(hass, SIGNAL_LAST_REPLACED_CHANGED.format(key))
+
+
+async def async_update_last_replaced(
+    hass: HomeAssistant, entry_id: str, key: str, value: date | None
+) -> None:
+    """Set when a consumable was last replaced.
+
+    Lightweight entries record the value directly; otherwise it is set through
+    the consumable's date or datetime entity so that entity's state follows.
+    """
+    data: ConsumableTrackerData = hass.data[DOMAIN][entry_id]
+    if data.last_replaced_store is not None:
+        if isinstance(value, datetime):
+            value = dt_util.as_utc(value)
+        async_set_last_replaced(hass, entry_id, key, value)
+        return
+
+    await _async_last_replaced_entity(hass, data, key).async_set_value(value)
+
+
+@callback
+def _async_last_replaced_entity(
+    hass: HomeAssistant, data: ConsumableTrackerData, key: str
+) -> ConsumableLastReplacedDate | ConsumableLastReplacedDateTime:
+    """Return the date or datetime entity holding a consumable's last replaced."""
+    entity = None
+    if data.entity_map is not None and (
+        entity_id := data.entity_map.get(key).last_replaced
+    ):
+        component = hass.data.get("entity_components", {}).get(entity_id.split(".")[0])
+        entity = component.get_entity(entity_id) if component else None
+    if entity is None:
+        raise HomeAssistantError(f"The last replaced entity of {key} is not available")
+    return entity
+
+
+@callback
+def _async_record_history(
+    data: ConsumableTrackerData, key: str, previous: date | None
+) -> None:
+    """Keep a consumable's previous last replaced value for undo, unsaved."""
+    if (store := data.history_store) is not None and store.data is not None:
+        history: list[dict[str, Any]] = store.data.setdefault(key, [])
+        history.append(
+            {ATTR_PREVIOUS: previous.isoformat() if previous is not None else None}
+        )
+        # Only the most recent values are kept, dropping the oldest first
+        del history[:-UNDO_HISTORY_SIZE]
+
+
+@callback
+def async_mark_spare_taken(hass: HomeAssistant, entry_id: str, key: str) -> None:
+    """Note that a consumable's latest replacement took a spare from stock.
+
+    Undoing that replacement then returns the spare, and only then.
+    """
+    data: ConsumableTrackerData = hass.data[DOMAIN][entry_id]
+    store = data.history_store
+    if store is not None and store.data and (history := store.data.get(key)):
+        history[-1][ATTR_SPARE_TAKEN] = True
+        store.async_schedule_save()
+
+
+async def async_replace(
+    hass: HomeAssistant, entry_id: str, key: str, consumable: Mapping[str, Any]
+) -> None:
+    """Mark a consumable as replaced now, keeping the previous value for undo."""
+    data: ConsumableTrackerData = hass.data[DOMAIN][entry_id]
+    previous = data.last_replaced.get(key)
+    # Today, or now for hour-precision consumables
+    now = dt_util.now()
+    value = now if uses_hours(consumable) else now.date()
+    await async_update_last_replaced(hass, entry_id, key, value)
+
+    _async_record_history(data, key, previous)
+    if (store := data.history_store) is not None and store.data is not None:
+        store.async_schedule_save()
+
+    async_dispatcher_send(hass, SIGNAL_REPLACED.format(key))
+
+
+@callback
+def async_replace_many(hass: HomeAssistant, entry_id: str, keys: list[str]) -> None:
+    """Mark several consumables of an entry as replaced now, as one batch.
+
+    Every last replaced entity is looked up before anything changes, so the
+    batch either applies to all consumables or to none. The values and undo
+    history are then updated together with a single save of each store, and
+    listeners are only notified once every value is in place, all without
+    yielding to the event loop.
+    """
+    data: ConsumableTrackerData = hass.data[DOMAIN][entry_id]
+    store = data.last_replaced_store
+    entities = (
+        {key: _async_last_replaced_entity(hass, data, key) for key in keys}
+        if store is None
+        else {}
+    )
+    # Today, or now for hour-precision consumables, as in async_replace
+    now = dt_util.now()
+
+    for key in keys:
+        _device, consumable = data.consumables[key]
+        value: date = now if uses_hours(consumable) else now.date()
+        _async_record_history(data, key, data.last_replaced.get(key))
+        if store is None:
+            entities[key].async_write_value(value)
+        # Recorded in UTC, as the datetime entities share their values
+        if isinstance(value, datetime):
+            value = dt_util.as_utc(value)
+        data.last_replaced[key] = value
+        if store is not None and store.data is not None:
+            store.data[key] = value.isoformat()
+
+    for batch_store in (store, data.history_store):
+        if batch_store is not None and batch_store.data is not None:
+            batch_store.async_schedule_save()
+
+    for key in keys:
+        async_dispatcher_send(hass, SIGNAL_LAST_REPLACED_CHANGED.format(key))
+        async_dispatcher_send(hass, SIGNAL_REPLACED.format(key))
+
+
+async def async_undo_replace(
+    hass: HomeAssistant, entry_id: str, key: str, consumable: Mapping[str, Any]
+) -> None:
+    """Restore the last replaced value a consumable had before its replacement."""
+    data: ConsumableTrackerData = hass.data[DOMAIN][entry_id]
+    store = data.history_store
+    history = store.data.get(key) if store is not None and store.data else None
+    if not history:
+        raise HomeAssistantError(
+            f"{consumable[CONF_CONSUMABLE_NAME]} has no replacement to undo"
+        )
+
+    stored = history[-1][ATTR_PREVIOUS]
+    previous = parse_last_replaced(consumable, stored) if stored is not None else None
+    await async_update_last_replaced(hass, entry_id, key, previous)
+
+    spare_taken: bool = history.pop().get(ATTR_SPARE_TAKEN, False)
+    if not history:
+        del store.data[key]
+    store.async_schedule_save()
+    async_dispatcher_send(hass, SIGNAL_REPLACEMENT_UNDONE.format(key), spare_taken)
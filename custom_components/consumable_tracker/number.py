@@ -0,0 +1,268 @@
+"""Number platform for Consumable Tracker."""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.number import NumberEntity, NumberMode
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import UnitOfTime
+from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.dispatcher import (
+    async_dispatcher_connect,
+    async_dispatcher_send,
+)
+from homeassistant.helpers.entity import EntityCategory
+
+if TYPE_CHECKING:
+    from collections.abc import MutableMapping
+
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import (
+    CONF_CONSUMABLE_NAME,
+    CONF_LIFETIME_DAYS,
+    CONF_LIFETIME_HOURS,
+    CONF_PART_NUMBER,
+    CONF_WARNING_DAYS,
+    CONF_WARNING_HOURS,
+    DOMAIN,
+    MANUFACTURER,
+    MODEL,
+    SIGNAL_CONSUMABLE_UPDATED,
+    SIGNAL_PART_UPDATED,
+)
+from .inventory import ConsumableInventory, async_get_inventory
+from .models import (
+    ConsumableDevice,
+    ConsumableTrackerData,
+    consumable_key,
+    uses_hours,
+)
+from .store import async_update_consumable
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the number platform."""
+    data: ConsumableTrackerData = hass.data[DOMAIN][entry.entry_id]
+    inventory = await async_get_inventory(hass)
+    entities: list[NumberEntity] = []
+
+    for device in data.devices:
+        for index, consumable in enumerate(device.consumables):
+            entities.append(ConsumableLifetimeNumber(entry, device, consumable, index))
+            entities.append(ConsumableWarningNumber(entry, device, consumable, index))
+            if consumable.get(CONF_PART_NUMBER):
+                entities.append(
+                    ConsumableStockNumber(inventory, device, consumable, index)
+                )
+
+    async_add_entities(entities)
+
+
+class ConsumableSettingNumber(NumberEntity):
+    """Base for numbers adjusting a consumable's settings in place."""
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.CONFIG
+    _attr_mode = NumberMode.BOX
+    _attr_native_step = 1
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        entry: ConfigEntry,
+        device: ConsumableDevice,
+        consumable: MutableMapping[str, Any],
+        index: int,
+    ) -> None:
+        """Initialize the number."""
+        self._entry = entry
+        self._device = device
+        self._consumable = consumable
+        self._index = index
+        self._key = consumable_key(device.key, index)
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, device.key)},
+            "name": device.name,
+            "manufacturer": MANUFACTURER,
+            "model": MODEL,
+        }
+        self._hourly = uses_hours(consumable)
+        self._attr_native_unit_of_measurement = (
+            UnitOfTime.HOURS if self._hourly else UnitOfTime.DAYS
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Follow changes to the consumable's settings, here or in its template."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_CONSUMABLE_UPDATED.format(self._key),
+                self.async_write_ha_state,
+            )
+        )
+
+    @property
+    def _lifetime(self) -> int:
+        """Return the consumable's lifetime in the number's unit."""
+        if self._hourly:
+            return self._consumable[CONF_LIFETIME_HOURS]
+        return self._consumable[CONF_LIFETIME_DAYS]
+
+    @property
+    def _warning(self) -> int:
+        """Return the consumable's warning threshold in the number's unit."""
+        if self._hourly:
+            return self._consumable[CONF_WARNING_HOURS]
+        return self._consumable[CONF_WARNING_DAYS]
+
+    @callback
+    def _async_update(self, lifetime: int, warning: int) -> None:
+        """Store new settings and refresh the consumable's entities."""
+        if warning >= lifetime:
+            raise HomeAssistantError("Warning threshold must be less than lifetime")
+
+        if self._hourly:
+            # Keep the day fields as rounded equivalents, like the config flow
+            changes = {
+                CONF_LIFETIME_HOURS: lifetime,
+                CONF_WARNING_HOURS: warning,
+                CONF_LIFETIME_DAYS: math.ceil(lifetime / 24),
+                CONF_WARNING_DAYS: warning // 24,
+            }
+        else:
+            changes = {CONF_LIFETIME_DAYS: lifetime, CONF_WARNING_DAYS: warning}
+
+        async_update_consumable(self.hass, self._entry, self._consumable, changes)
+        async_dispatcher_send(self.hass, SIGNAL_CONSUMABLE_UPDATED.format(self._key))
+
+
+class ConsumableLifetimeNumber(ConsumableSettingNumber):
+    """Number adjusting a consumable's lifetime."""
+
+    _attr_icon = "mdi:timer-cog-outline"
+
+    def __init__(
+        self,
+        entry: ConfigEntry,
+        device: ConsumableDevice,
+        consumable: MutableMapping[str, Any],
+        index: int,
+    ) -> None:
+        """Initialize the number."""
+        super().__init__(entry, device, consumable, index)
+        self._attr_unique_id = f"{self._key}_lifetime"
+        self._attr_name = f"{consumable[CONF_CONSUMABLE_NAME]} lifetime"
+        self._attr_native_min_value = 1
+        self._attr_native_max_value = 8760 if self._hourly else 730
+
+    @property
+    def native_value(self) -> int:
+        """Return the lifetime."""
+        return self._lifetime
+
+    async def async_set_native_value(self, value: float) -> None:
+        """Change the lifetime."""
+        self._async_update(int(value), self._warning)
+
+
+class ConsumableWarningNumber(ConsumableSettingNumber):
+    """Number adjusting a consumable's warning threshold."""
+
+    _attr_icon = "mdi:alert-outline"
+
+    def __init__(
+        self,
+        entry: ConfigEntry,
+        device: ConsumableDevice,
+        consumable: MutableMapping[str, Any],
+        index: int,
+    ) -> None:
+        """Initialize the number."""
+        super().__init__(entry, device, consumable, index)
+        self._attr_unique_id = f"{self._key}_warning"
+        self._attr_name = f"{consumable[CONF_CONSUMABLE_NAME]} warning threshold"
+        self._attr_native_min_value = 0
+        self._attr_native_max_value = 8759 if self._hourly else 365
+
+    @property
+    def native_value(self) -> int:
+        """Return the warning threshold."""
+        return self._warning
+
+    async def async_set_native_value(self, value: float) -> None:
+        """Change the warning threshold."""
+        self._async_update(self._lifetime, int(value))
+
+
+class ConsumableStockNumber(NumberEntity):
+    """Number with the spares on hand of a consumable's part."""
+
+    _attr_has_entity_name = True
+    _attr_icon = "mdi:package-variant-closed"
+    _attr_mode = NumberMode.BOX
+    _attr_native_min_value = 0
+    _attr_native_max_value = 9999
+    _attr_native_step = 1
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        inventory: ConsumableInventory,
+        device: ConsumableDevice,
+        consumable: MutableMapping[str, Any],
+        index: int,
+    ) -> None:
+        """Initialize the number."""
+        self._inventory = inventory
+        self._part_number: str = consumable[CONF_PART_NUMBER]
+        self._attr_unique_id = f"{consumable_key(device.key, index)}_stock"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, device.key)},
+            "name": device.name,
+            "manufacturer": MANUFACTURER,
+            "model": MODEL,
+        }
+        self._attr_name = f"{consumable[CONF_CONSUMABLE_NAME]} spares on hand"
+
+    async def async_added_to_hass(self) -> None:
+        """Follow stock and forecast changes of the part."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_PART_UPDATED.format(self._part_number),
+                self.async_write_ha_state,
+            )
+        )
+
+    @property
+    def native_value(self) -> int:
+        """Return the spares on hand."""
+        return self._inventory.on_hand(self._part_number)
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return the part's reorder point and stock-out forecast."""
+        on_hand = self._inventory.on_hand(self._part_number)
+        reorder_point = self._inventory.reorder_point(self._part_number)
+        stock_out = self._inventory.stock_out(self._part_number)
+        return {
+            "part_number": self._part_number,
+            "reorder_point": reorder_point,
+            "reorder": on_hand <= reorder_point,
+            "stock_out": stock_out.isoformat() if stock_out else None,
+        }
+
+    async def async_set_native_value(self, value: float) -> None:
+        """Set the spares on hand."""
+        self._inventory.async_set_on_hand(self._part_number, int(value))
@@ -0,0 +1,116 @@
+"""Catalog of common consumables for Consumable Tracker."""
+
+from __future__ import annotations
+
+import json
+import re
+from bisect import bisect_left
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+from .const import CONF_CONSUMABLE_NAME, DOMAIN
+
+DATA_PRESETS = f"{DOMAIN}_presets"
+CATALOG_PATH = Path(__file__).parent / "presets.json"
+
+ATTR_PRESET_ID = "id"
+ATTR_CATEGORY = "category"
+ATTR_KEYWORDS = "keywords"
+
+# Most matches offered at once
+MAX_RESULTS = 25
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def _tokens(text: str) -> list[str]:
+    """Return the lowercase words of a text."""
+    return _TOKEN.findall(text.lower())
+
+
+class ConsumablePresetCatalog:
+    """Common consumables with default lifetimes and icons, searchable by word.
+
+    Every word of a preset's name, category and keywords is indexed, and the
+    distinct words are kept sorted so the words starting with a typed prefix
+    are a contiguous run found by bisection. A search costs the matching words
+    rather than a scan of the whole catalog.
+    """
+
+    def __init__(self, presets: list[dict[str, Any]]) -> None:
+        """Initialize the catalog and its index."""
+        self._presets = {preset[ATTR_PRESET_ID]: preset for preset in presets}
+        # Word -> IDs of the presets containing it
+        self._index: dict[str, set[str]] = {}
+        for preset_id, preset in self._presets.items():
+            text = " ".join(
+                [
+                    preset[CONF_CONSUMABLE_NAME],
+                    preset.get(ATTR_CATEGORY, ""),
+                    *preset.get(ATTR_KEYWORDS, []),
+                ]
+            )
+            for word in _tokens(text):
+                self._index.setdefault(word, set()).add(preset_id)
+        self._words = sorted(self._index)
+
+    def __len__(self) -> int:
+        """Return the number of presets."""
+        return len(self._presets)
+
+    def get(self, preset_id: str) -> dict[str, Any] | None:
+        """Return a preset."""
+        return self._presets.get(preset_id)
+
+    def definition(self, preset_id: str) -> dict[str, Any]:
+        """Return the consumable fields a preset fills in."""
+        return {
+            key: value
+            for key, value in self._presets[preset_id].items()
+            if key not in (ATTR_PRESET_ID, ATTR_CATEGORY, ATTR_KEYWORDS)
+        }
+
+    def _prefixed(self, prefix: str) -> set[str]:
+        """Return the presets with a word starting with a prefix."""
+        matches: set[str] = set()
+        for position in range(bisect_left(self._words, prefix), len(self._words)):
+            word = self._words[position]
+            if not word.startswith(prefix):
+                break
+            matches |= self._index[word]
+        return matches
+
+    def search(self, query: str, limit: int = MAX_RESULTS) -> list[dict[str, Any]]:
+        """Return the presets matching every word of a query, by name.
+
+        The last word may be partly typed, so each word matches as a prefix.
+        """
+        words = _tokens(query)
+        if not words:
+            return []
+        matches = self._prefixed(words[0])
+        for word in words[1:]:
+            if not matches:
+                break
+            matches &= self._prefixed(word)
+        return sorted(
+            (self._presets[preset_id] for preset_id in matches),
+            key=lambda preset: preset[CONF_CONSUMABLE_NAME],
+        )[:limit]
+
+
+def _load_catalog() -> ConsumablePresetCatalog:
+    """Read the catalog from disk."""
+    return ConsumablePresetCatalog(json.loads(CATALOG_PATH.read_text("utf-8")))
+
+
+async def async_get_preset_catalog(hass: HomeAssistant) -> ConsumablePresetCatalog:
+    """Return the preset catalog, reading it in the executor on first use."""
+    catalog: ConsumablePresetCatalog | None = hass.data.get(DATA_PRESETS)
+    if catalog is None:
+        catalog = await hass.async_add_executor_job(_load_catalog)
+        hass.data[DATA_PRESETS] = catalog
+    return catalog
@@ -3,32 +3,73 @@
 from __future__ import annotations
 
 from datetime import date, datetime, timedelta
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from homeassistant.components.sensor import SensorEntity
+import voluptuous as vol
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import PERCENTAGE, UnitOfTime
 from homeassistant.core import callback
-from homeassistant.helpers import entity_registry as er
-from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import entity_platform
+from homeassistant.helpers.dispatcher import (
+    async_dispatcher_connect,
+    async_dispatcher_send,
+)
+from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.util import dt as dt_util
 
 if TYPE_CHECKING:
-    from homeassistant.core import Event, HomeAssistant
+    from collections.abc import MutableMapping
+
+    from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
-    from homeassistant.helpers.event import EventStateChangedData
 
 from .const import (
+    ATTR_LAST_REPLACED,
+    ATTR_REPLACEMENTS,
     CONF_CONSUMABLE_NAME,
-    CONF_CONSUMABLES,
-    CONF_DEVICE_NAME,
     CONF_ICON_NORMAL,
     CONF_ICON_OVERDUE,
     CONF_ICON_WARNING,
     CONF_LIFETIME_DAYS,
+    CONF_LIFETIME_HOURS,
     CONF_WARNING_DAYS,
+    CONF_WARNING_HOURS,
     DOMAIN,
     MANUFACTURER,
     MODEL,
+    SERVICE_IMPORT_REPLACEMENTS,
+    SERVICE_REPLACE,
+    SERVICE_SET_LAST_REPLACED,
+    SERVICE_UNDO_REPLACED,
+    SIGNAL_CONSUMABLE_UPDATED,
+    SIGNAL_LAST_REPLACED_CHANGED,
+    SIGNAL_METER_UPDATED,
+    SIGNAL_PERCENTAGE_CHANGED,
+    SIGNAL_SNAPSHOT_UPDATED,
+    SIGNAL_SOURCE_UPDATED,
+    SIGNAL_STATUS_CHANGED,
+    SIGNAL_WEAR_UPDATED,
+    STATUS_NORMAL,
+    STATUS_OVERDUE,
+    STATUS_WARNING,
+)
+from .due_index import due_isoformat
+from .models import (
+    ConsumableDevice,
+    ConsumableTrackerData,
+    async_replace,
+    async_undo_replace,
+    async_update_last_replaced,
+    consumable_key,
+    uses_hours,
 )
+from .statistics import async_import_replacements
 
 
 async def async_setup_entry(
@@ -37,121 +78,381 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the sensor platform."""
-    consumables = entry.data.get(CONF_CONSUMABLES, [])
-    entities = []
-
-    for index, consumable in enumerate(consumables):
-        entities.append(ConsumableTrackerSensor(entry, consumable, index))
+    data: ConsumableTrackerData = hass.data[DOMAIN][entry.entry_id]
+    entities: list[SensorEntity] = []
+
+    for device in data.devices:
+        for index, consumable in enumerate(device.consumables):
+            entities.append(ConsumableTrackerSensor(entry, device, consumable, index))
+            if data.last_replaced_store is None:
+                entities.append(
+                    ConsumableStatusSensor(entry, device, consumable, index)
+                )
+                entities.append(
+                    ConsumablePercentageSensor(entry, device, consumable, index)
+                )
 
     async_add_entities(entities)
 
+    platform = entity_platform.async_get_current_platform()
+    platform.async_register_entity_service(SERVICE_REPLACE, {}, "async_replace")
+    platform.async_register_entity_service(
+        SERVICE_UNDO_REPLACED, {}, "async_undo_replaced"
+    )
+    platform.async_register_entity_service(
+        SERVICE_SET_LAST_REPLACED,
+        {vol.Required(ATTR_LAST_REPLACED): vol.Any(cv.date, cv.datetime)},
+        "async_set_last_replaced",
+    )
+    platform.async_register_entity_service(
+        SERVICE_IMPORT_REPLACEMENTS,
+        {
+            vol.Required(ATTR_REPLACEMENTS): vol.All(
+                cv.ensure_list, [vol.Any(cv.date, cv.datetime)]
+            )
+        },
+        "async_import_replacements",
+    )
+
 
 class ConsumableTrackerSensor(SensorEntity):
     """Representation of a Consumable Tracker sensor."""
 
     _attr_native_unit_of_measurement = "days"
+    _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_has_entity_name = True
-
-    def __init__(self, entry: ConfigEntry, consumable: dict, index: int) -> None:
+    _attr_should_poll = False
+    # Only change with the configuration or a replacement, so keep them out of
+    # every recorded state
+    _unrecorded_attributes = frozenset(
+        {
+            "consumable_name",
+            "lifetime_days",
+            "warning_days",
+            "lifetime_hours",
+            "warning_hours",
+            "next_replacement",
+        }
+    )
+
+    def __init__(
+        self,
+        entry: ConfigEntry,
+        device: ConsumableDevice,
+        consumable: MutableMapping[str, Any],
+        index: int,
+    ) -> None:
         """Initialize the sensor."""
         self._entry = entry
+        self._device = device
         self._consumable = consumable
         self._index = index
-        self._attr_unique_id = f"{entry.entry_id}_consumable_{index}"
+        self._key = consumable_key(device.key, index)
+        self._attr_unique_id = self._key
         self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": entry.data[CONF_DEVICE_NAME],
+            "identifiers": {(DOMAIN, device.key)},
+            "name": device.name,
             "manufacturer": MANUFACTURER,
             "model": MODEL,
         }
-        self._attr_name = f"{consumable[CONF_CONSUMABLE_NAME]} days remaining"
-        self._date_unique_id = f"{entry.entry_id}_consumable_{index}_last_replaced"
-        self._datetime_entity_id: str | None = None
-        self._unsub_state_change = None
-
-    def _get_date_entity_id(self) -> str | None:
-        """Get the date entity ID from the registry, caching the result."""
-        if self._datetime_entity_id is None:
-            entity_registry = er.async_get(self.hass)
-            self._datetime_entity_id = entity_registry.async_get_entity_id(
-                "date", DOMAIN, self._date_unique_id
-            )
-        return self._datetime_entity_id
+        self._hourly = uses_hours(consumable)
+        if self._hourly:
+            self._attr_native_unit_of_measurement = UnitOfTime.HOURS
+            self._attr_name = f"{consumable[CONF_CONSUMABLE_NAME]} hours remaining"
+        else:
+            self._attr_name = f"{consumable[CONF_CONSUMABLE_NAME]} days remaining"
+        self._unsub_timer = None
+        self._data: ConsumableTrackerData | None = None
 
     async def async_added_to_hass(self) -> None:
-        """Set up entity ID for date entity and subscribe to state changes."""
+        """Subscribe to changes of the consumable's last replaced value."""
         await super().async_added_to_hass()
 
-        # Subscribe to state changes from the date entity (deferred lookup)
-        @callback
-        def async_subscribe_to_date_entity(_: object = None) -> None:
-            """Subscribe to date entity once it's available."""
-            date_entity_id = self._get_date_entity_id()
-            if date_entity_id and not self._unsub_state_change:
-                self._unsub_state_change = async_track_state_change_event(
-                    self.hass, [date_entity_id], self._handle_date_state_change
+        self._data = self.hass.data[DOMAIN][self._entry.entry_id]
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_LAST_REPLACED_CHANGED.format(self._key),
+                self._handle_last_replaced_changed,
+            )
+        )
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_CONSUMABLE_UPDATED.format(self._key),
+                self._handle_consumable_updated,
+            )
+        )
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_METER_UPDATED.format(self._key),
+                self._handle_meter_updated,
+            )
+        )
+        for signal in (SIGNAL_SOURCE_UPDATED, SIGNAL_WEAR_UPDATED):
+            self.async_on_remove(
+                async_dispatcher_connect(
+                    self.hass,
+                    signal.format(self._key),
+                    self._handle_attributes_updated,
                 )
+            )
 
-        # Try to subscribe now, or schedule for later
-        async_subscribe_to_date_entity()
+        self._async_update_status()
+        self._async_update_percentage()
+        self._async_schedule_update()
 
     async def async_will_remove_from_hass(self) -> None:
-        """Unsubscribe from state changes when entity is removed."""
-        if self._unsub_state_change:
-            self._unsub_state_change()
-            self._unsub_state_change = None
+        """Cancel the timer and drop the cached values and snapshot when removed."""
+        if self._unsub_timer:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+        if self._data is not None:
+            self._data.statuses.pop(self._key, None)
+            self._data.percentages.pop(self._key, None)
+            if self._data.snapshots.pop(self._key, None) is not None:
+                async_dispatcher_send(
+                    self.hass,
+                    SIGNAL_SNAPSHOT_UPDATED,
+                    self._entry.entry_id,
+                    self._key,
+                    None,
+                )
+
+    async def async_replace(self) -> None:
+        """Mark the consumable as replaced now."""
+        await async_replace(
+            self.hass, self._entry.entry_id, self._key, self._consumable
+        )
+
+    async def async_undo_replaced(self) -> None:
+        """Restore the last replaced value from before the latest replacement."""
+        await async_undo_replace(
+            self.hass, self._entry.entry_id, self._key, self._consumable
+        )
+
+    async def async_set_last_replaced(self, last_replaced: date) -> None:
+        """Set when the consumable was last replaced."""
+        if not self._hourly:
+            if isinstance(last_replaced, datetime):
+                last_replaced = dt_util.as_local(last_replaced).date()
+        elif not isinstance(last_replaced, datetime):
+            last_replaced = dt_util.start_of_local_day(last_replaced)
+        elif last_replaced.tzinfo is None:
+            last_replaced = last_replaced.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
+
+        await async_update_last_replaced(
+            self.hass, self._entry.entry_id, self._key, last_replaced
+        )
+
+    async def async_import_replacements(self, replacements: list[date]) -> None:
+        """Import the consumable's replacement history into statistics."""
+        async_import_replacements(
+            self.hass,
+            self._key,
+            f"{self._device.name} {self._consumable[CONF_CONSUMABLE_NAME]}",
+            replacements,
+        )
 
     @callback
-    def _handle_date_state_change(self, event: Event[EventStateChangedData]) -> None:
-        """Handle state changes from the date entity."""
+    def _handle_last_replaced_changed(self) -> None:
+        """Handle the paired date entity changing value."""
+        self._async_refresh()
+
+    @callback
+    def _handle_meter_updated(self) -> None:
+        """Handle the consumable's metered consumption changing."""
+        self._async_refresh()
+
+    @callback
+    def _handle_attributes_updated(self) -> None:
+        """Handle a new source level or wear estimate."""
         self.async_write_ha_state()
 
-    def _get_last_replaced_date(self) -> date | None:
-        """Get the last replaced date from the date entity."""
-        date_entity_id = self._get_date_entity_id()
-        if not date_entity_id:
+    @callback
+    def _handle_consumable_updated(self) -> None:
+        """Handle the consumable's lifetime or warning threshold changing."""
+        self._async_refresh()
+
+    @callback
+    def _handle_timer(self, now: datetime) -> None:
+        """Handle the remaining lifetime ticking over."""
+        self._unsub_timer = None
+        self._async_refresh()
+
+    @callback
+    def _async_refresh(self) -> None:
+        """Recompute the state and re-arm the timer for the next transition."""
+        self._async_update_status()
+        self._async_update_percentage()
+        self.async_write_ha_state()
+        self._async_schedule_update()
+
+    @callback
+    def _async_schedule_update(self) -> None:
+        """Arm a one-shot timer for the next change in remaining lifetime."""
+        if self._unsub_timer:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+        next_update = self._get_next_update()
+        if next_update is not None:
+            self._unsub_timer = async_track_point_in_time(
+                self.hass, self._handle_timer, next_update
+            )
+
+    def _get_next_update(self) -> datetime | None:
+        """Return when the remaining lifetime next changes, if it will."""
+        last_changed = self._get_last_replaced_date()
+        if last_changed is None or self.native_value == 0:
             return None
 
-        state = self.hass.states.get(date_entity_id)
-        if state and state.state not in ["unknown", "unavailable"]:
-            try:
-                return date.fromisoformat(state.state)
-            except (ValueError, TypeError):
-                pass
-        return None
+        if isinstance(last_changed, datetime):
+            hours_since = (dt_util.utcnow() - last_changed) // timedelta(hours=1)
+            return last_changed + timedelta(hours=hours_since + 1)
+
+        tomorrow = dt_util.now().date() + timedelta(days=1)
+        return dt_util.start_of_local_day(tomorrow)
+
+    @callback
+    def _async_update_status(self) -> None:
+        """Cache the current status and signal when it changes.
+
+        The first status is signalled too, with no previous status.
+        """
+        status = self._get_status()
+        data = self._data
+        assert data is not None
+        previous = data.statuses.get(self._key)
+        data.statuses[self._key] = status
+        if previous != status:
+            async_dispatcher_send(
+                self.hass,
+                SIGNAL_STATUS_CHANGED.format(self._key),
+                status,
+                previous,
+            )
+        self._async_update_snapshot(status)
+
+    @callback
+    def _async_update_percentage(self) -> None:
+        """Cache the percentage of lifetime remaining and signal when it changes."""
+        data = self._data
+        assert data is not None
+        percentage = self._get_percentage()
+        if data.percentages.get(self._key) != percentage:
+            data.percentages[self._key] = percentage
+            async_dispatcher_send(
+                self.hass, SIGNAL_PERCENTAGE_CHANGED.format(self._key), percentage
+            )
+
+    @callback
+    def _async_update_snapshot(self, status: str) -> None:
+        """Cache the consumable's snapshot and signal when it changes."""
+        data = self._data
+        assert data is not None
+        last_replaced = self._get_last_replaced_date()
+        snapshot = {
+            "id": self._key,
+            "entry_id": self._entry.entry_id,
+            "device": self._device.name,
+            "name": self._consumable[CONF_CONSUMABLE_NAME],
+            "remaining": self.native_value,
+            "unit": self.native_unit_of_measurement,
+            "status": status,
+            "last_replaced": last_replaced.isoformat() if last_replaced else None,
+            "due": due_isoformat(self._consumable, last_replaced)
+            if last_replaced
+            else None,
+        }
+        if data.snapshots.get(self._key) != snapshot:
+            data.snapshots[self._key] = snapshot
+            async_dispatcher_send(
+                self.hass,
+                SIGNAL_SNAPSHOT_UPDATED,
+                self._entry.entry_id,
+                self._key,
+                snapshot,
+            )
+
+    def _get_last_replaced_date(self) -> date | datetime | None:
+        """Get the last replaced date (or datetime) published by the paired entity."""
+        if self._data is None:
+            return None
+        return self._data.last_replaced.get(self._key)
 
     @property
     def native_value(self) -> int:
-        """Return the state of the sensor."""
-        # Get current consumable config
-        consumables = self._entry.data.get(CONF_CONSUMABLES, [])
-        if self._index >= len(consumables):
-            return 0
-        consumable = consumables[self._index]
+        """Return the state of the sensor.
+
+        Consumables tracked by capacity run out at the calendar lifetime or
+        when their capacity is used up at the current rate, whichever is first.
+        """
+        remaining = self._get_calendar_remaining()
+        meter = self._data.meters.get(self._key) if self._data else None
+        if meter is not None and (lasts := meter.remaining()) is not None:
+            unit = timedelta(hours=1) if self._hourly else timedelta(days=1)
+            remaining = min(remaining, lasts // unit)
+        return remaining
+
+    def _get_calendar_remaining(self) -> int:
+        """Return the days (or hours) left of the consumable's lifetime."""
+        consumable = self._consumable
 
         last_changed = self._get_last_replaced_date()
+        if isinstance(last_changed, datetime):
+            lifetime = consumable[CONF_LIFETIME_HOURS]
+            hours_since = (dt_util.utcnow() - last_changed) // timedelta(hours=1)
+            return max(lifetime - hours_since, 0)
+
+        if self._hourly:
+            return consumable[CONF_LIFETIME_HOURS]
         if last_changed is None:
             return consumable[CONF_LIFETIME_DAYS]
 
         lifetime = consumable[CONF_LIFETIME_DAYS]
-        days_since = (datetime.now().date() - last_changed).days
+        days_since = (dt_util.now().date() - last_changed).days
         days_remaining = max(lifetime - days_since, 0)
         return days_remaining
 
-    @property
-    def icon(self) -> str:
-        """Return the icon based on days remaining."""
-        consumables = self._entry.data.get(CONF_CONSUMABLES, [])
-        if self._index >= len(consumables):
-            return "mdi:help"
-        consumable = consumables[self._index]
+    def _get_percentage(self) -> int | None:
+        """Return the percentage of lifetime remaining, if ever replaced."""
+        if not self._get_last_replaced_date():
+            return None
+        if self._hourly:
+            lifetime = self._consumable[CONF_LIFETIME_HOURS]
+        else:
+            lifetime = self._consumable[CONF_LIFETIME_DAYS]
+        return int((self.native_value / lifetime) * 100) if lifetime > 0 else 0
+
+    def _get_status(self) -> str:
+        """Return the status based on days remaining."""
+        consumable = self._consumable
 
         days = self.native_value
-        warning = consumable[CONF_WARNING_DAYS]
+        if self._hourly:
+            warning = consumable[CONF_WARNING_HOURS]
+        else:
+            warning = consumable[CONF_WARNING_DAYS]
 
         if days == 0:
-            return consumable[CONF_ICON_OVERDUE]
+            return STATUS_OVERDUE
         elif days <= warning:
+            return STATUS_WARNING
+        else:
+            return STATUS_NORMAL
+
+    @property
+    def icon(self) -> str:
+        """Return the icon based on days remaining."""
+        status = self._get_status()
+        consumable = self._consumable
+
+        if status == STATUS_OVERDUE:
+            return consumable[CONF_ICON_OVERDUE]
+        elif status == STATUS_WARNING:
             return consumable[CONF_ICON_WARNING]
         else:
             return consumable[CONF_ICON_NORMAL]
@@ -159,26 +460,148 @@ class ConsumableTrackerSensor(SensorEntity):
     @property
     def extra_state_attributes(self) -> dict:
         """Return additional attributes."""
-        consumables = self._entry.data.get(CONF_CONSUMABLES, [])
-        if self._index >= len(consumables):
-            return {}
-        consumable = consumables[self._index]
+        consumable = self._consumable
 
         attrs = {
             "consumable_name": consumable[CONF_CONSUMABLE_NAME],
             "lifetime_days": consumable[CONF_LIFETIME_DAYS],
             "warning_days": consumable[CONF_WARNING_DAYS],
         }
+        if self._hourly:
+            attrs["lifetime_hours"] = consumable[CONF_LIFETIME_HOURS]
+            attrs["warning_hours"] = consumable[CONF_WARNING_HOURS]
 
         last_changed = self._get_last_replaced_date()
         if last_changed:
             attrs["last_changed"] = last_changed.isoformat()
-            lifetime = consumable[CONF_LIFETIME_DAYS]
-            next_replacement = last_changed + timedelta(days=lifetime)
+            if self._hourly:
+                lifetime = consumable[CONF_LIFETIME_HOURS]
+                next_replacement = last_changed + timedelta(hours=lifetime)
+            else:
+                lifetime = consumable[CONF_LIFETIME_DAYS]
+                next_replacement = last_changed + timedelta(days=lifetime)
             attrs["next_replacement"] = next_replacement.isoformat()
-
-            days = self.native_value
-            percentage = int((days / lifetime) * 100) if lifetime > 0 else 0
-            attrs["percentage"] = percentage
+            attrs["percentage"] = self._get_percentage()
+
+        if (data := self._data) is not None:
+            key = self._key
+            if (source_level := data.source_levels.get(key)) is not None:
+                attrs["source_percentage"] = source_level
+            if (meter := data.meters.get(key)) is not None:
+                attrs["capacity_used"] = round(meter.used, 3)
+                attrs["consumption_rate"] = round(meter.rate, 3)
+            if (wear := data.wear.get(key)) is not None:
+                # An alternative to the state, in the same unit
+                estimate = wear.remaining()
+                unit = timedelta(hours=1) if self._hourly else timedelta(days=1)
+                attrs["estimated_remaining"] = (
+                    estimate // unit if estimate is not None else None
+                )
 
         return attrs
+
+
+class ConsumableStatusSensor(SensorEntity):
+    """Sensor with the status of a consumable.
+
+    The status is computed by the consumable's days remaining sensor, so this
+    sensor only writes its state when the status changes.
+    """
+
+    _attr_device_class = SensorDeviceClass.ENUM
+    _attr_options = [STATUS_NORMAL, STATUS_WARNING, STATUS_OVERDUE]
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        entry: ConfigEntry,
+        device: ConsumableDevice,
+        consumable: MutableMapping[str, Any],
+        index: int,
+    ) -> None:
+        """Initialize the sensor."""
+        self._entry = entry
+        self._key = consumable_key(device.key, index)
+        self._attr_unique_id = f"{self._key}_status"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, device.key)},
+            "name": device.name,
+            "manufacturer": MANUFACTURER,
+            "model": MODEL,
+        }
+        self._attr_name = f"{consumable[CONF_CONSUMABLE_NAME]} status"
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to status changes of the consumable."""
+        await super().async_added_to_hass()
+
+        data: ConsumableTrackerData = self.hass.data[DOMAIN][self._entry.entry_id]
+        self._attr_native_value = data.statuses.get(self._key)
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_STATUS_CHANGED.format(self._key),
+                self._handle_status_changed,
+            )
+        )
+
+    @callback
+    def _handle_status_changed(self, status: str, previous: str | None) -> None:
+        """Handle the consumable's status changing."""
+        if status != self._attr_native_value:
+            self._attr_native_value = status
+            self.async_write_ha_state()
+
+
+class ConsumablePercentageSensor(SensorEntity):
+    """Sensor with the percentage of a consumable's lifetime remaining.
+
+    Like the status sensor, it only writes its state when the percentage
+    computed by the days remaining sensor changes. Its state class keeps the
+    percentage in long-term statistics, which attributes never reach.
+    """
+
+    _attr_native_unit_of_measurement = PERCENTAGE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        entry: ConfigEntry,
+        device: ConsumableDevice,
+        consumable: MutableMapping[str, Any],
+        index: int,
+    ) -> None:
+        """Initialize the sensor."""
+        self._entry = entry
+        self._key = consumable_key(device.key, index)
+        self._attr_unique_id = f"{self._key}_percentage"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, device.key)},
+            "name": device.name,
+            "manufacturer": MANUFACTURER,
+            "model": MODEL,
+        }
+        self._attr_name = f"{consumable[CONF_CONSUMABLE_NAME]} percentage remaining"
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to percentage changes of the consumable."""
+        await super().async_added_to_hass()
+
+        data: ConsumableTrackerData = self.hass.data[DOMAIN][self._entry.entry_id]
+        self._attr_native_value = data.percentages.get(self._key)
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_PERCENTAGE_CHANGED.format(self._key),
+                self._handle_percentage_changed,
+            )
+        )
+
+    @callback
+    def _handle_percentage_changed(self, percentage: int | None) -> None:
+        """Handle the consumable's percentage of lifetime remaining changing."""
+        self._attr_native_value = percentage
+        self.async_write_ha_state()
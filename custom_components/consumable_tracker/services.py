@@ -0,0 +1,278 @@
+"""Services for Consumable Tracker."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import voluptuous as vol
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import ATTR_AREA_ID, ATTR_DEVICE_ID
+from homeassistant.core import SupportsResponse, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse
+
+    from .models import ConsumableTrackerData
+
+from .const import (
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_HORIZON_DAYS,
+    ATTR_LABEL_ID,
+    ATTR_MONTHS,
+    ATTR_STATUS,
+    ATTR_TEMPLATE_ID,
+    CONF_CONSUMABLE_NAME,
+    CONF_COST,
+    CONF_ICON_NORMAL,
+    CONF_ICON_OVERDUE,
+    CONF_ICON_WARNING,
+    CONF_LIFETIME_DAYS,
+    CONF_LIFETIME_HOURS,
+    CONF_PART_NUMBER,
+    CONF_REORDER_POINT,
+    CONF_WARNING_DAYS,
+    CONF_WARNING_HOURS,
+    DOMAIN,
+    SERVICE_DELETE_TEMPLATE,
+    SERVICE_GET_DUE,
+    SERVICE_PROJECT_COSTS,
+    SERVICE_REPLACE_DEVICE,
+    SERVICE_SAVE_TEMPLATE,
+    STATUS_NORMAL,
+    STATUS_OVERDUE,
+    STATUS_WARNING,
+)
+from .costs import MAX_PROJECTION_MONTHS, month_starts, project_costs
+from .due_index import async_get_due_index, due_isoformat
+from .models import async_replace_many, build_consumable, consumable_key
+from .templates import async_get_templates
+
+PROJECT_COSTS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_MONTHS, default=12): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_PROJECTION_MONTHS)
+        ),
+    }
+)
+
+GET_DUE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_HORIZON_DAYS): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        vol.Optional(ATTR_DEVICE_ID): cv.string,
+        vol.Optional(ATTR_AREA_ID): cv.string,
+        vol.Optional(ATTR_LABEL_ID): cv.string,
+        vol.Optional(ATTR_STATUS): vol.In(
+            [STATUS_NORMAL, STATUS_WARNING, STATUS_OVERDUE]
+        ),
+    }
+)
+
+# A template, with the ranges of the add consumable form
+SAVE_TEMPLATE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_TEMPLATE_ID): cv.slug,
+        vol.Required(CONF_CONSUMABLE_NAME): cv.string,
+        vol.Required(CONF_LIFETIME_DAYS): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=730)
+        ),
+        vol.Required(CONF_WARNING_DAYS): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=365)
+        ),
+        vol.Optional(CONF_LIFETIME_HOURS): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=8760)
+        ),
+        vol.Optional(CONF_WARNING_HOURS, default=0): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=8759)
+        ),
+        vol.Optional(CONF_COST): vol.All(vol.Coerce(float), vol.Range(min=0)),
+        vol.Optional(CONF_PART_NUMBER): cv.string,
+        vol.Optional(CONF_REORDER_POINT): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=100)
+        ),
+        vol.Optional(CONF_ICON_NORMAL): cv.icon,
+        vol.Optional(CONF_ICON_WARNING): cv.icon,
+        vol.Optional(CONF_ICON_OVERDUE): cv.icon,
+    }
+)
+
+DELETE_TEMPLATE_SCHEMA = vol.Schema({vol.Required(ATTR_TEMPLATE_ID): cv.slug})
+
+REPLACE_DEVICE_SCHEMA = vol.Schema({vol.Required(ATTR_DEVICE_ID): cv.string})
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration's services."""
+
+    @callback
+    def async_project_costs(call: ServiceCall) -> ServiceResponse:
+        """Project the monthly replacement spend of one or all entries."""
+        entries: dict[str, ConsumableTrackerData] = hass.data.get(DOMAIN, {})
+        if (entry_id := call.data.get(ATTR_CONFIG_ENTRY_ID)) is not None:
+            entry = hass.config_entries.async_get_entry(entry_id)
+            if entry is None or entry.domain != DOMAIN:
+                raise HomeAssistantError(f"Unknown config entry {entry_id}")
+            if entry.state is not ConfigEntryState.LOADED:
+                raise HomeAssistantError(f"Config entry {entry.title} is not loaded")
+            entries = {entry_id: entries[entry_id]}
+
+        months = call.data[ATTR_MONTHS]
+        today = dt_util.now().date()
+        spend = project_costs(
+            (
+                (consumable, data.last_replaced.get(consumable_key(device.key, index)))
+                for data in entries.values()
+                for device in data.devices
+                for index, consumable in enumerate(device.consumables)
+            ),
+            today,
+            months,
+        )
+
+        return {
+            "currency": hass.config.currency,
+            "total": round(sum(spend), 2),
+            "months": [
+                {"month": start.strftime("%Y-%m"), "cost": cost}
+                for start, cost in zip(month_starts(today, months), spend, strict=False)
+            ],
+        }
+
+    @callback
+    def async_get_due(call: ServiceCall) -> ServiceResponse:
+        """Return the consumables due within a horizon, soonest first."""
+        entries: dict[str, ConsumableTrackerData] = hass.data.get(DOMAIN, {})
+        device_registry = dr.async_get(hass)
+        entity_registry = er.async_get(hass)
+        horizon = call.data.get(ATTR_HORIZON_DAYS)
+        cutoff = (
+            dt_util.now() + timedelta(days=horizon) if horizon is not None else None
+        )
+        status_filter = call.data.get(ATTR_STATUS)
+        device_filter = call.data.get(ATTR_DEVICE_ID)
+        area_filter = call.data.get(ATTR_AREA_ID)
+        label_filter = call.data.get(ATTR_LABEL_ID)
+
+        consumables = []
+        for _due, entry_id, key in async_get_due_index(hass).due_before(cutoff):
+            data = entries[entry_id]
+            status = data.statuses.get(key)
+            if status_filter is not None and status != status_filter:
+                continue
+
+            device, consumable = data.consumables[key]
+            device_entry = device_registry.async_get_device(
+                identifiers={(DOMAIN, device.key)}
+            )
+            entity_id = data.entity_map.get(key).sensor if data.entity_map else None
+            entity = entity_registry.async_get(entity_id) if entity_id else None
+            if device_filter is not None and (
+                device_entry is None or device_entry.id != device_filter
+            ):
+                continue
+            if area_filter is not None:
+                area_id = entity.area_id if entity is not None else None
+                if area_id is None and device_entry is not None:
+                    area_id = device_entry.area_id
+                if area_id != area_filter:
+                    continue
+            if label_filter is not None:
+                labels = set(entity.labels) if entity is not None else set()
+                if device_entry is not None:
+                    labels |= device_entry.labels
+                if label_filter not in labels:
+                    continue
+
+            consumables.append(
+                {
+                    "entity_id": entity_id,
+                    "device_id": device_entry.id if device_entry else None,
+                    "device": device.name,
+                    "consumable": consumable[CONF_CONSUMABLE_NAME],
+                    "due": due_isoformat(consumable, data.last_replaced[key]),
+                    "status": status,
+                }
+            )
+
+        return {"consumables": consumables}
+
+    @callback
+    def async_replace_device(call: ServiceCall) -> None:
+        """Mark every consumable of a device as replaced now, as one batch."""
+        device_entry = dr.async_get(hass).async_get(call.data[ATTR_DEVICE_ID])
+        device_keys = (
+            {value for domain, value in device_entry.identifiers if domain == DOMAIN}
+            if device_entry is not None
+            else set()
+        )
+        entries: dict[str, ConsumableTrackerData] = hass.data.get(DOMAIN, {})
+        for entry_id, data in entries.items():
+            for device in data.devices:
+                if device.key in device_keys:
+                    async_replace_many(
+                        hass,
+                        entry_id,
+                        [
+                            consumable_key(device.key, index)
+                            for index in range(len(device.consumables))
+                        ],
+                    )
+                    return
+        raise HomeAssistantError("Unknown or unloaded consumable device")
+
+    async def async_save_template(call: ServiceCall) -> None:
+        """Create or update a shared consumable template."""
+        if lifetime_hours := call.data.get(CONF_LIFETIME_HOURS):
+            exceeded = call.data[CONF_WARNING_HOURS] >= lifetime_hours
+        else:
+            exceeded = call.data[CONF_WARNING_DAYS] >= call.data[CONF_LIFETIME_DAYS]
+        if exceeded:
+            raise HomeAssistantError("Warning threshold must be less than lifetime")
+
+        templates = await async_get_templates(hass)
+        templates.async_save(call.data[ATTR_TEMPLATE_ID], build_consumable(call.data))
+
+    async def async_delete_template(call: ServiceCall) -> None:
+        """Delete a shared consumable template no consumable uses."""
+        templates = await async_get_templates(hass)
+        await templates.async_delete(call.data[ATTR_TEMPLATE_ID])
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REPLACE_DEVICE,
+        async_replace_device,
+        schema=REPLACE_DEVICE_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SAVE_TEMPLATE,
+        async_save_template,
+        schema=SAVE_TEMPLATE_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_DELETE_TEMPLATE,
+        async_delete_template,
+        schema=DELETE_TEMPLATE_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_DUE,
+        async_get_due,
+        schema=GET_DUE_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROJECT_COSTS,
+        async_project_costs,
+        schema=PROJECT_COSTS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
@@ -0,0 +1,173 @@
+"""Replacement detection from linked source sensors for Consumable Tracker."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_state_change_event,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from datetime import datetime
+
+    from homeassistant.core import (
+        CALLBACK_TYPE,
+        Event,
+        EventStateChangedData,
+        HomeAssistant,
+        State,
+    )
+
+    from .models import ConsumableTrackerData
+
+from .const import (
+    CONF_CONSUMABLE_NAME,
+    CONF_SOURCE_ENTITY,
+    DOMAIN,
+    SIGNAL_SOURCE_UPDATED,
+)
+from .models import async_replace
+
+_LOGGER = logging.getLogger(__name__)
+
+# The source has to drop below this level before a reset can be detected
+REARM_BELOW = 80.0
+# A rearmed source counts as reset once back at or above this level
+RESET_ABOVE = 95.0
+# Seconds a reset has to hold before it is recorded as a replacement
+RESET_DELAY = 30
+# Seconds between mirrored values reaching the sensor
+MIRROR_COOLDOWN = 60
+
+
+def _source_level(state: State | None) -> float | None:
+    """Return the remaining life reported by a source state, if any."""
+    if state is None:
+        return None
+    try:
+        return float(state.state)
+    except ValueError:
+        return None
+
+
+class ConsumableSource:
+    """A consumable's linked source sensor reporting its remaining life.
+
+    A replacement is recorded when the source resets: it must first drop below
+    REARM_BELOW, then climb back to RESET_ABOVE and stay there for RESET_DELAY.
+    The gap between the two levels keeps a noisy source from recording a
+    replacement twice, and the delay skips brief glitches to full.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        key: str,
+        consumable: Mapping[str, Any],
+    ) -> None:
+        """Initialize the source."""
+        self._hass = hass
+        self._entry_id = entry_id
+        self._key = key
+        self._consumable = consumable
+        self._entity_id: str = consumable[CONF_SOURCE_ENTITY]
+        self._armed = False
+        self._unsub_reset: CALLBACK_TYPE | None = None
+        # The sensor is written at most once per cooldown, however often the
+        # source updates
+        self._mirror = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=MIRROR_COOLDOWN,
+            immediate=True,
+            function=self._async_mirror,
+        )
+
+    @property
+    def _data(self) -> ConsumableTrackerData:
+        """Return the runtime data of the consumable's entry."""
+        return self._hass.data[DOMAIN][self._entry_id]
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Follow the source until the returned callback is called."""
+        level = _source_level(self._hass.states.get(self._entity_id))
+        if level is not None:
+            # The current level is only a starting point, never a reset
+            self._data.source_levels[self._key] = level
+            self._armed = level < REARM_BELOW
+
+        unsub = async_track_state_change_event(
+            self._hass, [self._entity_id], self._handle_state_change
+        )
+
+        @callback
+        def async_stop() -> None:
+            """Stop following the source."""
+            unsub()
+            self._async_cancel_reset()
+            self._mirror.async_shutdown()
+
+        return async_stop
+
+    @callback
+    def _handle_state_change(self, event: Event[EventStateChangedData]) -> None:
+        """Handle the source reporting a new level."""
+        level = _source_level(event.data["new_state"])
+        if level is None:
+            return
+
+        self._data.source_levels[self._key] = level
+        self._mirror.async_schedule_call()
+
+        if level < REARM_BELOW:
+            self._armed = True
+        if level < RESET_ABOVE:
+            self._async_cancel_reset()
+        elif self._armed and self._unsub_reset is None:
+            self._unsub_reset = async_call_later(
+                self._hass, RESET_DELAY, self._handle_reset
+            )
+
+    @callback
+    def _handle_reset(self, now: datetime) -> None:
+        """Record a replacement once the source has held its reset."""
+        self._unsub_reset = None
+        self._armed = False
+        self._hass.async_create_task(self._async_replace())
+
+    async def _async_replace(self) -> None:
+        """Mark the consumable as replaced, logging a failure.
+
+        Nothing awaits the task, so an error raised here would go unhandled.
+        """
+        try:
+            await async_replace(self._hass, self._entry_id, self._key, self._consumable)
+        except HomeAssistantError as err:
+            _LOGGER.error(
+                "Could not record the replacement of %s reported by %s: %s",
+                self._consumable[CONF_CONSUMABLE_NAME],
+                self._entity_id,
+                err,
+            )
+
+    @callback
+    def _async_cancel_reset(self) -> None:
+        """Cancel a pending reset."""
+        if self._unsub_reset is not None:
+            self._unsub_reset()
+            self._unsub_reset = None
+
+    @callback
+    def _async_mirror(self) -> None:
+        """Tell the consumable's sensor about the source's level."""
+        async_dispatcher_send(self._hass, SIGNAL_SOURCE_UPDATED.format(self._key))
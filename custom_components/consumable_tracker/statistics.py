@@ -0,0 +1,72 @@
+"""Long-term statistics for Consumable Tracker."""
+
+from __future__ import annotations
+
+from collections import Counter
+from datetime import date, datetime
+from typing import TYPE_CHECKING
+
+from homeassistant.components.recorder.models import (
+    StatisticData,
+    StatisticMeanType,
+    StatisticMetaData,
+)
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+)
+from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+
+def replacements_statistic_id(key: str) -> str:
+    """Return the ID of the statistic counting a consumable's replacements."""
+    return f"{DOMAIN}:{key.lower()}_replacements"
+
+
+@callback
+def async_import_replacements(
+    hass: HomeAssistant, key: str, name: str, replacements: Iterable[date]
+) -> None:
+    """Import a consumable's replacement history as external statistics.
+
+    Each hour with replacements becomes one row holding the running count of
+    replacements, and the whole history is queued as a single recorder job.
+    """
+    if "recorder" not in hass.config.components:
+        raise HomeAssistantError("Importing replacements requires the recorder")
+
+    # Statistics are hourly, so count the replacements per hour
+    per_hour: Counter[datetime] = Counter()
+    for replaced in replacements:
+        if isinstance(replaced, datetime):
+            start = dt_util.as_local(replaced).replace(
+                minute=0, second=0, microsecond=0
+            )
+        else:
+            start = dt_util.start_of_local_day(replaced)
+        per_hour[start] += 1
+
+    statistics = []
+    total = 0
+    for start in sorted(per_hour):
+        total += per_hour[start]
+        statistics.append(StatisticData(start=start, state=total, sum=total))
+
+    metadata = StatisticMetaData(
+        has_sum=True,
+        mean_type=StatisticMeanType.NONE,
+        name=f"{name} replacements",
+        source=DOMAIN,
+        statistic_id=replacements_statistic_id(key),
+        unit_class=None,
+        unit_of_measurement=None,
+    )
+    async_add_external_statistics(hass, metadata, statistics)
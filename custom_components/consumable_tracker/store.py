@@ -0,0 +1,242 @@
+"""Persistent storage for Consumable Tracker config entries."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import callback
+from homeassistant.helpers.storage import Store
+
+if TYPE_CHECKING:
+    from collections.abc import MutableMapping
+
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+from .const import (
+    CONF_CONSUMABLES,
+    CONF_DEVICES,
+    CONF_STORAGE_KEY,
+    DOMAIN,
+)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 10
+
+DATA_STORES = f"{DOMAIN}_stores"
+DATA_LAST_REPLACED_STORES = f"{DOMAIN}_last_replaced_stores"
+DATA_HISTORY_STORES = f"{DOMAIN}_history_stores"
+DATA_METER_STORES = f"{DOMAIN}_meter_stores"
+DATA_WEAR_STORES = f"{DOMAIN}_wear_stores"
+
+# Entry data keys that hold consumable definitions before they move to a store
+DEFINITION_KEYS = (CONF_CONSUMABLES, CONF_DEVICES)
+
+
+class ConsumableTrackerStore:
+    """Store holding one kind of a config entry's data, such as its definitions.
+
+    Each kind lives in its own small file, so changing it rewrites just that
+    file rather than every integration's config entries.
+    """
+
+    def __init__(self, hass: HomeAssistant, key: str) -> None:
+        """Initialize the store."""
+        self.key = key
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, key)
+        self.data: dict[str, Any] | None = None
+
+    async def async_load(self) -> dict[str, Any]:
+        """Load the stored data, keeping it in memory across reloads."""
+        if self.data is None:
+            self.data = await self._store.async_load() or {}
+        return self.data
+
+    async def async_save(self, data: dict[str, Any]) -> None:
+        """Replace the stored data and write it immediately."""
+        self.data = data
+        await self._store.async_save(data)
+
+    @callback
+    def async_set_data(self, data: dict[str, Any]) -> None:
+        """Replace the stored data and schedule a delayed write."""
+        self.data = data
+        self.async_schedule_save()
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Schedule a delayed write of the in-memory data."""
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to write."""
+        return self.data or {}
+
+    async def async_remove(self) -> None:
+        """Remove the stored data."""
+        self.data = None
+        await self._store.async_remove()
+
+
+@callback
+def async_get_store(hass: HomeAssistant, entry: ConfigEntry) -> ConsumableTrackerStore:
+    """Return the store of a config entry, sharing one instance per entry."""
+    stores: dict[str, ConsumableTrackerStore] = hass.data.setdefault(DATA_STORES, {})
+    if entry.entry_id not in stores:
+        key = entry.data.get(CONF_STORAGE_KEY, f"{DOMAIN}.{entry.entry_id}")
+        stores[entry.entry_id] = ConsumableTrackerStore(hass, key)
+    return stores[entry.entry_id]
+
+
+@callback
+def async_get_last_replaced_store(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> ConsumableTrackerStore:
+    """Return the store of a lightweight entry's last replaced values."""
+    return _async_get_entry_store(
+        hass, DATA_LAST_REPLACED_STORES, entry, "last_replaced"
+    )
+
+
+@callback
+def async_get_history_store(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> ConsumableTrackerStore:
+    """Return the store of an entry's previous last replaced values."""
+    return _async_get_entry_store(hass, DATA_HISTORY_STORES, entry, "history")
+
+
+@callback
+def async_get_meter_store(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> ConsumableTrackerStore:
+    """Return the store of an entry's metered consumption."""
+    return _async_get_entry_store(hass, DATA_METER_STORES, entry, "meters")
+
+
+@callback
+def async_get_wear_store(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> ConsumableTrackerStore:
+    """Return the store of an entry's wear estimates."""
+    return _async_get_entry_store(hass, DATA_WEAR_STORES, entry, "wear")
+
+
+@callback
+def _async_get_entry_store(
+    hass: HomeAssistant, data_key: str, entry: ConfigEntry, suffix: str
+) -> ConsumableTrackerStore:
+    """Return a store of a config entry, sharing one instance per entry."""
+    stores: dict[str, ConsumableTrackerStore] = hass.data.setdefault(data_key, {})
+    if entry.entry_id not in stores:
+        key = f"{DOMAIN}.{entry.entry_id}.{suffix}"
+        stores[entry.entry_id] = ConsumableTrackerStore(hass, key)
+    return stores[entry.entry_id]
+
+
+async def async_load_definitions(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return a config entry's consumable definitions.
+
+    Entries that were not moved to a store yet still keep them in their data.
+    """
+    if CONF_STORAGE_KEY not in entry.data:
+        return {key: entry.data[key] for key in DEFINITION_KEYS if key in entry.data}
+    return await async_get_store(hass, entry).async_load()
+
+
+async def async_migrate_definitions(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Move consumable definitions from the entry data into its store."""
+    if CONF_STORAGE_KEY not in entry.data:
+        await _async_move_to_store(
+            hass, entry, await async_load_definitions(hass, entry)
+        )
+
+
+async def async_save_definitions(
+    hass: HomeAssistant, entry: ConfigEntry, definitions: dict[str, Any]
+) -> None:
+    """Save a config entry's consumable definitions and apply them."""
+    if CONF_STORAGE_KEY not in entry.data:
+        await _async_move_to_store(hass, entry, definitions)
+        return
+
+    async_get_store(hass, entry).async_set_data(definitions)
+    if entry.state is ConfigEntryState.LOADED:
+        hass.config_entries.async_schedule_reload(entry.entry_id)
+
+
+async def async_move_consumable_data(
+    hass: HomeAssistant, entry: ConfigEntry, moves: dict[str, str | None]
+) -> None:
+    """Move the data kept by consumable key when consumables change keys.
+
+    Keys moved to None belong to deleted consumables and are dropped, while
+    keys that are not moved stay as they are.
+    """
+    for store in (
+        async_get_last_replaced_store(hass, entry),
+        async_get_history_store(hass, entry),
+        async_get_meter_store(hass, entry),
+        async_get_wear_store(hass, entry),
+    ):
+        stored = await store.async_load()
+        if not moves.keys() & stored.keys():
+            continue
+        moved: dict[str, Any] = {}
+        for key, value in stored.items():
+            if (new_key := moves.get(key, key)) is not None:
+                moved[new_key] = value
+        store.async_set_data(moved)
+
+
+@callback
+def async_update_consumable(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    consumable: MutableMapping[str, Any],
+    changes: dict[str, Any],
+) -> None:
+    """Change a stored consumable in place and save it without a reload.
+
+    The consumable must be one of the definitions the entry was set up with,
+    which are the store's in-memory data.
+    """
+    consumable.update(changes)
+    async_get_store(hass, entry).async_schedule_save()
+
+
+async def _async_move_to_store(
+    hass: HomeAssistant, entry: ConfigEntry, definitions: dict[str, Any]
+) -> None:
+    """Write definitions to the store and leave only a pointer in the entry."""
+    store = async_get_store(hass, entry)
+    await store.async_save(definitions)
+    hass.config_entries.async_update_entry(
+        entry,
+        data={
+            **{
+                key: value
+                for key, value in entry.data.items()
+                if key not in DEFINITION_KEYS
+            },
+            CONF_STORAGE_KEY: store.key,
+        },
+    )
+
+
+async def async_remove_store(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stores of a deleted config entry."""
+    await async_get_store(hass, entry).async_remove()
+    hass.data[DATA_STORES].pop(entry.entry_id, None)
+    await async_get_last_replaced_store(hass, entry).async_remove()
+    hass.data[DATA_LAST_REPLACED_STORES].pop(entry.entry_id, None)
+    await async_get_history_store(hass, entry).async_remove()
+    hass.data[DATA_HISTORY_STORES].pop(entry.entry_id, None)
+    await async_get_meter_store(hass, entry).async_remove()
+    hass.data[DATA_METER_STORES].pop(entry.entry_id, None)
+    await async_get_wear_store(hass, entry).async_remove()
+    hass.data[DATA_WEAR_STORES].pop(entry.entry_id, None)
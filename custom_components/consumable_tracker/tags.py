@@ -0,0 +1,103 @@
+"""NFC tag bindings for Consumable Tracker."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.tag import EVENT_TAG_SCANNED, TAG_ID
+from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant
+
+from .const import CONF_CONSUMABLE_NAME, CONF_TAGS, DOMAIN
+from .models import async_replace
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_TAG_INDEX = f"{DOMAIN}_tag_index"
+
+
+class ConsumableTagIndex:
+    """Consumables of all config entries, indexed by the tags bound to them.
+
+    A single tag_scanned listener serves every entry, and a scan looks up its
+    tag instead of going through the consumables. Each consumable adds and
+    removes only its own bindings, so reloading an entry after its tags were
+    edited leaves other entries' bindings alone.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        self._hass = hass
+        # Tag ID -> (entry ID, consumable key) -> consumable
+        self._tags: dict[str, dict[tuple[str, str], Mapping[str, Any]]] = {}
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_register(
+        self, entry_id: str, key: str, consumable: Mapping[str, Any]
+    ) -> CALLBACK_TYPE:
+        """Bind a consumable to its tags until unregistered."""
+        tags: list[str] = consumable[CONF_TAGS]
+        for tag in tags:
+            self._tags.setdefault(tag, {})[(entry_id, key)] = consumable
+        if self._unsub is None:
+            self._unsub = self._hass.bus.async_listen(
+                EVENT_TAG_SCANNED, self._handle_tag_scanned
+            )
+
+        @callback
+        def async_unregister() -> None:
+            """Remove the consumable's bindings."""
+            for tag in tags:
+                bound = self._tags[tag]
+                bound.pop((entry_id, key), None)
+                if not bound:
+                    del self._tags[tag]
+            if not self._tags and self._unsub is not None:
+                self._unsub()
+                self._unsub = None
+
+        return async_unregister
+
+    @callback
+    def _handle_tag_scanned(self, event: Event[Mapping[str, Any]]) -> None:
+        """Mark the consumables bound to a scanned tag as replaced."""
+        tag_id: str | None = event.data.get(TAG_ID)
+        if tag_id is None:
+            return
+        for (entry_id, key), consumable in self._tags.get(tag_id, {}).items():
+            self._hass.async_create_task(
+                self._async_replace(tag_id, entry_id, key, consumable)
+            )
+
+    async def _async_replace(
+        self, tag_id: str, entry_id: str, key: str, consumable: Mapping[str, Any]
+    ) -> None:
+        """Mark a consumable as replaced, logging a failure.
+
+        Each bound consumable has its own task, so one failing doesn't stop
+        the others, and nothing awaits the tasks to handle an error.
+        """
+        try:
+            await async_replace(self._hass, entry_id, key, consumable)
+        except HomeAssistantError as err:
+            _LOGGER.error(
+                "Could not mark %s as replaced when tag %s was scanned: %s",
+                consumable[CONF_CONSUMABLE_NAME],
+                tag_id,
+                err,
+            )
+
+
+@callback
+def async_get_tag_index(hass: HomeAssistant) -> ConsumableTagIndex:
+    """Return the tag index shared by all config entries."""
+    if DATA_TAG_INDEX not in hass.data:
+        hass.data[DATA_TAG_INDEX] = ConsumableTagIndex(hass)
+    return hass.data[DATA_TAG_INDEX]
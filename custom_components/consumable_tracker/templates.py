@@ -0,0 +1,155 @@
+"""Shared consumable templates for Consumable Tracker."""
+
+from __future__ import annotations
+
+from collections import ChainMap
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+from homeassistant.exceptions import ConfigEntryError, HomeAssistantError
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+if TYPE_CHECKING:
+    from collections.abc import MutableMapping
+
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+
+from .const import (
+    CONF_CONSUMABLE_NAME,
+    CONF_PART_NUMBER,
+    CONF_TEMPLATE,
+    DOMAIN,
+    SIGNAL_CONSUMABLE_UPDATED,
+)
+from .models import entry_devices, uses_hours
+from .store import ConsumableTrackerStore, async_load_definitions
+
+DATA_TEMPLATES = f"{DOMAIN}_templates"
+STORAGE_KEY = f"{DOMAIN}.templates"
+
+
+class ConsumableTemplates:
+    """Consumable definitions stored once and shared by any number of devices.
+
+    A device's consumable refers to a template by ID and keeps only the fields
+    it overrides. It is resolved to a view over its overrides and the template
+    rather than a copy, so every consumable using a template sees an edit to it
+    at once, and settings changed on a device land in its overrides.
+    """
+
+    def __init__(self, hass: HomeAssistant, store: ConsumableTrackerStore) -> None:
+        """Initialize the templates."""
+        self._hass = hass
+        self._store = store
+        # Template ID -> (entry ID, consumable key) of the consumables using it
+        self._users: dict[str, set[tuple[str, str]]] = {}
+
+    async def async_load(self) -> None:
+        """Load the stored templates."""
+        await self._store.async_load()
+
+    @property
+    def _templates(self) -> dict[str, dict[str, Any]]:
+        """Return the stored templates."""
+        assert self._store.data is not None
+        return self._store.data
+
+    def names(self) -> dict[str, str]:
+        """Return the name of each template by ID."""
+        return {
+            template_id: template[CONF_CONSUMABLE_NAME]
+            for template_id, template in self._templates.items()
+        }
+
+    def get(self, template_id: str) -> dict[str, Any] | None:
+        """Return a template."""
+        return self._templates.get(template_id)
+
+    def resolve(self, consumable: dict[str, Any]) -> MutableMapping[str, Any]:
+        """Return a consumable with the fields of its template filled in."""
+        if (template_id := consumable.get(CONF_TEMPLATE)) is None:
+            return consumable
+        if (template := self._templates.get(template_id)) is None:
+            raise ConfigEntryError(f"Consumable template {template_id} does not exist")
+        return ChainMap(consumable, template)
+
+    @callback
+    def async_register(
+        self, entry_id: str, key: str, template_id: str
+    ) -> CALLBACK_TYPE:
+        """Note that a consumable uses a template until unregistered."""
+        self._users.setdefault(template_id, set()).add((entry_id, key))
+
+        @callback
+        def async_unregister() -> None:
+            """Forget the consumable."""
+            users = self._users[template_id]
+            users.discard((entry_id, key))
+            if not users:
+                del self._users[template_id]
+
+        return async_unregister
+
+    @callback
+    def async_save(self, template_id: str, definition: dict[str, Any]) -> None:
+        """Create a template, or update one and the consumables using it.
+
+        Changes that create or name entities, or track other stock, reload the
+        entries using the template. Otherwise the template is updated in place
+        and its consumables are refreshed without a reload.
+        """
+        template = self._templates.get(template_id)
+        if template is None:
+            self._templates[template_id] = definition
+            self._store.async_schedule_save()
+            return
+
+        reload = (
+            uses_hours(template) != uses_hours(definition)
+            or template[CONF_CONSUMABLE_NAME] != definition[CONF_CONSUMABLE_NAME]
+            or template.get(CONF_PART_NUMBER) != definition.get(CONF_PART_NUMBER)
+        )
+        template.clear()
+        template.update(definition)
+        self._store.async_schedule_save()
+
+        users = self._users.get(template_id, set())
+        if reload:
+            for entry_id in {entry_id for entry_id, _ in users}:
+                self._hass.config_entries.async_schedule_reload(entry_id)
+            return
+        for _, key in users:
+            async_dispatcher_send(self._hass, SIGNAL_CONSUMABLE_UPDATED.format(key))
+
+    async def async_delete(self, template_id: str) -> None:
+        """Delete a template no consumable uses.
+
+        The stored definitions of every entry are checked, not just the loaded
+        ones, so an entry that is disabled or failed to set up can't be left
+        referring to a template that no longer exists.
+        """
+        if template_id not in self._templates:
+            raise HomeAssistantError(f"Unknown consumable template {template_id}")
+        for entry in self._hass.config_entries.async_entries(DOMAIN):
+            definitions = await async_load_definitions(self._hass, entry)
+            if any(
+                consumable.get(CONF_TEMPLATE) == template_id
+                for device in entry_devices(entry, definitions)
+                for consumable in device.consumables
+            ):
+                raise HomeAssistantError(
+                    f"Consumable template {template_id} is still in use by "
+                    f"{entry.title}"
+                )
+        self._templates.pop(template_id, None)
+        self._store.async_schedule_save()
+
+
+async def async_get_templates(hass: HomeAssistant) -> ConsumableTemplates:
+    """Return the consumable templates shared by all config entries."""
+    templates: ConsumableTemplates | None = hass.data.get(DATA_TEMPLATES)
+    if templates is None:
+        store = ConsumableTrackerStore(hass, STORAGE_KEY)
+        templates = hass.data[DATA_TEMPLATES] = ConsumableTemplates(hass, store)
+    await templates.async_load()
+    return templates
@@ -0,0 +1,184 @@
+"""Wear estimation from degradation signals for Consumable Tracker."""
+
+from __future__ import annotations
+
+import logging
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.dispatcher import (
+    async_dispatcher_connect,
+    async_dispatcher_send,
+)
+from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.util import dt as dt_util
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from homeassistant.core import (
+        CALLBACK_TYPE,
+        Event,
+        EventStateChangedData,
+        HomeAssistant,
+        State,
+    )
+
+    from .store import ConsumableTrackerStore
+
+from .const import (
+    CONF_WEAR_ENTITY,
+    CONF_WEAR_THRESHOLD,
+    SIGNAL_REPLACED,
+    SIGNAL_WEAR_UPDATED,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Samples needed before the fit is trusted
+MIN_SAMPLES = 10
+# Seconds between estimates reaching the sensor
+REFRESH_COOLDOWN = 60
+
+ATTR_ORIGIN = "origin"
+# Running sums of the samples, with t in days since the origin and y the signal
+SUMS = ("n", "t", "y", "tt", "ty")
+
+
+def _signal_level(state: State | None) -> float | None:
+    """Return the level reported by a signal state, if any."""
+    if state is None:
+        return None
+    try:
+        return float(state.state)
+    except ValueError:
+        return None
+
+
+class ConsumableWear:
+    """Wear of a consumable, estimated from a signal that degrades with use.
+
+    A straight line is fitted to the signal over time since the replacement,
+    such as a filter's rising pressure drop, and extended to the failure
+    threshold. Only the running sums of the samples are kept, so each sample is
+    a constant time update however many came before it. The sums are
+    checkpointed in the entry's wear store, keyed by consumable.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        key: str,
+        consumable: Mapping[str, Any],
+        store: ConsumableTrackerStore,
+    ) -> None:
+        """Initialize the wear estimate."""
+        self._hass = hass
+        self._key = key
+        self._consumable = consumable
+        self._store = store
+        self._entity_id: str = consumable[CONF_WEAR_ENTITY]
+        # The sensor is refreshed at most once per cooldown, however often the
+        # signal updates
+        self._refresh = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=REFRESH_COOLDOWN,
+            immediate=True,
+            function=self._async_notify,
+        )
+
+    @property
+    def _state(self) -> dict[str, Any]:
+        """Return the stored fit of the consumable."""
+        assert self._store.data is not None
+        if self._key not in self._store.data:
+            self._store.data[self._key] = _empty_fit()
+        return self._store.data[self._key]
+
+    def remaining(self) -> timedelta | None:
+        """Return how long until the fitted signal reaches the threshold.
+
+        The threshold's side of the signal at the replacement sets which way is
+        wear, so both rising signals (pressure drop) and falling ones (airflow)
+        work. A signal that isn't trending towards the threshold has no
+        estimate.
+        """
+        fit = self._state
+        n, t, y, tt, ty = (fit[name] for name in SUMS)
+        denominator = n * tt - t * t
+        if n < MIN_SAMPLES or denominator <= 0:
+            return None
+        slope = (n * ty - t * y) / denominator
+        intercept = (y - slope * t) / n
+
+        threshold = self._consumable[CONF_WEAR_THRESHOLD]
+        direction = threshold - intercept
+        if slope * direction <= 0:
+            return None
+        now = (dt_util.utcnow().timestamp() - fit[ATTR_ORIGIN]) / 86400
+        gap = threshold - (intercept + slope * now)
+        if gap * direction <= 0:
+            return timedelta(0)
+        return timedelta(days=gap / slope)
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Follow the signal until the returned callback is called."""
+        unsubs = [
+            async_track_state_change_event(
+                self._hass, [self._entity_id], self._handle_state_change
+            ),
+            async_dispatcher_connect(
+                self._hass, SIGNAL_REPLACED.format(self._key), self._handle_replaced
+            ),
+        ]
+
+        @callback
+        def async_stop() -> None:
+            """Stop following the signal."""
+            for unsub in unsubs:
+                unsub()
+            self._refresh.async_shutdown()
+
+        return async_stop
+
+    @callback
+    def _handle_state_change(self, event: Event[EventStateChangedData]) -> None:
+        """Add a sample of the signal."""
+        level = _signal_level(event.data["new_state"])
+        if level is None:
+            return
+
+        fit = self._state
+        now = dt_util.utcnow().timestamp()
+        if fit[ATTR_ORIGIN] is None:
+            fit[ATTR_ORIGIN] = now
+        days = (now - fit[ATTR_ORIGIN]) / 86400
+        fit["n"] += 1
+        fit["t"] += days
+        fit["y"] += level
+        fit["tt"] += days * days
+        fit["ty"] += days * level
+        self._store.async_schedule_save()
+        self._refresh.async_schedule_call()
+
+    @callback
+    def _handle_replaced(self) -> None:
+        """Start a new fit for the new consumable."""
+        assert self._store.data is not None
+        self._store.data[self._key] = _empty_fit()
+        self._store.async_schedule_save()
+        self._async_notify()
+
+    @callback
+    def _async_notify(self) -> None:
+        """Tell the consumable's sensor its estimate changed."""
+        async_dispatcher_send(self._hass, SIGNAL_WEAR_UPDATED.format(self._key))
+
+
+def _empty_fit() -> dict[str, Any]:
+    """Return a fit without samples."""
+    return {ATTR_ORIGIN: None, **dict.fromkeys(SUMS, 0.0)}
@@ -0,0 +1,108 @@
+"""WebSocket API for Consumable Tracker."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+from homeassistant.components import websocket_api
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .models import ConsumableTrackerData
+
+from .const import ATTR_CONFIG_ENTRY_ID, DOMAIN, SIGNAL_SNAPSHOT_UPDATED
+
+
+@callback
+def async_setup_websocket_api(hass: HomeAssistant) -> None:
+    """Register the integration's websocket commands."""
+    websocket_api.async_register_command(hass, websocket_snapshots)
+    websocket_api.async_register_command(hass, websocket_subscribe_snapshots)
+
+
+def _snapshots(
+    hass: HomeAssistant, entry_id: str | None
+) -> list[dict[str, Any]] | None:
+    """Return the snapshots of one or all loaded entries, or None if unknown.
+
+    Snapshots are kept up to date by the consumables' sensors, so nothing is
+    computed or read from the state machine here.
+    """
+    entries: dict[str, ConsumableTrackerData] = hass.data.get(DOMAIN, {})
+    if entry_id is not None:
+        if entry_id not in entries:
+            return None
+        entries = {entry_id: entries[entry_id]}
+    return [
+        snapshot for data in entries.values() for snapshot in data.snapshots.values()
+    ]
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/snapshots",
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): str,
+    }
+)
+@callback
+def websocket_snapshots(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return the snapshots of every consumable of one or all entries."""
+    snapshots = _snapshots(hass, msg.get(ATTR_CONFIG_ENTRY_ID))
+    if snapshots is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Config entry not loaded"
+        )
+        return
+    connection.send_result(msg["id"], {"consumables": snapshots})
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/subscribe_snapshots",
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): str,
+    }
+)
+@callback
+def websocket_subscribe_snapshots(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Send the snapshots of one or all entries, then each one that changes.
+
+    The first event holds every snapshot. Later events hold only the snapshots
+    that changed, or the IDs of consumables that were removed.
+    """
+    entry_id = msg.get(ATTR_CONFIG_ENTRY_ID)
+    snapshots = _snapshots(hass, entry_id)
+    if snapshots is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Config entry not loaded"
+        )
+        return
+
+    @callback
+    def async_snapshot_updated(
+        updated_entry_id: str, key: str, snapshot: dict[str, Any] | None
+    ) -> None:
+        """Forward a changed or removed snapshot."""
+        if entry_id is not None and updated_entry_id != entry_id:
+            return
+        event = {"removed": [key]} if snapshot is None else {"changed": [snapshot]}
+        connection.send_message(websocket_api.event_message(msg["id"], event))
+
+    connection.subscriptions[msg["id"]] = async_dispatcher_connect(
+        hass, SIGNAL_SNAPSHOT_UPDATED, async_snapshot_updated
+    )
+    connection.send_result(msg["id"])
+    connection.send_message(
+        websocket_api.event_message(msg["id"], {"consumables": snapshots})
+    )
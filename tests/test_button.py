@@ -2,8 +2,11 @@
 
 from datetime import date
 
+import pytest
 from freezegun import freeze_time
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, State
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import device_registry as dr
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.consumable_tracker.const import (
@@ -14,7 +17,10 @@ from custom_components.consumable_tracker.const import (
     CONF_ICON_OVERDUE,
     CONF_ICON_WARNING,
     CONF_LIFETIME_DAYS,
+    CONF_LIFETIME_HOURS,
+    CONF_LIGHTWEIGHT,
     CONF_WARNING_DAYS,
+    CONF_WARNING_HOURS,
     DEFAULT_ICON_NORMAL,
     DEFAULT_ICON_OVERDUE,
     DEFAULT_ICON_WARNING,
@@ -22,7 +28,16 @@ from custom_components.consumable_tracker.const import (
 )
 
 
-async def setup_integration(hass: HomeAssistant) -> MockConfigEntry:
+def get_state(hass: HomeAssistant, entity_id: str) -> State:
+    """Return the state of an entity, which must exist."""
+    state = hass.states.get(entity_id)
+    assert state is not None
+    return state
+
+
+async def setup_integration(
+    hass: HomeAssistant, extra: list[dict] | None = None, lightweight: bool = False
+) -> MockConfigEntry:
     """Set up the integration with a config entry."""
     entry = MockConfigEntry(
         version=2,
@@ -39,7 +54,9 @@ async def setup_integration(hass: HomeAssistant) -> MockConfigEntry:
                     CONF_ICON_WARNING: DEFAULT_ICON_WARNING,
                     CONF_ICON_OVERDUE: DEFAULT_ICON_OVERDUE,
                 },
+                *(extra or []),
             ],
+            CONF_LIGHTWEIGHT: lightweight,
         },
         unique_id="test_device",
     )
@@ -57,7 +74,7 @@ async def test_button_exists(hass: HomeAssistant) -> None:
     assert state is not None
 
 
-@freeze_time("2026-01-15")
+@freeze_time("2026-01-15 20:00:00")
 async def test_button_press_sets_date_to_today(hass: HomeAssistant) -> None:
     """Test pressing button sets date entity to today."""
     await setup_integration(hass)
@@ -81,7 +98,7 @@ async def test_button_press_sets_date_to_today(hass: HomeAssistant) -> None:
     assert date_entity.native_value == date(2026, 1, 15)
 
 
-@freeze_time("2026-01-15")
+@freeze_time("2026-01-15 20:00:00")
 async def test_button_press_updates_sensor(hass: HomeAssistant) -> None:
     """Test pressing button updates the sensor value."""
     await setup_integration(hass)
@@ -105,3 +122,75 @@ async def test_button_press_updates_sensor(hass: HomeAssistant) -> None:
 
     # Sensor should now show 90 days (just replaced today)
     assert sensor_entity.native_value == 90
+
+
+PUMP = {
+    CONF_CONSUMABLE_NAME: "Pump Seal",
+    CONF_LIFETIME_DAYS: 2,
+    CONF_WARNING_DAYS: 0,
+    CONF_LIFETIME_HOURS: 48,
+    CONF_WARNING_HOURS: 6,
+    CONF_ICON_NORMAL: DEFAULT_ICON_NORMAL,
+    CONF_ICON_WARNING: DEFAULT_ICON_WARNING,
+    CONF_ICON_OVERDUE: DEFAULT_ICON_OVERDUE,
+}
+
+
+@freeze_time("2026-01-15 12:00:00")
+async def test_device_button_replaces_all(hass: HomeAssistant) -> None:
+    """Test the device button replaces every consumable, keeping undo history."""
+    await setup_integration(hass, [PUMP])
+
+    await hass.services.async_call(
+        "button",
+        "press",
+        {"entity_id": "button.test_device_mark_all_as_replaced"},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+
+    assert get_state(hass, "date.test_device_test_filter_last_replaced").state == (
+        "2026-01-15"
+    )
+    assert get_state(hass, "datetime.test_device_pump_seal_last_replaced").state == (
+        "2026-01-15T12:00:00+00:00"
+    )
+    assert get_state(hass, "sensor.test_device_pump_seal_hours_remaining").state == (
+        "48"
+    )
+
+    await hass.services.async_call(
+        DOMAIN,
+        "undo_replaced",
+        {"entity_id": "sensor.test_device_test_filter_days_remaining"},
+        blocking=True,
+    )
+    assert get_state(hass, "date.test_device_test_filter_last_replaced").state == (
+        "unknown"
+    )
+
+
+@freeze_time("2026-01-15 20:00:00")
+async def test_replace_device_service(hass: HomeAssistant) -> None:
+    """Test the service replaces every consumable of a lightweight entry."""
+    entry = await setup_integration(hass, [dict(PUMP)], lightweight=True)
+    device = dr.async_get(hass).async_get_device(identifiers={(DOMAIN, entry.entry_id)})
+    assert device is not None
+    data = hass.data[DOMAIN][entry.entry_id]
+
+    with pytest.raises(HomeAssistantError, match="Unknown"):
+        await hass.services.async_call(
+            DOMAIN, "replace_device", {"device_id": "missing"}, blocking=True
+        )
+
+    await hass.services.async_call(
+        DOMAIN, "replace_device", {"device_id": device.id}, blocking=True
+    )
+
+    assert data.last_replaced_store.data == {
+        f"{entry.entry_id}_consumable_0": "2026-01-15",
+        f"{entry.entry_id}_consumable_1": "2026-01-15T20:00:00+00:00",
+    }
+    assert get_state(hass, "sensor.test_device_test_filter_days_remaining").state == (
+        "90"
+    )
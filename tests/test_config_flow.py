@@ -1,19 +1,40 @@
 """Tests for the Consumable Tracker config flow."""
 
 import pytest
+from freezegun import freeze_time
 from homeassistant import config_entries
 from homeassistant.core import HomeAssistant
-from homeassistant.data_entry_flow import FlowResultType
+from homeassistant.data_entry_flow import FlowResultType, InvalidData
+from homeassistant.helpers import entity_registry as er
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
+from custom_components.consumable_tracker.config_flow import PAGE_SIZE
 from custom_components.consumable_tracker.const import (
+    CONF_BULK_ADD,
     CONF_CONSUMABLE_NAME,
     CONF_CONSUMABLES,
+    CONF_COST,
     CONF_DEVICE_NAME,
+    CONF_DEVICE_UID,
+    CONF_DEVICES,
+    CONF_HUB,
+    CONF_ICON_NORMAL,
+    CONF_ICON_OVERDUE,
+    CONF_ICON_WARNING,
     CONF_LIFETIME_DAYS,
+    CONF_LIFETIME_HOURS,
+    CONF_LIGHTWEIGHT,
+    CONF_PART_NUMBER,
+    CONF_REORDER_POINT,
+    CONF_SEARCH,
+    CONF_STORAGE_KEY,
     CONF_WARNING_DAYS,
+    DEFAULT_ICON_NORMAL,
+    DEFAULT_ICON_OVERDUE,
+    DEFAULT_ICON_WARNING,
     DOMAIN,
 )
+from custom_components.consumable_tracker.store import async_load_definitions
 
 
 @pytest.fixture
@@ -73,6 +94,56 @@ async def test_user_flow_creates_entry(hass: HomeAssistant) -> None:
     assert result["data"]["consumables"][0][CONF_CONSUMABLE_NAME] == "Test Filter"
 
 
+async def test_user_flow_lightweight(hass: HomeAssistant) -> None:
+    """Test creating a lightweight entry."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {CONF_DEVICE_NAME: "Test Device", CONF_LIGHTWEIGHT: True},
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {
+            CONF_CONSUMABLE_NAME: "Test Filter",
+            CONF_LIFETIME_DAYS: 90,
+            CONF_WARNING_DAYS: 15,
+            "add_another": False,
+        },
+    )
+
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert result["data"][CONF_LIGHTWEIGHT] is True
+
+
+async def test_user_flow_part_number(hass: HomeAssistant) -> None:
+    """Test a consumable's part number and reorder point are stored."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {CONF_DEVICE_NAME: "Test Device"},
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {
+            CONF_CONSUMABLE_NAME: "Test Filter",
+            CONF_LIFETIME_DAYS: 90,
+            CONF_WARNING_DAYS: 15,
+            CONF_PART_NUMBER: "F-100",
+            CONF_REORDER_POINT: 2,
+            "add_another": False,
+        },
+    )
+
+    consumable = result["data"][CONF_CONSUMABLES][0]
+    assert consumable[CONF_PART_NUMBER] == "F-100"
+    assert consumable[CONF_REORDER_POINT] == 2
+
+
 async def test_user_flow_add_multiple_consumables(hass: HomeAssistant) -> None:
     """Test adding multiple consumables in config flow."""
     result = await hass.config_entries.flow.async_init(
@@ -155,7 +226,8 @@ async def test_options_flow_add_consumable(
     )
 
     assert result["type"] is FlowResultType.CREATE_ENTRY
-    assert len(config_entry.data[CONF_CONSUMABLES]) == 2
+    definitions = await async_load_definitions(hass, config_entry)
+    assert len(definitions[CONF_CONSUMABLES]) == 2
 
 
 async def test_options_flow_edit_consumable(
@@ -198,10 +270,9 @@ async def test_options_flow_edit_consumable(
     )
 
     assert result["type"] is FlowResultType.CREATE_ENTRY
-    assert (
-        config_entry.data[CONF_CONSUMABLES][0][CONF_CONSUMABLE_NAME] == "Updated Filter"
-    )
-    assert config_entry.data[CONF_CONSUMABLES][0][CONF_LIFETIME_DAYS] == 120
+    definitions = await async_load_definitions(hass, config_entry)
+    assert definitions[CONF_CONSUMABLES][0][CONF_CONSUMABLE_NAME] == "Updated Filter"
+    assert definitions[CONF_CONSUMABLES][0][CONF_LIFETIME_DAYS] == 120
 
 
 async def test_options_flow_delete_consumable(
@@ -220,7 +291,7 @@ async def test_options_flow_delete_consumable(
 
     result = await hass.config_entries.options.async_configure(
         result["flow_id"],
-        {"consumable": "0"},
+        {CONF_CONSUMABLES: ["0"]},
     )
 
     assert result["type"] is FlowResultType.FORM
@@ -232,7 +303,89 @@ async def test_options_flow_delete_consumable(
     )
 
     assert result["type"] is FlowResultType.CREATE_ENTRY
-    assert len(config_entry.data[CONF_CONSUMABLES]) == 0
+    definitions = await async_load_definitions(hass, config_entry)
+    assert len(definitions[CONF_CONSUMABLES]) == 0
+
+
+@freeze_time("2026-01-15 20:00:00")
+async def test_options_flow_delete_moves_later_consumables(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test consumables after a deleted one keep their dates and history."""
+    entry = MockConfigEntry(
+        version=2,
+        domain=DOMAIN,
+        title="Test Device",
+        data={
+            CONF_DEVICE_NAME: "Test Device",
+            CONF_CONSUMABLES: [
+                {
+                    CONF_CONSUMABLE_NAME: name,
+                    CONF_LIFETIME_DAYS: 90,
+                    CONF_WARNING_DAYS: 15,
+                    CONF_ICON_NORMAL: DEFAULT_ICON_NORMAL,
+                    CONF_ICON_WARNING: DEFAULT_ICON_WARNING,
+                    CONF_ICON_OVERDUE: DEFAULT_ICON_OVERDUE,
+                }
+                for name in ("Filter", "Pad", "Lamp")
+            ],
+        },
+        unique_id="Test Device",
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    for name, value in (("filter", "2026-01-01"), ("lamp", "2026-01-10")):
+        await hass.services.async_call(
+            "date",
+            "set_value",
+            {"entity_id": f"date.test_device_{name}_last_replaced", "date": value},
+            blocking=True,
+        )
+        await hass.services.async_call(
+            DOMAIN,
+            "replace",
+            {"entity_id": f"sensor.test_device_{name}_days_remaining"},
+            blocking=True,
+        )
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"action": "delete"}
+    )
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {CONF_CONSUMABLES: ["0"]}
+    )
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"action": "done"}
+    )
+    await hass.async_block_till_done()
+
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert entity_registry.async_get("date.test_device_filter_last_replaced") is None
+    lamp = entity_registry.async_get("date.test_device_lamp_last_replaced")
+    assert lamp is not None
+    assert lamp.unique_id == f"{entry.entry_id}_consumable_1_last_replaced"
+    history_store = hass.data[DOMAIN][entry.entry_id].history_store
+    assert history_store.data == {
+        f"{entry.entry_id}_consumable_1": [{"previous": "2026-01-10"}]
+    }
+    state = hass.states.get("date.test_device_lamp_last_replaced")
+    assert state is not None
+    assert state.state == "2026-01-15"
+    state = hass.states.get("date.test_device_pad_last_replaced")
+    assert state is not None
+    assert state.state == "unknown"
+
+    await hass.services.async_call(
+        DOMAIN,
+        "undo_replaced",
+        {"entity_id": "sensor.test_device_lamp_days_remaining"},
+        blocking=True,
+    )
+    state = hass.states.get("date.test_device_lamp_last_replaced")
+    assert state is not None
+    assert state.state == "2026-01-10"
 
 
 async def test_config_flow_warning_exceeds_lifetime(hass: HomeAssistant) -> None:
@@ -314,3 +467,389 @@ async def test_options_flow_edit_warning_exceeds_lifetime(
     assert result["type"] is FlowResultType.FORM
     assert result["step_id"] == "edit_consumable"
     assert result["errors"] == {CONF_WARNING_DAYS: "warning_exceeds_lifetime"}
+
+
+async def test_user_flow_creates_hub(hass: HomeAssistant) -> None:
+    """Test creating an empty hub entry."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {CONF_DEVICE_NAME: "Building A", CONF_HUB: True},
+    )
+
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert result["title"] == "Building A"
+    assert result["data"] == {
+        CONF_DEVICE_NAME: "Building A",
+        CONF_DEVICES: [],
+        CONF_LIGHTWEIGHT: False,
+    }
+
+
+async def test_options_flow_hub_add_device(hass: HomeAssistant) -> None:
+    """Test adding a device and its consumables to a hub."""
+    entry = MockConfigEntry(
+        version=2,
+        domain=DOMAIN,
+        title="Building A",
+        data={CONF_DEVICE_NAME: "Building A", CONF_DEVICES: []},
+        unique_id="Building A",
+    )
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "devices"
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {"action": "add_device"},
+    )
+    assert result["step_id"] == "add_device"
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {CONF_DEVICE_NAME: "Air Handler 1"},
+    )
+    assert result["step_id"] == "init"
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {"action": "add"},
+    )
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {
+            CONF_CONSUMABLE_NAME: "Filter",
+            CONF_LIFETIME_DAYS: 90,
+            CONF_WARNING_DAYS: 15,
+        },
+    )
+    assert result["step_id"] == "init"
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {"action": "done"},
+    )
+    assert result["step_id"] == "devices"
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {"action": "done"},
+    )
+
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    devices = (await async_load_definitions(hass, entry))[CONF_DEVICES]
+    assert len(devices) == 1
+    assert devices[0][CONF_DEVICE_NAME] == "Air Handler 1"
+    assert devices[0][CONF_CONSUMABLES][0][CONF_CONSUMABLE_NAME] == "Filter"
+
+
+async def test_options_flow_hub_delete_device(hass: HomeAssistant) -> None:
+    """Test deleting a device from a hub."""
+    entry = MockConfigEntry(
+        version=2,
+        domain=DOMAIN,
+        title="Building A",
+        data={
+            CONF_DEVICE_NAME: "Building A",
+            CONF_DEVICES: [
+                {
+                    CONF_DEVICE_UID: "ahu1",
+                    CONF_DEVICE_NAME: "Air Handler 1",
+                    CONF_CONSUMABLES: [],
+                },
+            ],
+        },
+        unique_id="Building A",
+    )
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {"action": "delete_device"},
+    )
+    assert result["step_id"] == "delete_device"
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {"device": "0"},
+    )
+    assert result["step_id"] == "devices"
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {"action": "done"},
+    )
+
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert (await async_load_definitions(hass, entry))[CONF_DEVICES] == []
+
+
+async def test_options_flow_moves_definitions_to_store(
+    hass: HomeAssistant, config_entry: config_entries.ConfigEntry, hass_storage
+) -> None:
+    """Test saving options keeps only a storage pointer in the entry data."""
+    result = await hass.config_entries.options.async_init(config_entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {"action": "done"},
+    )
+
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert config_entry.data == {
+        CONF_DEVICE_NAME: "Test Device",
+        CONF_STORAGE_KEY: f"{DOMAIN}.{config_entry.entry_id}",
+    }
+    stored = hass_storage[f"{DOMAIN}.{config_entry.entry_id}"]["data"]
+    assert stored[CONF_CONSUMABLES][0][CONF_CONSUMABLE_NAME] == "Test Filter"
+
+
+async def test_user_flow_bulk_add(hass: HomeAssistant) -> None:
+    """Test adding every consumable of a device in one submission."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {CONF_DEVICE_NAME: "Test Device", CONF_BULK_ADD: True},
+    )
+    assert result["step_id"] == "bulk_add"
+
+    # Nothing is added while any row is invalid
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {
+            CONF_CONSUMABLES: (
+                "Filter 1, 90, 10\n"
+                "Filter 2, 30, 30\n"
+                "Filter 3, lots\n"
+                "Filter 4, 90, 14, 12.99, FF-1, extra"
+            )
+        },
+    )
+    assert result["type"] is FlowResultType.FORM
+    assert result["errors"] == {"base": "invalid_rows"}
+    placeholders = result["description_placeholders"]
+    assert placeholders is not None
+    assert placeholders["row_errors"].splitlines() == [
+        "Row 2: warning_days warning exceeds lifetime",
+        "Row 3: expected int for dictionary value @ data['lifetime_days']. Got 'lots'",
+        "Row 4: too many columns, expected at most 5",
+    ]
+
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {
+            CONF_CONSUMABLES: (
+                "# name, lifetime, warning, cost, part\n"
+                "Filter 1, 90, 10\n"
+                "Filter 2, 60, , 12.5, F-2\n"
+                "Filter 3\n"
+            )
+        },
+    )
+
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    first, second, third = result["data"][CONF_CONSUMABLES]
+    assert (first[CONF_LIFETIME_DAYS], first[CONF_WARNING_DAYS]) == (90, 10)
+    assert second[CONF_WARNING_DAYS] == 15
+    assert second[CONF_COST] == 12.5
+    assert second[CONF_PART_NUMBER] == "F-2"
+    assert third[CONF_CONSUMABLE_NAME] == "Filter 3"
+    assert third[CONF_LIFETIME_DAYS] == 90
+
+
+async def test_options_flow_bulk_add_yaml(
+    hass: HomeAssistant, config_entry: config_entries.ConfigEntry
+) -> None:
+    """Test adding consumables from a YAML list in the options flow."""
+    result = await hass.config_entries.options.async_init(config_entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"action": "bulk_add"}
+    )
+    assert result["step_id"] == "bulk_add"
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {CONF_CONSUMABLES: "- consumable_name: [unclosed"}
+    )
+    assert result["errors"] == {"base": "invalid_rows"}
+
+    # Pasted text can't reach secrets or other files
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {CONF_CONSUMABLES: "- consumable_name: !secret filter"}
+    )
+    assert result["errors"] == {"base": "invalid_rows"}
+    placeholders = result["description_placeholders"]
+    assert placeholders is not None
+    assert placeholders["row_errors"].startswith("Invalid YAML:")
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {
+            CONF_CONSUMABLES: (
+                "- consumable_name: UV Lamp\n"
+                "  lifetime_hours: 9000\n"
+                "- consumable_name: Pad\n"
+                "  lifetime_days: 30\n"
+                "  warning_days: 5\n"
+            )
+        },
+    )
+    assert result["errors"] == {"base": "invalid_rows"}
+    placeholders = result["description_placeholders"]
+    assert placeholders is not None
+    assert "Row 1:" in placeholders["row_errors"]
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {
+            CONF_CONSUMABLES: (
+                "# Bedroom purifier\n"
+                "\n"
+                "- consumable_name: UV Lamp\n"
+                "  lifetime_hours: 8000\n"
+                "  warning_hours: 100\n"
+                "- consumable_name: Pad\n"
+                "  lifetime_days: 30\n"
+                "  warning_days: 5\n"
+            )
+        },
+    )
+    assert result["step_id"] == "init"
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"action": "done"}
+    )
+
+    consumables = (await async_load_definitions(hass, config_entry))[CONF_CONSUMABLES]
+    assert [c[CONF_CONSUMABLE_NAME] for c in consumables] == [
+        "Test Filter",
+        "UV Lamp",
+        "Pad",
+    ]
+    assert consumables[1][CONF_LIFETIME_HOURS] == 8000
+
+
+@pytest.fixture
+async def large_entry(hass: HomeAssistant) -> MockConfigEntry:
+    """Create a config entry with more consumables than fit on a page."""
+    entry = MockConfigEntry(
+        version=2,
+        domain=DOMAIN,
+        title="Large Device",
+        data={
+            CONF_DEVICE_NAME: "Large Device",
+            CONF_CONSUMABLES: [
+                {
+                    CONF_CONSUMABLE_NAME: f"{kind} {number}",
+                    CONF_LIFETIME_DAYS: 90,
+                    CONF_WARNING_DAYS: 15,
+                }
+                for kind in ("Filter", "Pad")
+                for number in range(PAGE_SIZE)
+            ],
+        },
+        unique_id="Large Device",
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
+def consumables_listing(result: config_entries.ConfigFlowResult) -> str:
+    """Return the consumables listed by an options flow step."""
+    placeholders = result["description_placeholders"]
+    assert placeholders is not None
+    return placeholders["consumables"]
+
+
+async def test_options_flow_pages_and_search(
+    hass: HomeAssistant, large_entry: MockConfigEntry
+) -> None:
+    """Test the options flow lists and offers one page of matches at a time."""
+    result = await hass.config_entries.options.async_init(large_entry.entry_id)
+    listing = consumables_listing(result)
+    assert "Filter 0" in listing
+    assert "Pad 0" not in listing
+    assert f"Showing 1-{PAGE_SIZE} of {2 * PAGE_SIZE}" in listing
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"action": "next_page"}
+    )
+    listing = consumables_listing(result)
+    assert "Filter 0" not in listing
+    assert "Pad 0" in listing
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"action": "search"}
+    )
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {CONF_SEARCH: "pad 1"}
+    )
+    listing = consumables_listing(result)
+    assert "Showing 1-11 of 11 matching 'pad 1'" in listing
+
+    # Only the matches can be selected
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"action": "delete"}
+    )
+    with pytest.raises(InvalidData):
+        await hass.config_entries.options.async_configure(
+            result["flow_id"], {CONF_CONSUMABLES: ["0"]}
+        )
+    # Pad 1 and Pad 10
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {CONF_CONSUMABLES: [str(PAGE_SIZE + 1), str(PAGE_SIZE + 10)]},
+    )
+    assert result["step_id"] == "init"
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"action": "done"}
+    )
+
+    consumables = (await async_load_definitions(hass, large_entry))[CONF_CONSUMABLES]
+    names = [consumable[CONF_CONSUMABLE_NAME] for consumable in consumables]
+    assert len(names) == 2 * PAGE_SIZE - 2
+    assert "Pad 1" not in names
+    assert "Pad 10" not in names
+    assert "Pad 11" in names
+
+
+async def test_options_flow_edit_many(
+    hass: HomeAssistant, large_entry: MockConfigEntry, hass_storage
+) -> None:
+    """Test settings are applied to every selected consumable in one write."""
+    result = await hass.config_entries.options.async_init(large_entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"action": "edit_many"}
+    )
+    assert result["step_id"] == "edit_many"
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {CONF_CONSUMABLES: ["0", "1"], CONF_WARNING_DAYS: 90}
+    )
+    assert result["errors"] == {CONF_WARNING_DAYS: "warning_exceeds_lifetime"}
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {CONF_CONSUMABLES: ["0", "1"], CONF_LIFETIME_DAYS: 30, CONF_COST: 5},
+    )
+    assert result["step_id"] == "init"
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"action": "done"}
+    )
+
+    consumables = hass_storage[f"{DOMAIN}.{large_entry.entry_id}"]["data"][
+        CONF_CONSUMABLES
+    ]
+    assert consumables[0] == {
+        CONF_CONSUMABLE_NAME: "Filter 0",
+        CONF_LIFETIME_DAYS: 30,
+        CONF_WARNING_DAYS: 15,
+        CONF_COST: 5,
+    }
+    assert consumables[1][CONF_LIFETIME_DAYS] == 30
+    assert consumables[2][CONF_LIFETIME_DAYS] == 90
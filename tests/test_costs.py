@@ -0,0 +1,154 @@
+"""Tests for the Consumable Tracker cost projection."""
+
+from datetime import date
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.consumable_tracker.const import (
+    CONF_CONSUMABLE_NAME,
+    CONF_CONSUMABLES,
+    CONF_COST,
+    CONF_DEVICE_NAME,
+    CONF_ICON_NORMAL,
+    CONF_ICON_OVERDUE,
+    CONF_ICON_WARNING,
+    CONF_LIFETIME_DAYS,
+    CONF_WARNING_DAYS,
+    DEFAULT_ICON_NORMAL,
+    DEFAULT_ICON_OVERDUE,
+    DEFAULT_ICON_WARNING,
+    DOMAIN,
+)
+from custom_components.consumable_tracker.costs import month_starts, project_costs
+
+FILTER = {CONF_LIFETIME_DAYS: 30, CONF_COST: 10}
+PAD = {CONF_LIFETIME_DAYS: 90, CONF_COST: 5}
+
+
+def test_month_starts() -> None:
+    """Test month boundaries roll over into the next year."""
+    assert month_starts(date(2026, 11, 20), 3) == [
+        date(2026, 11, 1),
+        date(2026, 12, 1),
+        date(2027, 1, 1),
+        date(2027, 2, 1),
+    ]
+
+
+def test_project_costs() -> None:
+    """Test replacements are counted in the months they fall due."""
+    spend = project_costs(
+        [
+            # Due today, then on Feb 14 and Mar 16
+            (FILTER, None),
+            # Due on Mar 1
+            (PAD, date(2025, 12, 1)),
+            # No cost, so not projected
+            ({CONF_LIFETIME_DAYS: 1}, None),
+        ],
+        date(2026, 1, 15),
+        3,
+    )
+
+    assert spend == [10, 10, 15]
+
+
+def test_project_costs_overdue() -> None:
+    """Test an overdue consumable is projected from today."""
+    spend = project_costs([(PAD, date(2025, 1, 1))], date(2026, 1, 15), 12)
+
+    # Today, then mid-April, mid-July and mid-October
+    assert spend == [5, 0, 0, 5, 0, 0, 5, 0, 0, 5, 0, 0]
+
+
+def test_project_costs_ten_years() -> None:
+    """Test a ten year projection covers every replacement."""
+    spend = project_costs([(FILTER, None)], date(2026, 1, 1), 120)
+
+    assert len(spend) == 120
+    # Jan 1 2026 up to and including Dec 15 2035
+    assert sum(spend) == 10 * 122
+
+
+async def setup_integration(hass: HomeAssistant) -> MockConfigEntry:
+    """Set up the integration with a config entry."""
+    entry = MockConfigEntry(
+        version=2,
+        domain=DOMAIN,
+        title="Test Device",
+        data={
+            CONF_DEVICE_NAME: "Test Device",
+            CONF_CONSUMABLES: [
+                {
+                    CONF_CONSUMABLE_NAME: "Test Filter",
+                    CONF_LIFETIME_DAYS: 30,
+                    CONF_WARNING_DAYS: 5,
+                    CONF_COST: 12.5,
+                    CONF_ICON_NORMAL: DEFAULT_ICON_NORMAL,
+                    CONF_ICON_WARNING: DEFAULT_ICON_WARNING,
+                    CONF_ICON_OVERDUE: DEFAULT_ICON_OVERDUE,
+                },
+            ],
+        },
+        unique_id="test_device",
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+
+async def test_project_costs_service(hass: HomeAssistant, freezer) -> None:
+    """Test the service projects the spend of an entry."""
+    freezer.move_to("2026-01-15 20:00:00")
+    entry = await setup_integration(hass)
+    await hass.services.async_call(
+        "date",
+        "set_value",
+        {
+            "entity_id": "date.test_device_test_filter_last_replaced",
+            "date": "2026-01-10",
+        },
+        blocking=True,
+    )
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "project_costs",
+        {"config_entry_id": entry.entry_id, "months": 2},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert response == {
+        "currency": hass.config.currency,
+        "total": 12.5,
+        "months": [
+            {"month": "2026-01", "cost": 0},
+            {"month": "2026-02", "cost": 12.5},
+        ],
+    }
+
+    response = await hass.services.async_call(
+        DOMAIN, "project_costs", {}, blocking=True, return_response=True
+    )
+    # Every 30 days from Feb 9 to Dec 6
+    assert response is not None
+    assert response["total"] == 12.5 * 11
+
+
+async def test_project_costs_unknown_entry(hass: HomeAssistant) -> None:
+    """Test projecting an unknown entry fails."""
+    await setup_integration(hass)
+
+    with pytest.raises(HomeAssistantError):
+        await hass.services.async_call(
+            DOMAIN,
+            "project_costs",
+            {"config_entry_id": "missing"},
+            blocking=True,
+            return_response=True,
+        )
@@ -0,0 +1,126 @@
+"""Tests for the Consumable Tracker datetime entity."""
+
+from datetime import datetime, timedelta
+
+from homeassistant.core import HomeAssistant, State
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+    mock_restore_cache,
+)
+
+from custom_components.consumable_tracker.const import (
+    CONF_CONSUMABLE_NAME,
+    CONF_CONSUMABLES,
+    CONF_DEVICE_NAME,
+    CONF_ICON_NORMAL,
+    CONF_ICON_OVERDUE,
+    CONF_ICON_WARNING,
+    CONF_LIFETIME_DAYS,
+    CONF_LIFETIME_HOURS,
+    CONF_WARNING_DAYS,
+    CONF_WARNING_HOURS,
+    DEFAULT_ICON_NORMAL,
+    DEFAULT_ICON_OVERDUE,
+    DEFAULT_ICON_WARNING,
+    DOMAIN,
+)
+
+DATETIME_ENTITY_ID = "datetime.test_device_uv_lamp_last_replaced"
+SENSOR_ENTITY_ID = "sensor.test_device_uv_lamp_hours_remaining"
+
+
+def create_config_entry(hass: HomeAssistant) -> MockConfigEntry:
+    """Create a config entry with an hour-precision consumable."""
+    entry = MockConfigEntry(
+        version=2,
+        domain=DOMAIN,
+        title="Test Device",
+        data={
+            CONF_DEVICE_NAME: "Test Device",
+            CONF_CONSUMABLES: [
+                {
+                    CONF_CONSUMABLE_NAME: "UV Lamp",
+                    CONF_LIFETIME_DAYS: 1,
+                    CONF_WARNING_DAYS: 0,
+                    CONF_LIFETIME_HOURS: 12,
+                    CONF_WARNING_HOURS: 2,
+                    CONF_ICON_NORMAL: DEFAULT_ICON_NORMAL,
+                    CONF_ICON_WARNING: DEFAULT_ICON_WARNING,
+                    CONF_ICON_OVERDUE: DEFAULT_ICON_OVERDUE,
+                },
+            ],
+        },
+        unique_id="test_device",
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
+async def test_datetime_entity_replaces_date_entity(hass: HomeAssistant) -> None:
+    """Test hour-precision consumables get a datetime instead of a date."""
+    entry = create_config_entry(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.states.get(DATETIME_ENTITY_ID) is not None
+    assert hass.states.get("date.test_device_uv_lamp_last_replaced") is None
+
+    state = hass.states.get(SENSOR_ENTITY_ID)
+    assert state is not None
+    assert state.state == "12"
+    assert state.attributes["unit_of_measurement"] == "h"
+
+
+async def test_datetime_entity_restores_state(hass: HomeAssistant) -> None:
+    """Test datetime entity restores its previous state."""
+    mock_restore_cache(hass, [State(DATETIME_ENTITY_ID, "2026-01-10T08:30:00+00:00")])
+
+    entry = create_config_entry(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    entity = hass.data["entity_components"]["datetime"].get_entity(DATETIME_ENTITY_ID)
+    assert entity is not None
+    assert entity.native_value == datetime(2026, 1, 10, 8, 30, tzinfo=dt_util.UTC)
+
+
+async def test_button_sets_datetime_and_timer_counts_down(
+    hass: HomeAssistant, freezer
+) -> None:
+    """Test replacing arms an exact timer for each hourly transition."""
+    freezer.move_to("2026-01-15 08:00:00+00:00")
+    entry = create_config_entry(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    await hass.services.async_call(
+        "button",
+        "press",
+        {"entity_id": "button.test_device_mark_uv_lamp_as_replaced"},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+
+    entity = hass.data["entity_components"]["datetime"].get_entity(DATETIME_ENTITY_ID)
+    assert entity is not None
+    assert entity.native_value == dt_util.utcnow()
+
+    state = hass.states.get(SENSOR_ENTITY_ID)
+    assert state is not None
+    assert state.state == "12"
+
+    for hours, expected in ((1, "11"), (10, "2"), (12, "0")):
+        now = dt_util.parse_datetime("2026-01-15 08:00:00+00:00")
+        assert now is not None
+        now += timedelta(hours=hours)
+        freezer.move_to(now)
+        async_fire_time_changed(hass, now)
+        await hass.async_block_till_done()
+
+        state = hass.states.get(SENSOR_ENTITY_ID)
+        assert state is not None
+        assert state.state == expected
+
+    assert state.attributes["next_replacement"] == "2026-01-15T20:00:00+00:00"
@@ -0,0 +1,118 @@
+"""Tests for the Consumable Tracker device conditions."""
+
+from freezegun import freeze_time
+from homeassistant.components.device_automation import DeviceAutomationType
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_get_device_automations,
+)
+
+from custom_components.consumable_tracker.const import (
+    CONF_CONSUMABLE_NAME,
+    CONF_CONSUMABLES,
+    CONF_DEVICE_NAME,
+    CONF_ICON_NORMAL,
+    CONF_ICON_OVERDUE,
+    CONF_ICON_WARNING,
+    CONF_LIFETIME_DAYS,
+    CONF_WARNING_DAYS,
+    DEFAULT_ICON_NORMAL,
+    DEFAULT_ICON_OVERDUE,
+    DEFAULT_ICON_WARNING,
+    DOMAIN,
+)
+from custom_components.consumable_tracker.device_condition import (
+    async_condition_from_config,
+)
+
+SENSOR_ENTITY_ID = "sensor.test_device_test_filter_days_remaining"
+
+
+async def setup_integration(hass: HomeAssistant) -> MockConfigEntry:
+    """Set up the integration with a config entry."""
+    entry = MockConfigEntry(
+        version=2,
+        domain=DOMAIN,
+        title="Test Device",
+        data={
+            CONF_DEVICE_NAME: "Test Device",
+            CONF_CONSUMABLES: [
+                {
+                    CONF_CONSUMABLE_NAME: "Test Filter",
+                    CONF_LIFETIME_DAYS: 90,
+                    CONF_WARNING_DAYS: 15,
+                    CONF_ICON_NORMAL: DEFAULT_ICON_NORMAL,
+                    CONF_ICON_WARNING: DEFAULT_ICON_WARNING,
+                    CONF_ICON_OVERDUE: DEFAULT_ICON_OVERDUE,
+                },
+            ],
+        },
+        unique_id="test_device",
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+
+async def set_last_replaced(hass: HomeAssistant, value: str) -> None:
+    """Set the consumable's last replaced date through the date entity."""
+    await hass.services.async_call(
+        "date",
+        "set_value",
+        {"entity_id": "date.test_device_test_filter_last_replaced", "date": value},
+        blocking=True,
+    )
+
+
+async def test_get_conditions(hass: HomeAssistant) -> None:
+    """Test conditions are listed for each consumable."""
+    entry = await setup_integration(hass)
+    device = dr.async_get(hass).async_get_device(identifiers={(DOMAIN, entry.entry_id)})
+    assert device is not None
+
+    conditions = await async_get_device_automations(
+        hass, DeviceAutomationType.CONDITION, device.id
+    )
+    types = {c["type"] for c in conditions if c["domain"] == DOMAIN}
+    assert types == {"is_warning", "is_overdue"}
+
+
+@freeze_time("2026-01-15 20:00:00")
+async def test_status_conditions(hass: HomeAssistant) -> None:
+    """Test conditions follow the cached consumable status."""
+    entry = await setup_integration(hass)
+    device = dr.async_get(hass).async_get_device(identifiers={(DOMAIN, entry.entry_id)})
+    assert device is not None
+    sensor = er.async_get(hass).async_get(SENSOR_ENTITY_ID)
+    assert sensor is not None
+
+    def make_condition(condition_type):
+        return async_condition_from_config(
+            hass,
+            {
+                "condition": "device",
+                "domain": DOMAIN,
+                "device_id": device.id,
+                "entity_id": sensor.id,
+                "type": condition_type,
+            },
+        )
+
+    is_warning = make_condition("is_warning")
+    is_overdue = make_condition("is_overdue")
+    assert not is_warning(hass, {})
+    assert not is_overdue(hass, {})
+
+    await set_last_replaced(hass, "2025-10-27")
+    await hass.async_block_till_done()
+    assert is_warning(hass, {})
+    assert not is_overdue(hass, {})
+
+    await set_last_replaced(hass, "2025-10-01")
+    await hass.async_block_till_done()
+    assert not is_warning(hass, {})
+    assert is_overdue(hass, {})
@@ -0,0 +1,164 @@
+"""Tests for the Consumable Tracker device triggers."""
+
+from freezegun import freeze_time
+from homeassistant.components import automation
+from homeassistant.components.device_automation import DeviceAutomationType
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from homeassistant.setup import async_setup_component
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_get_device_automations,
+    async_mock_service,
+)
+
+from custom_components.consumable_tracker.const import (
+    CONF_CONSUMABLE_NAME,
+    CONF_CONSUMABLES,
+    CONF_DEVICE_NAME,
+    CONF_ICON_NORMAL,
+    CONF_ICON_OVERDUE,
+    CONF_ICON_WARNING,
+    CONF_LIFETIME_DAYS,
+    CONF_WARNING_DAYS,
+    DEFAULT_ICON_NORMAL,
+    DEFAULT_ICON_OVERDUE,
+    DEFAULT_ICON_WARNING,
+    DOMAIN,
+)
+
+SENSOR_ENTITY_ID = "sensor.test_device_test_filter_days_remaining"
+
+
+async def setup_integration(hass: HomeAssistant) -> MockConfigEntry:
+    """Set up the integration with a config entry."""
+    entry = MockConfigEntry(
+        version=2,
+        domain=DOMAIN,
+        title="Test Device",
+        data={
+            CONF_DEVICE_NAME: "Test Device",
+            CONF_CONSUMABLES: [
+                {
+                    CONF_CONSUMABLE_NAME: "Test Filter",
+                    CONF_LIFETIME_DAYS: 90,
+                    CONF_WARNING_DAYS: 15,
+                    CONF_ICON_NORMAL: DEFAULT_ICON_NORMAL,
+                    CONF_ICON_WARNING: DEFAULT_ICON_WARNING,
+                    CONF_ICON_OVERDUE: DEFAULT_ICON_OVERDUE,
+                },
+            ],
+        },
+        unique_id="test_device",
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+
+async def set_last_replaced(hass: HomeAssistant, value: str) -> None:
+    """Set the consumable's last replaced date through the date entity."""
+    await hass.services.async_call(
+        "date",
+        "set_value",
+        {"entity_id": "date.test_device_test_filter_last_replaced", "date": value},
+        blocking=True,
+    )
+
+
+async def setup_automation(hass: HomeAssistant, entry: MockConfigEntry, trigger_type):
+    """Set up an automation using a device trigger and return its calls."""
+    calls = async_mock_service(hass, "test", "automation")
+    device = dr.async_get(hass).async_get_device(identifiers={(DOMAIN, entry.entry_id)})
+    assert device is not None
+    sensor = er.async_get(hass).async_get(SENSOR_ENTITY_ID)
+    assert sensor is not None
+
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: [
+                {
+                    "trigger": {
+                        "platform": "device",
+                        "domain": DOMAIN,
+                        "device_id": device.id,
+                        "entity_id": sensor.id,
+                        "type": trigger_type,
+                    },
+                    "action": {
+                        "service": "test.automation",
+                        "data_template": {"type": "{{ trigger.type }}"},
+                    },
+                }
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+    return calls
+
+
+async def test_get_triggers(hass: HomeAssistant) -> None:
+    """Test triggers are listed for each consumable."""
+    entry = await setup_integration(hass)
+    device = dr.async_get(hass).async_get_device(identifiers={(DOMAIN, entry.entry_id)})
+    assert device is not None
+
+    triggers = await async_get_device_automations(
+        hass, DeviceAutomationType.TRIGGER, device.id
+    )
+    types = {t["type"] for t in triggers if t["domain"] == DOMAIN}
+    assert types == {"entered_warning", "became_overdue", "replaced"}
+
+
+@freeze_time("2026-01-15 20:00:00")
+async def test_entered_warning_trigger(hass: HomeAssistant) -> None:
+    """Test the entered warning trigger fires on the status transition."""
+    entry = await setup_integration(hass)
+    calls = await setup_automation(hass, entry, "entered_warning")
+
+    # 80 days ago leaves 10 days remaining, within the warning threshold
+    await set_last_replaced(hass, "2025-10-27")
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+    assert calls[0].data["type"] == "entered_warning"
+
+    # Staying in warning does not fire again
+    await set_last_replaced(hass, "2025-10-28")
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+
+@freeze_time("2026-01-15 20:00:00")
+async def test_became_overdue_trigger(hass: HomeAssistant) -> None:
+    """Test the became overdue trigger fires on the status transition."""
+    entry = await setup_integration(hass)
+    calls = await setup_automation(hass, entry, "became_overdue")
+
+    await set_last_replaced(hass, "2025-10-27")
+    await hass.async_block_till_done()
+    assert len(calls) == 0
+
+    await set_last_replaced(hass, "2025-10-01")
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+
+async def test_replaced_trigger(hass: HomeAssistant) -> None:
+    """Test the replaced trigger fires when the button is pressed."""
+    entry = await setup_integration(hass)
+    calls = await setup_automation(hass, entry, "replaced")
+
+    await hass.services.async_call(
+        "button",
+        "press",
+        {"entity_id": "button.test_device_mark_test_filter_as_replaced"},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+    assert calls[0].data["type"] == "replaced"
@@ -0,0 +1,190 @@
+"""Tests for the Consumable Tracker due date index."""
+
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.consumable_tracker.const import (
+    CONF_CONSUMABLE_NAME,
+    CONF_CONSUMABLES,
+    CONF_DEVICE_NAME,
+    CONF_ICON_NORMAL,
+    CONF_ICON_OVERDUE,
+    CONF_ICON_WARNING,
+    CONF_LIFETIME_DAYS,
+    CONF_LIFETIME_HOURS,
+    CONF_WARNING_DAYS,
+    DEFAULT_ICON_NORMAL,
+    DEFAULT_ICON_OVERDUE,
+    DEFAULT_ICON_WARNING,
+    DOMAIN,
+)
+from custom_components.consumable_tracker.due_index import (
+    async_get_due_index,
+    consumable_due,
+)
+
+ICONS = {
+    CONF_ICON_NORMAL: DEFAULT_ICON_NORMAL,
+    CONF_ICON_WARNING: DEFAULT_ICON_WARNING,
+    CONF_ICON_OVERDUE: DEFAULT_ICON_OVERDUE,
+}
+
+
+def test_consumable_due() -> None:
+    """Test due dates of daily and hourly consumables."""
+    assert consumable_due({CONF_LIFETIME_DAYS: 30}, date(2026, 1, 1)) == datetime(
+        2026, 1, 31, tzinfo=dt_util.DEFAULT_TIME_ZONE
+    )
+
+    replaced = datetime(2026, 1, 1, 8, tzinfo=dt_util.UTC)
+    assert consumable_due(
+        {CONF_LIFETIME_DAYS: 1, CONF_LIFETIME_HOURS: 10}, replaced
+    ) == replaced + timedelta(hours=10)
+
+
+async def setup_integration(hass: HomeAssistant) -> MockConfigEntry:
+    """Set up the integration with a config entry."""
+    entry = MockConfigEntry(
+        version=2,
+        domain=DOMAIN,
+        title="Test Device",
+        data={
+            CONF_DEVICE_NAME: "Test Device",
+            CONF_CONSUMABLES: [
+                {
+                    CONF_CONSUMABLE_NAME: "Test Filter",
+                    CONF_LIFETIME_DAYS: 90,
+                    CONF_WARNING_DAYS: 15,
+                    **ICONS,
+                },
+                {
+                    CONF_CONSUMABLE_NAME: "Test Pad",
+                    CONF_LIFETIME_DAYS: 30,
+                    CONF_WARNING_DAYS: 5,
+                    **ICONS,
+                },
+                {
+                    CONF_CONSUMABLE_NAME: "Test Brush",
+                    CONF_LIFETIME_DAYS: 60,
+                    CONF_WARNING_DAYS: 5,
+                    **ICONS,
+                },
+            ],
+        },
+        unique_id="test_device",
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+
+async def set_last_replaced(hass: HomeAssistant, name: str, value: str) -> None:
+    """Set the last replaced date of a consumable."""
+    await hass.services.async_call(
+        "date",
+        "set_value",
+        {"entity_id": f"date.test_device_{name}_last_replaced", "date": value},
+        blocking=True,
+    )
+
+
+async def get_due(hass: HomeAssistant, **data) -> Any:
+    """Call the get_due service and return the listed consumables."""
+    response = await hass.services.async_call(
+        DOMAIN, "get_due", data, blocking=True, return_response=True
+    )
+    assert response is not None
+    return response["consumables"]
+
+
+async def test_get_due(hass: HomeAssistant, freezer) -> None:
+    """Test consumables are listed soonest first within the horizon."""
+    freezer.move_to("2026-01-15 20:00:00")
+    entry = await setup_integration(hass)
+    await set_last_replaced(hass, "test_filter", "2026-01-01")
+    await set_last_replaced(hass, "test_pad", "2025-12-01")
+
+    device = dr.async_get(hass).async_get_device(identifiers={(DOMAIN, entry.entry_id)})
+    assert device is not None
+    assert await get_due(hass) == [
+        {
+            "entity_id": "sensor.test_device_test_pad_days_remaining",
+            "device_id": device.id,
+            "device": "Test Device",
+            "consumable": "Test Pad",
+            "due": "2025-12-31",
+            "status": "overdue",
+        },
+        {
+            "entity_id": "sensor.test_device_test_filter_days_remaining",
+            "device_id": device.id,
+            "device": "Test Device",
+            "consumable": "Test Filter",
+            "due": "2026-04-01",
+            "status": "normal",
+        },
+    ]
+
+    assert [item["consumable"] for item in await get_due(hass, horizon_days=30)] == [
+        "Test Pad"
+    ]
+    assert [item["consumable"] for item in await get_due(hass, status="normal")] == [
+        "Test Filter"
+    ]
+
+    # Replacing the pad moves it behind the filter
+    await set_last_replaced(hass, "test_pad", "2026-03-15")
+    assert [item["consumable"] for item in await get_due(hass)] == [
+        "Test Filter",
+        "Test Pad",
+    ]
+
+
+async def test_get_due_area_and_label(hass: HomeAssistant, freezer) -> None:
+    """Test filtering by the area and labels of the entity or its device."""
+    freezer.move_to("2026-01-15 20:00:00")
+    entry = await setup_integration(hass)
+    await set_last_replaced(hass, "test_filter", "2026-01-01")
+    await set_last_replaced(hass, "test_pad", "2026-01-01")
+
+    device_registry = dr.async_get(hass)
+    device = device_registry.async_get_device(identifiers={(DOMAIN, entry.entry_id)})
+    assert device is not None
+    device_registry.async_update_device(device.id, area_id="kitchen")
+    entity_registry = er.async_get(hass)
+    entity_registry.async_update_entity(
+        "sensor.test_device_test_pad_days_remaining",
+        area_id="garage",
+        labels={"monthly"},
+    )
+
+    # The pad's own area takes precedence over its device's
+    assert [item["consumable"] for item in await get_due(hass, area_id="kitchen")] == [
+        "Test Filter"
+    ]
+    assert [item["consumable"] for item in await get_due(hass, area_id="garage")] == [
+        "Test Pad"
+    ]
+    assert [item["consumable"] for item in await get_due(hass, label_id="monthly")] == [
+        "Test Pad"
+    ]
+    assert await get_due(hass, device_id="other") == []
+
+
+async def test_unload_clears_index(hass: HomeAssistant) -> None:
+    """Test unloading an entry removes its consumables from the index."""
+    entry = await setup_integration(hass)
+    await set_last_replaced(hass, "test_filter", "2026-01-01")
+    assert len(async_get_due_index(hass).due_before(None)) == 1
+
+    await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert async_get_due_index(hass).due_before(None) == []
@@ -0,0 +1,163 @@
+"""Tests for the Consumable Tracker entity map."""
+
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.consumable_tracker.const import (
+    CONF_CONSUMABLE_NAME,
+    CONF_CONSUMABLES,
+    CONF_DEVICE_NAME,
+    CONF_ICON_NORMAL,
+    CONF_ICON_OVERDUE,
+    CONF_ICON_WARNING,
+    CONF_LIFETIME_DAYS,
+    CONF_LIFETIME_HOURS,
+    CONF_WARNING_DAYS,
+    DEFAULT_ICON_NORMAL,
+    DEFAULT_ICON_OVERDUE,
+    DEFAULT_ICON_WARNING,
+    DOMAIN,
+)
+from custom_components.consumable_tracker.entity_map import (
+    ConsumableEntityIds,
+    ConsumableEntityMap,
+)
+from custom_components.consumable_tracker.models import ConsumableDevice
+
+DEVICE = ConsumableDevice(
+    key="device",
+    name="Test Device",
+    consumables=[
+        {CONF_CONSUMABLE_NAME: "Filter", CONF_LIFETIME_DAYS: 90, CONF_WARNING_DAYS: 15},
+        {
+            CONF_CONSUMABLE_NAME: "Lamp",
+            CONF_LIFETIME_DAYS: 1,
+            CONF_WARNING_DAYS: 0,
+            CONF_LIFETIME_HOURS: 12,
+        },
+    ],
+)
+
+
+def add_entry(hass: HomeAssistant) -> MockConfigEntry:
+    """Add a config entry without setting it up."""
+    entry = MockConfigEntry(domain=DOMAIN, data={CONF_DEVICE_NAME: "Test Device"})
+    entry.add_to_hass(hass)
+    return entry
+
+
+async def test_resolves_registered_entities(hass: HomeAssistant) -> None:
+    """Test entities already in the registry are resolved when the map starts."""
+    entry = add_entry(hass)
+    entity_registry = er.async_get(hass)
+    for domain, unique_id, object_id in (
+        ("sensor", "device_consumable_0", "f"),
+        ("date", "device_consumable_0_last_replaced", "f"),
+        ("button", "device_consumable_0_replaced", "f"),
+        ("datetime", "device_consumable_1_last_replaced", "l"),
+    ):
+        entity_registry.async_get_or_create(
+            domain,
+            DOMAIN,
+            unique_id,
+            config_entry=entry,
+            suggested_object_id=object_id,
+        )
+
+    entity_map = ConsumableEntityMap(hass, entry.entry_id, [DEVICE])
+    unsub = entity_map.async_start()
+
+    assert entity_map.get("device_consumable_0") == ConsumableEntityIds(
+        sensor="sensor.f", last_replaced="date.f", button="button.f"
+    )
+    assert entity_map.get("device_consumable_1") == ConsumableEntityIds(
+        last_replaced="datetime.l"
+    )
+    unsub()
+
+
+async def test_follows_registry_changes(hass: HomeAssistant) -> None:
+    """Test the map follows entities being created, renamed and removed."""
+    entry = add_entry(hass)
+    entity_map = ConsumableEntityMap(hass, entry.entry_id, [DEVICE])
+    unsub = entity_map.async_start()
+    assert entity_map.get("device_consumable_0") == ConsumableEntityIds()
+
+    entity_registry = er.async_get(hass)
+    entity_registry.async_get_or_create(
+        "date", "other", "device_consumable_0_last_replaced"
+    )
+    entity_registry.async_get_or_create(
+        "date", DOMAIN, "device_consumable_0_last_replaced", suggested_object_id="f"
+    )
+    await hass.async_block_till_done()
+    assert entity_map.get("device_consumable_0").last_replaced == "date.f"
+
+    entity_registry.async_update_entity("date.f", new_entity_id="date.renamed")
+    await hass.async_block_till_done()
+    assert entity_map.get("device_consumable_0").last_replaced == "date.renamed"
+
+    entity_registry.async_remove("date.renamed")
+    await hass.async_block_till_done()
+    assert entity_map.get("device_consumable_0").last_replaced is None
+    unsub()
+
+
+async def test_skips_other_entities(hass: HomeAssistant) -> None:
+    """Test registry changes to other existing entities are not looked up."""
+    entry = add_entry(hass)
+    entity_map = ConsumableEntityMap(hass, entry.entry_id, [DEVICE])
+    unsub = entity_map.async_start()
+    entity_registry = er.async_get(hass)
+    other = entity_registry.async_get_or_create("light", "other", "light")
+    entity_registry.async_get_or_create(
+        "date", DOMAIN, "device_consumable_0_last_replaced", suggested_object_id="f"
+    )
+    await hass.async_block_till_done()
+
+    with patch.object(
+        entity_registry, "async_get", wraps=entity_registry.async_get
+    ) as lookup:
+        entity_registry.async_update_entity(other.entity_id, name="Other")
+        await hass.async_block_till_done()
+        lookup.assert_not_called()
+
+        entity_registry.async_update_entity("date.f", name="Filter")
+        await hass.async_block_till_done()
+        lookup.assert_called_once_with("date.f")
+    unsub()
+
+
+async def test_integration_resolves_entities(hass: HomeAssistant) -> None:
+    """Test a set up entry maps its consumables to their entities."""
+    entry = MockConfigEntry(
+        version=2,
+        domain=DOMAIN,
+        title="Test Device",
+        data={
+            CONF_DEVICE_NAME: "Test Device",
+            CONF_CONSUMABLES: [
+                {
+                    CONF_CONSUMABLE_NAME: "Test Filter",
+                    CONF_LIFETIME_DAYS: 90,
+                    CONF_WARNING_DAYS: 15,
+                    CONF_ICON_NORMAL: DEFAULT_ICON_NORMAL,
+                    CONF_ICON_WARNING: DEFAULT_ICON_WARNING,
+                    CONF_ICON_OVERDUE: DEFAULT_ICON_OVERDUE,
+                },
+            ],
+        },
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    entity_map = hass.data[DOMAIN][entry.entry_id].entity_map
+    assert entity_map.get(f"{entry.entry_id}_consumable_0") == ConsumableEntityIds(
+        sensor="sensor.test_device_test_filter_days_remaining",
+        last_replaced="date.test_device_test_filter_last_replaced",
+        button="button.test_device_mark_test_filter_as_replaced",
+    )
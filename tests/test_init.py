@@ -1,22 +1,27 @@
 """Tests for the Consumable Tracker integration initialization."""
 
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.consumable_tracker.const import (
     CONF_CONSUMABLE_NAME,
     CONF_CONSUMABLES,
     CONF_DEVICE_NAME,
+    CONF_DEVICE_UID,
+    CONF_DEVICES,
     CONF_ICON_NORMAL,
     CONF_ICON_OVERDUE,
     CONF_ICON_WARNING,
     CONF_LIFETIME_DAYS,
+    CONF_STORAGE_KEY,
     CONF_WARNING_DAYS,
     DEFAULT_ICON_NORMAL,
     DEFAULT_ICON_OVERDUE,
     DEFAULT_ICON_WARNING,
     DOMAIN,
 )
+from custom_components.consumable_tracker.store import async_save_definitions
 
 
 async def setup_integration(hass: HomeAssistant) -> MockConfigEntry:
@@ -79,3 +84,90 @@ async def test_unload_entry(hass: HomeAssistant) -> None:
 
     # Verify data is cleaned up
     assert entry.entry_id not in hass.data[DOMAIN]
+
+
+def hub_device(uid: str, name: str) -> dict:
+    """Build a hub device with a single consumable."""
+    return {
+        CONF_DEVICE_UID: uid,
+        CONF_DEVICE_NAME: name,
+        CONF_CONSUMABLES: [
+            {
+                CONF_CONSUMABLE_NAME: "Filter",
+                CONF_LIFETIME_DAYS: 90,
+                CONF_WARNING_DAYS: 15,
+                CONF_ICON_NORMAL: DEFAULT_ICON_NORMAL,
+                CONF_ICON_WARNING: DEFAULT_ICON_WARNING,
+                CONF_ICON_OVERDUE: DEFAULT_ICON_OVERDUE,
+            },
+        ],
+    }
+
+
+async def test_hub_entry_creates_devices(hass: HomeAssistant) -> None:
+    """Test a hub entry sets up every device under a single entry."""
+    entry = MockConfigEntry(
+        version=2,
+        domain=DOMAIN,
+        title="Building A",
+        data={
+            CONF_DEVICE_NAME: "Building A",
+            CONF_DEVICES: [
+                hub_device("ahu1", "Air Handler 1"),
+                hub_device("ahu2", "Air Handler 2"),
+            ],
+        },
+        unique_id="Building A",
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    device_registry = dr.async_get(hass)
+    for uid in ("ahu1", "ahu2"):
+        assert device_registry.async_get_device(
+            identifiers={(DOMAIN, f"{entry.entry_id}_{uid}")}
+        )
+
+    for name in ("air_handler_1", "air_handler_2"):
+        assert hass.states.get(f"sensor.{name}_filter_days_remaining") is not None
+        assert hass.states.get(f"date.{name}_filter_last_replaced") is not None
+        assert hass.states.get(f"button.{name}_mark_filter_as_replaced") is not None
+
+    # Removing a device from the hub drops it from the device registry
+    await async_save_definitions(
+        hass, entry, {CONF_DEVICES: [hub_device("ahu1", "Air Handler 1")]}
+    )
+    await hass.async_block_till_done()
+
+    assert device_registry.async_get_device(
+        identifiers={(DOMAIN, f"{entry.entry_id}_ahu1")}
+    )
+    assert not device_registry.async_get_device(
+        identifiers={(DOMAIN, f"{entry.entry_id}_ahu2")}
+    )
+
+
+async def test_setup_moves_definitions_to_store(
+    hass: HomeAssistant, hass_storage
+) -> None:
+    """Test inline consumable definitions move to a store on setup."""
+    entry = await setup_integration(hass)
+
+    assert entry.data == {
+        CONF_DEVICE_NAME: "Test Device",
+        CONF_STORAGE_KEY: f"{DOMAIN}.{entry.entry_id}",
+    }
+    stored = hass_storage[f"{DOMAIN}.{entry.entry_id}"]["data"]
+    assert stored[CONF_CONSUMABLES][0][CONF_CONSUMABLE_NAME] == "Test Filter"
+
+
+async def test_remove_entry_removes_store(hass: HomeAssistant, hass_storage) -> None:
+    """Test deleting an entry deletes its store."""
+    entry = await setup_integration(hass)
+    assert f"{DOMAIN}.{entry.entry_id}" in hass_storage
+
+    await hass.config_entries.async_remove(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert f"{DOMAIN}.{entry.entry_id}" not in hass_storage
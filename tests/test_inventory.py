@@ -0,0 +1,249 @@
+"""Tests for the Consumable Tracker spare parts inventory."""
+
+from datetime import date, timedelta
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.consumable_tracker.const import (
+    CONF_CONSUMABLE_NAME,
+    CONF_CONSUMABLES,
+    CONF_DEVICE_NAME,
+    CONF_ICON_NORMAL,
+    CONF_ICON_OVERDUE,
+    CONF_ICON_WARNING,
+    CONF_LIFETIME_DAYS,
+    CONF_PART_NUMBER,
+    CONF_REORDER_POINT,
+    CONF_WARNING_DAYS,
+    DEFAULT_ICON_NORMAL,
+    DEFAULT_ICON_OVERDUE,
+    DEFAULT_ICON_WARNING,
+    DOMAIN,
+)
+
+UPSTAIRS_STOCK = "number.test_device_upstairs_filter_spares_on_hand"
+DOWNSTAIRS_STOCK = "number.test_device_downstairs_filter_spares_on_hand"
+
+
+def filter_consumable(name: str, lifetime: int) -> dict:
+    """Return a consumable using the shared filter part."""
+    return {
+        CONF_CONSUMABLE_NAME: name,
+        CONF_LIFETIME_DAYS: lifetime,
+        CONF_WARNING_DAYS: 7,
+        CONF_PART_NUMBER: "F-100",
+        CONF_REORDER_POINT: 1,
+        CONF_ICON_NORMAL: DEFAULT_ICON_NORMAL,
+        CONF_ICON_WARNING: DEFAULT_ICON_WARNING,
+        CONF_ICON_OVERDUE: DEFAULT_ICON_OVERDUE,
+    }
+
+
+async def setup_integration(hass: HomeAssistant) -> MockConfigEntry:
+    """Set up the integration with a config entry."""
+    entry = MockConfigEntry(
+        version=2,
+        domain=DOMAIN,
+        title="Test Device",
+        data={
+            CONF_DEVICE_NAME: "Test Device",
+            CONF_CONSUMABLES: [
+                filter_consumable("Upstairs Filter", 30),
+                filter_consumable("Downstairs Filter", 45),
+            ],
+        },
+        unique_id="test_device",
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+
+async def set_stock(hass: HomeAssistant, value: int) -> None:
+    """Set the spares on hand of the shared part."""
+    await hass.services.async_call(
+        "number",
+        "set_value",
+        {"entity_id": UPSTAIRS_STOCK, "value": value},
+        blocking=True,
+    )
+
+
+async def test_stock_is_shared_by_part(hass: HomeAssistant, freezer) -> None:
+    """Test consumables with the same part number share one stock."""
+    freezer.move_to("2026-01-15 20:00:00")
+    await setup_integration(hass)
+
+    state = hass.states.get(DOWNSTAIRS_STOCK)
+    assert state is not None
+    assert state.state == "0"
+    assert state.attributes["part_number"] == "F-100"
+    assert state.attributes["reorder"] is True
+    # Nothing on hand, so the next replacement is already short
+    assert state.attributes["stock_out"] == "2026-01-15"
+
+    await set_stock(hass, 3)
+
+    state = hass.states.get(DOWNSTAIRS_STOCK)
+    assert state is not None
+    assert state.state == "3"
+    assert state.attributes["reorder"] is False
+    # Both filters now, the upstairs one again after 30 days, and the fourth
+    # replacement is the downstairs one after 45 days
+    assert (
+        state.attributes["stock_out"]
+        == (date(2026, 1, 15) + timedelta(days=45)).isoformat()
+    )
+
+
+async def test_unloading_consumer_updates_forecast(
+    hass: HomeAssistant, freezer
+) -> None:
+    """Test the forecast is recomputed when a consumable stops using the part."""
+    freezer.move_to("2026-01-15 20:00:00")
+    await setup_integration(hass)
+    garage = MockConfigEntry(
+        version=2,
+        domain=DOMAIN,
+        title="Garage",
+        data={
+            CONF_DEVICE_NAME: "Garage",
+            CONF_CONSUMABLES: [filter_consumable("Garage Filter", 30)],
+        },
+        unique_id="garage",
+    )
+    garage.add_to_hass(hass)
+    await hass.config_entries.async_setup(garage.entry_id)
+    await hass.async_block_till_done()
+    await set_stock(hass, 3)
+
+    state = hass.states.get(DOWNSTAIRS_STOCK)
+    assert state is not None
+    # Three filters take the spares now, so the fourth replacement is short
+    assert state.attributes["stock_out"] == "2026-02-14"
+
+    await hass.config_entries.async_unload(garage.entry_id)
+    await hass.async_block_till_done()
+
+    state = hass.states.get(DOWNSTAIRS_STOCK)
+    assert state is not None
+    assert state.attributes["stock_out"] == "2026-03-01"
+
+
+async def test_lifetime_change_updates_forecast(hass: HomeAssistant, freezer) -> None:
+    """Test the forecast follows a change to a consumable's lifetime."""
+    freezer.move_to("2026-01-15 20:00:00")
+    await setup_integration(hass)
+    await set_stock(hass, 3)
+
+    await hass.services.async_call(
+        "number",
+        "set_value",
+        {"entity_id": "number.test_device_downstairs_filter_lifetime", "value": 200},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+
+    state = hass.states.get(DOWNSTAIRS_STOCK)
+    assert state is not None
+    # The downstairs filter now lasts past the upstairs filter's second
+    # replacement, which takes the last spare
+    assert state.attributes["stock_out"] == "2026-03-16"
+
+
+async def test_replacement_takes_spare(hass: HomeAssistant, freezer, hass_storage):
+    """Test pressing replaced takes a spare and updates the forecast."""
+    freezer.move_to("2026-01-15 20:00:00")
+    await setup_integration(hass)
+    await set_stock(hass, 3)
+
+    await hass.services.async_call(
+        "button",
+        "press",
+        {"entity_id": "button.test_device_mark_upstairs_filter_as_replaced"},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+
+    state = hass.states.get(UPSTAIRS_STOCK)
+    assert state is not None
+    assert state.state == "2"
+    # The downstairs filter takes one spare now and the upstairs filter the
+    # other in 30 days, so the downstairs filter runs short after 45 days
+    assert state.attributes["stock_out"] == "2026-03-01"
+
+    freezer.tick(timedelta(seconds=11))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass_storage[f"{DOMAIN}.inventory"]["data"] == {"F-100": {"on_hand": 2}}
+
+
+async def test_stock_does_not_go_negative(hass: HomeAssistant) -> None:
+    """Test replacing with no spares on hand keeps the stock at zero."""
+    await setup_integration(hass)
+
+    await hass.services.async_call(
+        "button",
+        "press",
+        {"entity_id": "button.test_device_mark_upstairs_filter_as_replaced"},
+        blocking=True,
+    )
+
+    state = hass.states.get(UPSTAIRS_STOCK)
+    assert state is not None
+    assert state.state == "0"
+
+
+async def test_undo_returns_spare(hass: HomeAssistant) -> None:
+    """Test undoing a replacement puts its spare back in stock."""
+    await setup_integration(hass)
+    await set_stock(hass, 3)
+
+    await hass.services.async_call(
+        "button",
+        "press",
+        {"entity_id": "button.test_device_mark_upstairs_filter_as_replaced"},
+        blocking=True,
+    )
+    await hass.services.async_call(
+        DOMAIN,
+        "undo_replaced",
+        {"entity_id": "sensor.test_device_upstairs_filter_days_remaining"},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+
+    state = hass.states.get(UPSTAIRS_STOCK)
+    assert state is not None
+    assert state.state == "3"
+
+
+async def test_undo_without_spare_keeps_stock(hass: HomeAssistant) -> None:
+    """Test undoing a replacement that took no spare leaves the stock alone."""
+    await setup_integration(hass)
+
+    for _ in range(2):
+        await hass.services.async_call(
+            "button",
+            "press",
+            {"entity_id": "button.test_device_mark_upstairs_filter_as_replaced"},
+            blocking=True,
+        )
+    await set_stock(hass, 1)
+    for _ in range(2):
+        await hass.services.async_call(
+            DOMAIN,
+            "undo_replaced",
+            {"entity_id": "sensor.test_device_upstairs_filter_days_remaining"},
+            blocking=True,
+        )
+    await hass.async_block_till_done()
+
+    state = hass.states.get(UPSTAIRS_STOCK)
+    assert state is not None
+    assert state.state == "1"
@@ -0,0 +1,174 @@
+"""Tests for the Consumable Tracker capacity meters."""
+
+from datetime import timedelta
+
+from homeassistant.core import HomeAssistant, State
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.consumable_tracker.const import (
+    CONF_CAPACITY,
+    CONF_CONSUMABLE_NAME,
+    CONF_CONSUMABLES,
+    CONF_DEVICE_NAME,
+    CONF_ICON_NORMAL,
+    CONF_ICON_OVERDUE,
+    CONF_ICON_WARNING,
+    CONF_LIFETIME_DAYS,
+    CONF_METER_ENTITY,
+    CONF_WARNING_DAYS,
+    DEFAULT_ICON_NORMAL,
+    DEFAULT_ICON_OVERDUE,
+    DEFAULT_ICON_WARNING,
+    DOMAIN,
+)
+from custom_components.consumable_tracker.meter import REFRESH_COOLDOWN
+
+METER = "sensor.water_total"
+SENSOR = "sensor.test_device_test_filter_days_remaining"
+
+
+def get_state(hass: HomeAssistant, entity_id: str) -> State:
+    """Return the state of an entity, which must exist."""
+    state = hass.states.get(entity_id)
+    assert state is not None
+    return state
+
+
+def create_entry() -> MockConfigEntry:
+    """Return a config entry with a consumable tracked by capacity."""
+    return MockConfigEntry(
+        version=2,
+        domain=DOMAIN,
+        title="Test Device",
+        data={
+            CONF_DEVICE_NAME: "Test Device",
+            CONF_CONSUMABLES: [
+                {
+                    CONF_CONSUMABLE_NAME: "Test Filter",
+                    CONF_LIFETIME_DAYS: 90,
+                    CONF_WARNING_DAYS: 5,
+                    CONF_METER_ENTITY: METER,
+                    CONF_CAPACITY: 100,
+                    CONF_ICON_NORMAL: DEFAULT_ICON_NORMAL,
+                    CONF_ICON_WARNING: DEFAULT_ICON_WARNING,
+                    CONF_ICON_OVERDUE: DEFAULT_ICON_OVERDUE,
+                },
+            ],
+        },
+        unique_id="test_device",
+    )
+
+
+async def setup_integration(hass: HomeAssistant) -> MockConfigEntry:
+    """Set up the integration with a config entry."""
+    entry = create_entry()
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+
+async def set_meter(hass: HomeAssistant, total: str) -> None:
+    """Report a new total from the meter."""
+    hass.states.async_set(METER, total)
+    await hass.async_block_till_done()
+
+
+async def wait(hass: HomeAssistant, freezer, seconds: float) -> None:
+    """Let time pass."""
+    freezer.tick(timedelta(seconds=seconds))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+
+async def test_capacity_days_remaining(
+    hass: HomeAssistant, freezer, hass_storage
+) -> None:
+    """Test capacity is converted to days at the consumption rate."""
+    freezer.move_to("2026-01-15 20:00:00")
+    hass.states.async_set(METER, "1000")
+    entry = await setup_integration(hass)
+    # No consumption yet, so only the calendar lifetime counts
+    assert get_state(hass, SENSOR).state == "90"
+
+    # 10 litres today leaves 90, at 10 a day
+    await set_meter(hass, "1010")
+    state = get_state(hass, SENSOR)
+    assert state.state == "9"
+    assert state.attributes["capacity_used"] == 10
+    assert state.attributes["consumption_rate"] == 10
+
+    # The meter was reset and counted 5 more; 85 left at 15 a day
+    await set_meter(hass, "5")
+    assert get_state(hass, SENSOR).state == "9"
+    await wait(hass, freezer, REFRESH_COOLDOWN + 1)
+    assert get_state(hass, SENSOR).state == "5"
+
+    stored = hass_storage[f"{DOMAIN}.{entry.entry_id}.meters"]["data"]
+    assert stored == {
+        f"{entry.entry_id}_consumable_0": {
+            "used": 15,
+            "reading": 5,
+            "daily": {"2026-01-15": 15},
+        }
+    }
+
+    # A replacement starts counting from zero; 100 left at 15 a day
+    await hass.services.async_call(
+        "button",
+        "press",
+        {"entity_id": "button.test_device_mark_test_filter_as_replaced"},
+        blocking=True,
+    )
+    state = get_state(hass, SENSOR)
+    assert state.state == "6"
+    assert state.attributes["capacity_used"] == 0
+
+
+async def test_used_up_capacity(hass: HomeAssistant) -> None:
+    """Test a consumable with its capacity used up is overdue."""
+    hass.states.async_set(METER, "0")
+    await setup_integration(hass)
+
+    await set_meter(hass, "150")
+
+    assert get_state(hass, SENSOR).state == "0"
+    assert get_state(hass, "sensor.test_device_test_filter_status").state == "overdue"
+
+
+async def test_catches_up_after_restart(hass: HomeAssistant, hass_storage) -> None:
+    """Test consumption while stopped is added from the checkpoint."""
+    entry = create_entry()
+    key = f"{DOMAIN}.{entry.entry_id}.meters"
+    hass_storage[key] = {
+        "version": 1,
+        "key": key,
+        "data": {
+            f"{entry.entry_id}_consumable_0": {
+                "used": 50,
+                "reading": 1000,
+                "daily": {},
+            },
+            # Left behind by a deleted consumable
+            f"{entry.entry_id}_consumable_1": {
+                "used": 1,
+                "reading": 1,
+                "daily": {},
+            },
+        },
+    }
+    hass.states.async_set(METER, "1020")
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    data = hass.data[DOMAIN][entry.entry_id]
+    assert data.meters[f"{entry.entry_id}_consumable_0"].used == 70
+    assert get_state(hass, SENSOR).attributes["capacity_used"] == 70
+    # The meter store starts from the entry's current consumables
+    assert list(hass.data[f"{DOMAIN}_meter_stores"][entry.entry_id].data) == [
+        f"{entry.entry_id}_consumable_0"
+    ]
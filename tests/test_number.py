@@ -0,0 +1,164 @@
+"""Tests for the Consumable Tracker number entities."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from freezegun import freeze_time
+from homeassistant.core import HomeAssistant, State
+from homeassistant.exceptions import HomeAssistantError
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.consumable_tracker.const import (
+    CONF_CONSUMABLE_NAME,
+    CONF_CONSUMABLES,
+    CONF_DEVICE_NAME,
+    CONF_ICON_NORMAL,
+    CONF_ICON_OVERDUE,
+    CONF_ICON_WARNING,
+    CONF_LIFETIME_DAYS,
+    CONF_LIFETIME_HOURS,
+    CONF_WARNING_DAYS,
+    CONF_WARNING_HOURS,
+    DEFAULT_ICON_NORMAL,
+    DEFAULT_ICON_OVERDUE,
+    DEFAULT_ICON_WARNING,
+    DOMAIN,
+)
+
+SENSOR_ENTITY_ID = "sensor.test_device_test_filter_days_remaining"
+LIFETIME_ENTITY_ID = "number.test_device_test_filter_lifetime"
+WARNING_ENTITY_ID = "number.test_device_test_filter_warning_threshold"
+
+
+def get_state(hass: HomeAssistant, entity_id: str) -> State:
+    """Return the state of an entity, which must exist."""
+    state = hass.states.get(entity_id)
+    assert state is not None
+    return state
+
+
+async def setup_integration(hass: HomeAssistant) -> MockConfigEntry:
+    """Set up the integration with a config entry."""
+    entry = MockConfigEntry(
+        version=2,
+        domain=DOMAIN,
+        title="Test Device",
+        data={
+            CONF_DEVICE_NAME: "Test Device",
+            CONF_CONSUMABLES: [
+                {
+                    CONF_CONSUMABLE_NAME: "Test Filter",
+                    CONF_LIFETIME_DAYS: 90,
+                    CONF_WARNING_DAYS: 15,
+                    CONF_ICON_NORMAL: DEFAULT_ICON_NORMAL,
+                    CONF_ICON_WARNING: DEFAULT_ICON_WARNING,
+                    CONF_ICON_OVERDUE: DEFAULT_ICON_OVERDUE,
+                },
+                {
+                    CONF_CONSUMABLE_NAME: "UV Lamp",
+                    CONF_LIFETIME_DAYS: 2,
+                    CONF_WARNING_DAYS: 0,
+                    CONF_LIFETIME_HOURS: 48,
+                    CONF_WARNING_HOURS: 6,
+                    CONF_ICON_NORMAL: DEFAULT_ICON_NORMAL,
+                    CONF_ICON_WARNING: DEFAULT_ICON_WARNING,
+                    CONF_ICON_OVERDUE: DEFAULT_ICON_OVERDUE,
+                },
+            ],
+        },
+        unique_id="test_device",
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+
+async def set_number(hass: HomeAssistant, entity_id: str, value: int) -> None:
+    """Set a number entity's value."""
+    await hass.services.async_call(
+        "number",
+        "set_value",
+        {"entity_id": entity_id, "value": value},
+        blocking=True,
+    )
+
+
+async def test_numbers_show_settings(hass: HomeAssistant) -> None:
+    """Test the numbers show the consumable's lifetime and warning threshold."""
+    await setup_integration(hass)
+
+    assert get_state(hass, LIFETIME_ENTITY_ID).state == "90"
+    assert get_state(hass, WARNING_ENTITY_ID).state == "15"
+    assert get_state(hass, "number.test_device_uv_lamp_lifetime").state == "48"
+    state = get_state(hass, "number.test_device_uv_lamp_warning_threshold")
+    assert state.state == "6"
+    assert state.attributes["unit_of_measurement"] == "h"
+
+
+@freeze_time("2026-01-15 20:00:00")
+async def test_set_lifetime_updates_in_place(hass: HomeAssistant, hass_storage) -> None:
+    """Test changing the lifetime updates the sensor and store without a reload."""
+    entry = await setup_integration(hass)
+    sensor = hass.data["entity_components"]["sensor"].get_entity(SENSOR_ENTITY_ID)
+
+    await set_number(hass, LIFETIME_ENTITY_ID, 30)
+    await hass.async_block_till_done()
+
+    assert get_state(hass, LIFETIME_ENTITY_ID).state == "30"
+    assert get_state(hass, SENSOR_ENTITY_ID).state == "30"
+    # The sensor was updated, not recreated by a reload
+    assert (
+        hass.data["entity_components"]["sensor"].get_entity(SENSOR_ENTITY_ID) is sensor
+    )
+
+    async_fire_time_changed(hass, datetime.now() + timedelta(seconds=11))
+    await hass.async_block_till_done()
+    stored = hass_storage[f"{DOMAIN}.{entry.entry_id}"]["data"]
+    assert stored[CONF_CONSUMABLES][0][CONF_LIFETIME_DAYS] == 30
+
+
+@freeze_time("2026-01-15 20:00:00")
+async def test_set_warning_changes_status(hass: HomeAssistant) -> None:
+    """Test raising the warning threshold moves the sensor into warning."""
+    await setup_integration(hass)
+    await hass.services.async_call(
+        "date",
+        "set_value",
+        {
+            "entity_id": "date.test_device_test_filter_last_replaced",
+            "date": "2026-01-05",
+        },
+        blocking=True,
+    )
+    assert get_state(hass, SENSOR_ENTITY_ID).state == "80"
+    assert get_state(hass, SENSOR_ENTITY_ID).attributes["icon"] == DEFAULT_ICON_NORMAL
+
+    await set_number(hass, WARNING_ENTITY_ID, 85)
+
+    assert get_state(hass, WARNING_ENTITY_ID).state == "85"
+    assert get_state(hass, SENSOR_ENTITY_ID).attributes["icon"] == DEFAULT_ICON_WARNING
+
+
+async def test_warning_must_be_below_lifetime(hass: HomeAssistant) -> None:
+    """Test a warning threshold reaching the lifetime is rejected."""
+    await setup_integration(hass)
+
+    with pytest.raises(HomeAssistantError):
+        await set_number(hass, WARNING_ENTITY_ID, 90)
+
+    assert get_state(hass, WARNING_ENTITY_ID).state == "15"
+
+
+async def test_set_hour_lifetime_updates_days(hass: HomeAssistant) -> None:
+    """Test changing an hour lifetime keeps the day equivalent in step."""
+    entry = await setup_integration(hass)
+
+    await set_number(hass, "number.test_device_uv_lamp_lifetime", 100)
+
+    consumable = hass.data[DOMAIN][entry.entry_id].devices[0].consumables[1]
+    assert consumable[CONF_LIFETIME_HOURS] == 100
+    assert consumable[CONF_LIFETIME_DAYS] == 5
@@ -0,0 +1,140 @@
+"""Tests for the Consumable Tracker preset catalog."""
+
+from homeassistant import config_entries
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+
+from custom_components.consumable_tracker.const import (
+    CONF_CONSUMABLE_NAME,
+    CONF_CONSUMABLES,
+    CONF_DEVICE_NAME,
+    CONF_ICON_NORMAL,
+    CONF_LIFETIME_DAYS,
+    CONF_PRESET,
+    CONF_SEARCH,
+    CONF_USE_CATALOG,
+    CONF_WARNING_DAYS,
+    DOMAIN,
+)
+from custom_components.consumable_tracker.presets import (
+    DATA_PRESETS,
+    ConsumablePresetCatalog,
+    async_get_preset_catalog,
+)
+
+PRESETS = [
+    {
+        "id": "hvac",
+        CONF_CONSUMABLE_NAME: "HVAC Filter",
+        "category": "HVAC",
+        CONF_LIFETIME_DAYS: 90,
+        CONF_WARNING_DAYS: 14,
+        "keywords": ["furnace"],
+    },
+    {
+        "id": "ro_membrane",
+        CONF_CONSUMABLE_NAME: "RO Membrane",
+        "category": "Water",
+        CONF_LIFETIME_DAYS: 730,
+        CONF_WARNING_DAYS: 30,
+        "keywords": ["reverse", "osmosis"],
+    },
+    {
+        "id": "ro_carbon",
+        CONF_CONSUMABLE_NAME: "RO Carbon Filter",
+        "category": "Water",
+        CONF_LIFETIME_DAYS: 180,
+        CONF_WARNING_DAYS: 14,
+        "keywords": ["reverse", "osmosis"],
+    },
+]
+
+
+def names(results: list[dict]) -> list[str]:
+    """Return the names of presets."""
+    return [preset[CONF_CONSUMABLE_NAME] for preset in results]
+
+
+def test_search() -> None:
+    """Test searching matches word prefixes of names, categories and keywords."""
+    catalog = ConsumablePresetCatalog(PRESETS)
+
+    assert names(catalog.search("filt")) == ["HVAC Filter", "RO Carbon Filter"]
+    assert names(catalog.search("Furnace")) == ["HVAC Filter"]
+    assert names(catalog.search("reverse osm")) == ["RO Carbon Filter", "RO Membrane"]
+    # Every word must match
+    assert names(catalog.search("water filter")) == ["RO Carbon Filter"]
+    assert catalog.search("water furnace") == []
+    assert catalog.search("  ") == []
+    assert names(catalog.search("ro", limit=1)) == ["RO Carbon Filter"]
+
+
+def test_definition() -> None:
+    """Test a preset's definition leaves out the catalog fields."""
+    catalog = ConsumablePresetCatalog(PRESETS)
+
+    assert catalog.definition("hvac") == {
+        CONF_CONSUMABLE_NAME: "HVAC Filter",
+        CONF_LIFETIME_DAYS: 90,
+        CONF_WARNING_DAYS: 14,
+    }
+
+
+async def test_catalog_loaded_once(hass: HomeAssistant) -> None:
+    """Test the shipped catalog is read on first use and then shared."""
+    assert DATA_PRESETS not in hass.data
+
+    catalog = await async_get_preset_catalog(hass)
+
+    assert len(catalog) > 0
+    assert await async_get_preset_catalog(hass) is catalog
+    assert names(catalog.search("cpap filter")) == ["CPAP Disposable Filter"]
+
+
+async def test_user_flow_from_catalog(hass: HomeAssistant) -> None:
+    """Test a consumable picked from the catalog is filled in."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {CONF_DEVICE_NAME: "CPAP", CONF_USE_CATALOG: True},
+    )
+    assert result["step_id"] == "search_presets"
+
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {CONF_SEARCH: "nothing like this"}
+    )
+    assert result["errors"] == {CONF_SEARCH: "no_presets"}
+
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {CONF_SEARCH: "cpap filt"}
+    )
+    assert result["step_id"] == "pick_preset"
+
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {CONF_PRESET: "cpap_filter"}
+    )
+    assert result["step_id"] == "add_consumable"
+
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {CONF_CONSUMABLE_NAME: "CPAP Filter", "add_another": True},
+    )
+    # An empty search goes on to a consumable filled in by hand
+    assert result["step_id"] == "search_presets"
+    result = await hass.config_entries.flow.async_configure(result["flow_id"], {})
+    assert result["step_id"] == "add_consumable"
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {CONF_CONSUMABLE_NAME: "Distilled Water", "add_another": False},
+    )
+
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    first, second = result["data"][CONF_CONSUMABLES]
+    assert first[CONF_CONSUMABLE_NAME] == "CPAP Filter"
+    assert first[CONF_LIFETIME_DAYS] == 14
+    assert first[CONF_WARNING_DAYS] == 2
+    assert first[CONF_ICON_NORMAL] == "mdi:sleep"
+    assert second[CONF_LIFETIME_DAYS] == 90
+    assert second[CONF_ICON_NORMAL] == "mdi:gauge-full"
@@ -1,10 +1,17 @@
 """Tests for the Consumable Tracker sensor entity."""
 
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
 
+import pytest
 from freezegun import freeze_time
-from homeassistant.core import HomeAssistant
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from homeassistant.core import HomeAssistant, State
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+    mock_restore_cache,
+)
 
 from custom_components.consumable_tracker.const import (
     CONF_CONSUMABLE_NAME,
@@ -14,15 +21,19 @@ from custom_components.consumable_tracker.const import (
     CONF_ICON_OVERDUE,
     CONF_ICON_WARNING,
     CONF_LIFETIME_DAYS,
+    CONF_LIGHTWEIGHT,
     CONF_WARNING_DAYS,
     DEFAULT_ICON_NORMAL,
     DEFAULT_ICON_OVERDUE,
     DEFAULT_ICON_WARNING,
     DOMAIN,
+    UNDO_HISTORY_SIZE,
 )
 
 
-async def setup_integration(hass: HomeAssistant) -> MockConfigEntry:
+async def setup_integration(
+    hass: HomeAssistant, lightweight: bool = False
+) -> MockConfigEntry:
     """Set up the integration with a config entry."""
     entry = MockConfigEntry(
         version=2,
@@ -30,6 +41,7 @@ async def setup_integration(hass: HomeAssistant) -> MockConfigEntry:
         title="Test Device",
         data={
             CONF_DEVICE_NAME: "Test Device",
+            CONF_LIGHTWEIGHT: lightweight,
             CONF_CONSUMABLES: [
                 {
                     CONF_CONSUMABLE_NAME: "Test Filter",
@@ -49,6 +61,16 @@ async def setup_integration(hass: HomeAssistant) -> MockConfigEntry:
     return entry
 
 
+async def set_last_replaced(hass: HomeAssistant, value: str) -> None:
+    """Set the consumable's last replaced date through the date entity."""
+    await hass.services.async_call(
+        "date",
+        "set_value",
+        {"entity_id": "date.test_device_test_filter_last_replaced", "date": value},
+        blocking=True,
+    )
+
+
 async def test_sensor_initial_state(hass: HomeAssistant) -> None:
     """Test sensor shows full lifetime when no date is set."""
     await setup_integration(hass)
@@ -63,13 +85,10 @@ async def test_sensor_with_date_set(hass: HomeAssistant) -> None:
     await setup_integration(hass)
 
     # Set the date entity to 30 days ago
-    today = date.today()
+    today = dt_util.now().date()
     thirty_days_ago = today - timedelta(days=30)
 
-    hass.states.async_set(
-        "date.test_device_test_filter_last_replaced",
-        thirty_days_ago.isoformat(),
-    )
+    await set_last_replaced(hass, thirty_days_ago.isoformat())
     await hass.async_block_till_done()
 
     # Get the sensor entity directly to check its native_value
@@ -79,16 +98,13 @@ async def test_sensor_with_date_set(hass: HomeAssistant) -> None:
     assert entity.native_value == 60  # 90 - 30 = 60 days remaining
 
 
-@freeze_time("2026-01-15")
+@freeze_time("2026-01-15 20:00:00")
 async def test_sensor_days_remaining_calculation(hass: HomeAssistant) -> None:
     """Test sensor correctly calculates days remaining."""
     await setup_integration(hass)
 
     # Set the date entity to a specific date
-    hass.states.async_set(
-        "date.test_device_test_filter_last_replaced",
-        "2026-01-01",  # 14 days ago from frozen time
-    )
+    await set_last_replaced(hass, "2026-01-01")  # 14 days ago from frozen time
     await hass.async_block_till_done()
 
     sensor_entity_id = "sensor.test_device_test_filter_days_remaining"
@@ -97,16 +113,13 @@ async def test_sensor_days_remaining_calculation(hass: HomeAssistant) -> None:
     assert entity.native_value == 76  # 90 - 14 = 76 days remaining
 
 
-@freeze_time("2026-01-15")
+@freeze_time("2026-01-15 20:00:00")
 async def test_sensor_icon_normal(hass: HomeAssistant) -> None:
     """Test sensor shows normal icon when plenty of days remaining."""
     await setup_integration(hass)
 
     # Set date to recent (many days remaining)
-    hass.states.async_set(
-        "date.test_device_test_filter_last_replaced",
-        "2026-01-10",  # 5 days ago, 85 days remaining
-    )
+    await set_last_replaced(hass, "2026-01-10")  # 5 days ago, 85 days remaining
     await hass.async_block_till_done()
 
     sensor_entity_id = "sensor.test_device_test_filter_days_remaining"
@@ -115,17 +128,14 @@ async def test_sensor_icon_normal(hass: HomeAssistant) -> None:
     assert entity.icon == DEFAULT_ICON_NORMAL
 
 
-@freeze_time("2026-01-15")
+@freeze_time("2026-01-15 20:00:00")
 async def test_sensor_icon_warning(hass: HomeAssistant) -> None:
     """Test sensor shows warning icon when within warning threshold."""
     await setup_integration(hass)
 
     # Set date so we're in warning zone (15 days or less remaining)
     # 90 - 80 = 10 days remaining (within 15 day warning)
-    hass.states.async_set(
-        "date.test_device_test_filter_last_replaced",
-        "2025-10-27",  # 80 days ago
-    )
+    await set_last_replaced(hass, "2025-10-27")  # 80 days ago
     await hass.async_block_till_done()
 
     sensor_entity_id = "sensor.test_device_test_filter_days_remaining"
@@ -135,16 +145,13 @@ async def test_sensor_icon_warning(hass: HomeAssistant) -> None:
     assert entity.icon == DEFAULT_ICON_WARNING
 
 
-@freeze_time("2026-01-15")
+@freeze_time("2026-01-15 20:00:00")
 async def test_sensor_icon_overdue(hass: HomeAssistant) -> None:
     """Test sensor shows overdue icon when no days remaining."""
     await setup_integration(hass)
 
     # Set date so consumable is overdue (more than 90 days ago)
-    hass.states.async_set(
-        "date.test_device_test_filter_last_replaced",
-        "2025-10-01",  # 106 days ago
-    )
+    await set_last_replaced(hass, "2025-10-01")  # 106 days ago
     await hass.async_block_till_done()
 
     sensor_entity_id = "sensor.test_device_test_filter_days_remaining"
@@ -154,15 +161,12 @@ async def test_sensor_icon_overdue(hass: HomeAssistant) -> None:
     assert entity.icon == DEFAULT_ICON_OVERDUE
 
 
-@freeze_time("2026-01-15")
+@freeze_time("2026-01-15 20:00:00")
 async def test_sensor_extra_attributes(hass: HomeAssistant) -> None:
     """Test sensor extra attributes when date is set."""
     await setup_integration(hass)
 
-    hass.states.async_set(
-        "date.test_device_test_filter_last_replaced",
-        "2026-01-01",  # 14 days ago
-    )
+    await set_last_replaced(hass, "2026-01-01")  # 14 days ago
     await hass.async_block_till_done()
 
     sensor_entity_id = "sensor.test_device_test_filter_days_remaining"
@@ -194,3 +198,276 @@ async def test_sensor_invalid_date_state(hass: HomeAssistant) -> None:
     assert entity is not None
     # Should fall back to full lifetime
     assert entity.native_value == 90
+
+
+async def test_sensor_does_not_poll(hass: HomeAssistant) -> None:
+    """Test the sensor relies on timers instead of polling."""
+    await setup_integration(hass)
+
+    sensor_entity_id = "sensor.test_device_test_filter_days_remaining"
+    entity = hass.data["entity_components"]["sensor"].get_entity(sensor_entity_id)
+    assert entity is not None
+    assert entity.should_poll is False
+
+
+async def test_sensor_updates_at_midnight(hass: HomeAssistant, freezer) -> None:
+    """Test the sensor's one-shot timer updates the state at local midnight."""
+    freezer.move_to("2026-01-15 12:00:00")
+    await setup_integration(hass)
+
+    await set_last_replaced(hass, "2026-01-01")
+    await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.test_device_test_filter_days_remaining")
+    assert state is not None
+    assert state.state == "76"
+
+    next_midnight = dt_util.start_of_local_day(date(2026, 1, 16))
+    freezer.move_to(next_midnight + timedelta(seconds=1))
+    async_fire_time_changed(hass, next_midnight + timedelta(seconds=1))
+    await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.test_device_test_filter_days_remaining")
+    assert state is not None
+    assert state.state == "75"
+
+
+@freeze_time("2026-01-15 20:00:00")
+async def test_sensor_uses_restored_date(hass: HomeAssistant) -> None:
+    """Test the sensor picks up the date entity's restored value on startup."""
+    mock_restore_cache(
+        hass, [State("date.test_device_test_filter_last_replaced", "2026-01-01")]
+    )
+    await setup_integration(hass)
+
+    state = hass.states.get("sensor.test_device_test_filter_days_remaining")
+    assert state is not None
+    assert state.state == "76"
+
+
+@freeze_time("2026-01-15 20:00:00")
+async def test_set_last_replaced_service(hass: HomeAssistant) -> None:
+    """Test setting the last replaced date through the sensor."""
+    await setup_integration(hass)
+
+    await hass.services.async_call(
+        DOMAIN,
+        "set_last_replaced",
+        {
+            "entity_id": "sensor.test_device_test_filter_days_remaining",
+            "last_replaced": "2026-01-01",
+        },
+        blocking=True,
+    )
+
+    state = hass.states.get("date.test_device_test_filter_last_replaced")
+    assert state is not None
+    assert state.state == "2026-01-01"
+    state = hass.states.get("sensor.test_device_test_filter_days_remaining")
+    assert state is not None
+    assert state.state == "76"
+
+
+@freeze_time("2026-01-15 20:00:00")
+async def test_lightweight_entry(hass: HomeAssistant, hass_storage) -> None:
+    """Test a lightweight entry only creates sensors and stores its dates."""
+    entry = await setup_integration(hass, lightweight=True)
+    sensor_entity_id = "sensor.test_device_test_filter_days_remaining"
+
+    assert hass.states.get(sensor_entity_id) is not None
+    assert hass.states.get("date.test_device_test_filter_last_replaced") is None
+    assert hass.states.get("button.test_device_mark_test_filter_as_replaced") is None
+
+    await hass.services.async_call(
+        DOMAIN,
+        "set_last_replaced",
+        {"entity_id": sensor_entity_id, "last_replaced": "2026-01-01"},
+        blocking=True,
+    )
+    state = hass.states.get(sensor_entity_id)
+    assert state is not None
+    assert state.state == "76"
+    assert state.attributes["last_changed"] == "2026-01-01"
+
+    await hass.services.async_call(
+        DOMAIN, "replace", {"entity_id": sensor_entity_id}, blocking=True
+    )
+    state = hass.states.get(sensor_entity_id)
+    assert state is not None
+    assert state.state == "90"
+
+    async_fire_time_changed(hass, datetime.now() + timedelta(seconds=11))
+    await hass.async_block_till_done()
+    stored = hass_storage[f"{DOMAIN}.{entry.entry_id}.last_replaced"]["data"]
+    assert stored == {f"{entry.entry_id}_consumable_0": "2026-01-15"}
+
+
+@freeze_time("2026-01-15 20:00:00")
+async def test_lightweight_entry_loads_stored_dates(
+    hass: HomeAssistant, hass_storage
+) -> None:
+    """Test a lightweight entry's sensors start from the stored dates."""
+    entry = MockConfigEntry(
+        version=2,
+        domain=DOMAIN,
+        title="Test Device",
+        data={
+            CONF_DEVICE_NAME: "Test Device",
+            CONF_LIGHTWEIGHT: True,
+            CONF_CONSUMABLES: [
+                {
+                    CONF_CONSUMABLE_NAME: "Test Filter",
+                    CONF_LIFETIME_DAYS: 90,
+                    CONF_WARNING_DAYS: 15,
+                    CONF_ICON_NORMAL: DEFAULT_ICON_NORMAL,
+                    CONF_ICON_WARNING: DEFAULT_ICON_WARNING,
+                    CONF_ICON_OVERDUE: DEFAULT_ICON_OVERDUE,
+                },
+            ],
+        },
+    )
+    hass_storage[f"{DOMAIN}.{entry.entry_id}.last_replaced"] = {
+        "version": 1,
+        "key": f"{DOMAIN}.{entry.entry_id}.last_replaced",
+        "data": {f"{entry.entry_id}_consumable_0": "2026-01-01"},
+    }
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.test_device_test_filter_days_remaining")
+    assert state is not None
+    assert state.state == "76"
+
+
+async def test_status_sensor(hass: HomeAssistant) -> None:
+    """Test the status sensor follows the consumable's status."""
+    await setup_integration(hass)
+
+    state = hass.states.get("sensor.test_device_test_filter_status")
+    assert state is not None
+    assert state.state == "normal"
+    assert state.attributes["options"] == ["normal", "warning", "overdue"]
+
+    await set_last_replaced(
+        hass, (dt_util.now().date() - timedelta(days=80)).isoformat()
+    )
+    await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.test_device_test_filter_status")
+    assert state is not None
+    assert state.state == "warning"
+
+
+async def test_status_sensor_writes_only_on_change(
+    hass: HomeAssistant, freezer
+) -> None:
+    """Test the daily countdown doesn't write the status sensor's state."""
+    freezer.move_to("2026-01-15 12:00:00")
+    await setup_integration(hass)
+    await set_last_replaced(hass, "2026-01-01")
+    await hass.async_block_till_done()
+    before = hass.states.get("sensor.test_device_test_filter_status")
+    assert before is not None
+
+    next_midnight = dt_util.start_of_local_day(date(2026, 1, 16))
+    freezer.move_to(next_midnight + timedelta(seconds=1))
+    async_fire_time_changed(hass, next_midnight + timedelta(seconds=1))
+    await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.test_device_test_filter_days_remaining")
+    assert state is not None
+    assert state.state == "75"
+    after = hass.states.get("sensor.test_device_test_filter_status")
+    assert after is not None
+    assert after.last_updated == before.last_updated
+
+
+async def test_percentage_sensor(hass: HomeAssistant) -> None:
+    """Test the percentage sensor follows the lifetime remaining."""
+    await setup_integration(hass)
+    entity_id = "sensor.test_device_test_filter_percentage_remaining"
+
+    state = hass.states.get(entity_id)
+    assert state is not None
+    assert state.state == "unknown"
+    assert state.attributes["unit_of_measurement"] == "%"
+    assert state.attributes["state_class"] == "measurement"
+
+    await set_last_replaced(
+        hass, (dt_util.now().date() - timedelta(days=30)).isoformat()
+    )
+    await hass.async_block_till_done()
+
+    state = hass.states.get(entity_id)
+    assert state is not None
+    assert state.state == "66"
+
+
+async def test_lightweight_entry_has_no_status_sensor(hass: HomeAssistant) -> None:
+    """Test lightweight entries only create the days remaining sensor."""
+    await setup_integration(hass, lightweight=True)
+
+    assert hass.states.get("sensor.test_device_test_filter_status") is None
+    assert (
+        hass.states.get("sensor.test_device_test_filter_percentage_remaining") is None
+    )
+
+
+@freeze_time("2026-01-15 20:00:00")
+async def test_undo_replaced_service(hass: HomeAssistant, hass_storage) -> None:
+    """Test undoing replacements restores the previous dates in turn."""
+    entry = await setup_integration(hass)
+    sensor_entity_id = "sensor.test_device_test_filter_days_remaining"
+    date_entity_id = "date.test_device_test_filter_last_replaced"
+    await set_last_replaced(hass, "2026-01-01")
+
+    for _ in range(2):
+        await hass.services.async_call(
+            DOMAIN, "replace", {"entity_id": sensor_entity_id}, blocking=True
+        )
+    state = hass.states.get(date_entity_id)
+    assert state is not None
+    assert state.state == "2026-01-15"
+
+    async_fire_time_changed(hass, datetime.now() + timedelta(seconds=11))
+    await hass.async_block_till_done()
+    stored = hass_storage[f"{DOMAIN}.{entry.entry_id}.history"]["data"]
+    assert stored == {
+        f"{entry.entry_id}_consumable_0": [
+            {"previous": "2026-01-01"},
+            {"previous": "2026-01-15"},
+        ]
+    }
+
+    for _ in range(2):
+        await hass.services.async_call(
+            DOMAIN, "undo_replaced", {"entity_id": sensor_entity_id}, blocking=True
+        )
+    state = hass.states.get(date_entity_id)
+    assert state is not None
+    assert state.state == "2026-01-01"
+    state = hass.states.get(sensor_entity_id)
+    assert state is not None
+    assert state.state == "76"
+
+    with pytest.raises(HomeAssistantError):
+        await hass.services.async_call(
+            DOMAIN, "undo_replaced", {"entity_id": sensor_entity_id}, blocking=True
+        )
+
+
+@freeze_time("2026-01-15 20:00:00")
+async def test_undo_history_is_bounded(hass: HomeAssistant) -> None:
+    """Test only the most recent previous dates are kept."""
+    entry = await setup_integration(hass, lightweight=True)
+    sensor_entity_id = "sensor.test_device_test_filter_days_remaining"
+
+    for _ in range(UNDO_HISTORY_SIZE + 5):
+        await hass.services.async_call(
+            DOMAIN, "replace", {"entity_id": sensor_entity_id}, blocking=True
+        )
+
+    history_store = hass.data[DOMAIN][entry.entry_id].history_store
+    history = history_store.data[f"{entry.entry_id}_consumable_0"]
+    assert history == [{"previous": "2026-01-15"}] * UNDO_HISTORY_SIZE
@@ -0,0 +1,157 @@
+"""Tests for the Consumable Tracker linked source sensors."""
+
+from datetime import timedelta
+
+import pytest
+from homeassistant.core import HomeAssistant, State
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.consumable_tracker.const import (
+    CONF_CONSUMABLE_NAME,
+    CONF_CONSUMABLES,
+    CONF_DEVICE_NAME,
+    CONF_ICON_NORMAL,
+    CONF_ICON_OVERDUE,
+    CONF_ICON_WARNING,
+    CONF_LIFETIME_DAYS,
+    CONF_SOURCE_ENTITY,
+    CONF_WARNING_DAYS,
+    DEFAULT_ICON_NORMAL,
+    DEFAULT_ICON_OVERDUE,
+    DEFAULT_ICON_WARNING,
+    DOMAIN,
+)
+from custom_components.consumable_tracker.source import MIRROR_COOLDOWN, RESET_DELAY
+
+SOURCE = "sensor.purifier_filter_life"
+SENSOR = "sensor.test_device_test_filter_days_remaining"
+LAST_REPLACED = "date.test_device_test_filter_last_replaced"
+
+
+def get_state(hass: HomeAssistant, entity_id: str) -> State:
+    """Return the state of an entity, which must exist."""
+    state = hass.states.get(entity_id)
+    assert state is not None
+    return state
+
+
+async def setup_integration(hass: HomeAssistant) -> MockConfigEntry:
+    """Set up the integration with a config entry."""
+    entry = MockConfigEntry(
+        version=2,
+        domain=DOMAIN,
+        title="Test Device",
+        data={
+            CONF_DEVICE_NAME: "Test Device",
+            CONF_CONSUMABLES: [
+                {
+                    CONF_CONSUMABLE_NAME: "Test Filter",
+                    CONF_LIFETIME_DAYS: 90,
+                    CONF_WARNING_DAYS: 15,
+                    CONF_SOURCE_ENTITY: SOURCE,
+                    CONF_ICON_NORMAL: DEFAULT_ICON_NORMAL,
+                    CONF_ICON_WARNING: DEFAULT_ICON_WARNING,
+                    CONF_ICON_OVERDUE: DEFAULT_ICON_OVERDUE,
+                },
+            ],
+        },
+        unique_id="test_device",
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+
+async def set_source(hass: HomeAssistant, level: str) -> None:
+    """Report a new level from the source sensor."""
+    hass.states.async_set(SOURCE, level)
+    await hass.async_block_till_done()
+
+
+async def wait(hass: HomeAssistant, freezer, seconds: float) -> None:
+    """Let time pass."""
+    freezer.tick(timedelta(seconds=seconds))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+
+async def test_reset_records_replacement(hass: HomeAssistant, freezer) -> None:
+    """Test a source resetting to full records a replacement."""
+    freezer.move_to("2026-01-15 20:00:00")
+    hass.states.async_set(SOURCE, "100")
+    await setup_integration(hass)
+
+    # Full at startup isn't a reset
+    await wait(hass, freezer, RESET_DELAY + 1)
+    assert get_state(hass, LAST_REPLACED).state == "unknown"
+
+    await set_source(hass, "40")
+    await set_source(hass, "100")
+    assert get_state(hass, LAST_REPLACED).state == "unknown"
+
+    await wait(hass, freezer, RESET_DELAY + 1)
+    assert get_state(hass, LAST_REPLACED).state == "2026-01-15"
+
+
+async def test_failed_replacement_is_logged(
+    hass: HomeAssistant, freezer, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a reset that can't be recorded is logged rather than raised."""
+    freezer.move_to("2026-01-15 20:00:00")
+    hass.states.async_set(SOURCE, "40")
+    await setup_integration(hass)
+    er.async_get(hass).async_remove(LAST_REPLACED)
+    await hass.async_block_till_done()
+
+    await set_source(hass, "100")
+    await wait(hass, freezer, RESET_DELAY + 1)
+
+    assert "Could not record the replacement of Test Filter" in caplog.text
+
+
+async def test_reset_needs_hysteresis_and_delay(hass: HomeAssistant, freezer) -> None:
+    """Test glitches and small dips are not taken for replacements."""
+    freezer.move_to("2026-01-15 20:00:00")
+    hass.states.async_set(SOURCE, "90")
+    await setup_integration(hass)
+
+    # Never dropped below the rearm level
+    await set_source(hass, "100")
+    await wait(hass, freezer, RESET_DELAY + 1)
+    assert get_state(hass, LAST_REPLACED).state == "unknown"
+
+    # A brief jump to full
+    await set_source(hass, "40")
+    await set_source(hass, "100")
+    await wait(hass, freezer, RESET_DELAY / 2)
+    await set_source(hass, "41")
+    await wait(hass, freezer, RESET_DELAY)
+    assert get_state(hass, LAST_REPLACED).state == "unknown"
+
+    # Unavailable readings don't cancel a held reset
+    await set_source(hass, "100")
+    await set_source(hass, "unavailable")
+    await wait(hass, freezer, RESET_DELAY + 1)
+    assert get_state(hass, LAST_REPLACED).state == "2026-01-15"
+
+
+async def test_mirrors_source_level(hass: HomeAssistant, freezer) -> None:
+    """Test the sensor mirrors the source, written at most once per cooldown."""
+    hass.states.async_set(SOURCE, "80")
+    await setup_integration(hass)
+    assert get_state(hass, SENSOR).attributes["source_percentage"] == 80
+
+    await set_source(hass, "79")
+    assert get_state(hass, SENSOR).attributes["source_percentage"] == 79
+
+    await set_source(hass, "78")
+    await set_source(hass, "77")
+    assert get_state(hass, SENSOR).attributes["source_percentage"] == 79
+
+    await wait(hass, freezer, MIRROR_COOLDOWN + 1)
+    assert get_state(hass, SENSOR).attributes["source_percentage"] == 77
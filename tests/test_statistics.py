@@ -0,0 +1,98 @@
+"""Tests for the Consumable Tracker long-term statistics."""
+
+import pytest
+from homeassistant.components.recorder.statistics import get_last_statistics
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.components.recorder.common import (
+    async_wait_recording_done,
+)
+
+from custom_components.consumable_tracker.const import (
+    CONF_CONSUMABLE_NAME,
+    CONF_CONSUMABLES,
+    CONF_DEVICE_NAME,
+    CONF_ICON_NORMAL,
+    CONF_ICON_OVERDUE,
+    CONF_ICON_WARNING,
+    CONF_LIFETIME_DAYS,
+    CONF_WARNING_DAYS,
+    DEFAULT_ICON_NORMAL,
+    DEFAULT_ICON_OVERDUE,
+    DEFAULT_ICON_WARNING,
+    DOMAIN,
+)
+from custom_components.consumable_tracker.statistics import (
+    replacements_statistic_id,
+)
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(recorder_db_url, enable_custom_integrations):
+    """Prepare the recorder database before Home Assistant starts."""
+    yield
+
+
+async def setup_integration(hass: HomeAssistant) -> MockConfigEntry:
+    """Set up the integration with a config entry."""
+    entry = MockConfigEntry(
+        version=2,
+        domain=DOMAIN,
+        title="Test Device",
+        data={
+            CONF_DEVICE_NAME: "Test Device",
+            CONF_CONSUMABLES: [
+                {
+                    CONF_CONSUMABLE_NAME: "Test Filter",
+                    CONF_LIFETIME_DAYS: 90,
+                    CONF_WARNING_DAYS: 15,
+                    CONF_ICON_NORMAL: DEFAULT_ICON_NORMAL,
+                    CONF_ICON_WARNING: DEFAULT_ICON_WARNING,
+                    CONF_ICON_OVERDUE: DEFAULT_ICON_OVERDUE,
+                },
+            ],
+        },
+        unique_id="test_device",
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+
+async def test_import_replacements(
+    recorder_mock, hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a replacement history is imported as a running count."""
+    entry = await setup_integration(hass)
+
+    await hass.services.async_call(
+        DOMAIN,
+        "import_replacements",
+        {
+            "entity_id": "sensor.test_device_test_filter_days_remaining",
+            "replacements": ["2025-07-01", "2025-01-15", "2025-04-10"],
+        },
+        blocking=True,
+    )
+    await async_wait_recording_done(hass)
+
+    statistic_id = replacements_statistic_id(f"{entry.entry_id}_consumable_0")
+    stats = await hass.async_add_executor_job(
+        get_last_statistics, hass, 3, statistic_id, False, {"sum"}
+    )
+    assert [row["sum"] for row in stats[statistic_id]] == [3, 2, 1]
+    assert "doesn't specify" not in caplog.text
+
+
+async def test_static_attributes_are_not_recorded(hass: HomeAssistant) -> None:
+    """Test the static attributes are excluded from the recorder."""
+    await setup_integration(hass)
+
+    entity = hass.data["entity_components"]["sensor"].get_entity(
+        "sensor.test_device_test_filter_days_remaining"
+    )
+    assert entity is not None
+    assert "consumable_name" in entity._unrecorded_attributes
+    assert "percentage" not in entity._unrecorded_attributes
+    assert entity.state_class == "measurement"
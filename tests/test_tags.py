@@ -0,0 +1,158 @@
+"""Tests for the Consumable Tracker NFC tag bindings."""
+
+import pytest
+from freezegun import freeze_time
+from homeassistant.core import HomeAssistant, State
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.consumable_tracker.const import (
+    CONF_CONSUMABLE_NAME,
+    CONF_CONSUMABLES,
+    CONF_DEVICE_NAME,
+    CONF_ICON_NORMAL,
+    CONF_ICON_OVERDUE,
+    CONF_ICON_WARNING,
+    CONF_LIFETIME_DAYS,
+    CONF_TAGS,
+    CONF_WARNING_DAYS,
+    DEFAULT_ICON_NORMAL,
+    DEFAULT_ICON_OVERDUE,
+    DEFAULT_ICON_WARNING,
+    DOMAIN,
+)
+
+ICONS = {
+    CONF_ICON_NORMAL: DEFAULT_ICON_NORMAL,
+    CONF_ICON_WARNING: DEFAULT_ICON_WARNING,
+    CONF_ICON_OVERDUE: DEFAULT_ICON_OVERDUE,
+}
+FILTER = "date.test_device_test_filter_last_replaced"
+PAD = "date.test_device_test_pad_last_replaced"
+BRUSH = "date.test_device_test_brush_last_replaced"
+
+
+def get_state(hass: HomeAssistant, entity_id: str) -> State:
+    """Return the state of an entity, which must exist."""
+    state = hass.states.get(entity_id)
+    assert state is not None
+    return state
+
+
+async def setup_integration(hass: HomeAssistant) -> MockConfigEntry:
+    """Set up the integration with a config entry."""
+    entry = MockConfigEntry(
+        version=2,
+        domain=DOMAIN,
+        title="Test Device",
+        data={
+            CONF_DEVICE_NAME: "Test Device",
+            CONF_CONSUMABLES: [
+                {
+                    CONF_CONSUMABLE_NAME: "Test Filter",
+                    CONF_LIFETIME_DAYS: 90,
+                    CONF_WARNING_DAYS: 15,
+                    CONF_TAGS: ["unit-1"],
+                    **ICONS,
+                },
+                {
+                    CONF_CONSUMABLE_NAME: "Test Pad",
+                    CONF_LIFETIME_DAYS: 30,
+                    CONF_WARNING_DAYS: 5,
+                    CONF_TAGS: ["unit-1", "pad"],
+                    **ICONS,
+                },
+                {
+                    CONF_CONSUMABLE_NAME: "Test Brush",
+                    CONF_LIFETIME_DAYS: 60,
+                    CONF_WARNING_DAYS: 5,
+                    **ICONS,
+                },
+            ],
+        },
+        unique_id="test_device",
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+
+async def scan(hass: HomeAssistant, tag_id: str) -> None:
+    """Fire a tag scan."""
+    hass.bus.async_fire("tag_scanned", {"tag_id": tag_id})
+    await hass.async_block_till_done()
+
+
+@freeze_time("2026-01-15 20:00:00")
+async def test_scan_marks_bound_consumables_replaced(hass: HomeAssistant) -> None:
+    """Test scanning a tag replaces only the consumables bound to it."""
+    await setup_integration(hass)
+
+    await scan(hass, "other")
+    assert get_state(hass, FILTER).state == "unknown"
+
+    await scan(hass, "pad")
+    assert get_state(hass, FILTER).state == "unknown"
+    assert get_state(hass, PAD).state == "2026-01-15"
+
+    await scan(hass, "unit-1")
+    assert get_state(hass, FILTER).state == "2026-01-15"
+    assert get_state(hass, BRUSH).state == "unknown"
+
+
+@freeze_time("2026-01-15 20:00:00")
+async def test_failed_binding_is_logged(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a consumable that can't be replaced doesn't stop the others."""
+    await setup_integration(hass)
+    er.async_get(hass).async_remove(FILTER)
+    await hass.async_block_till_done()
+
+    await scan(hass, "unit-1")
+
+    assert get_state(hass, PAD).state == "2026-01-15"
+    assert "Could not mark Test Filter as replaced when tag unit-1" in caplog.text
+
+
+@freeze_time("2026-01-15 20:00:00")
+async def test_options_flow_rebinds_tags(hass: HomeAssistant) -> None:
+    """Test tags edited in the options flow are bound after the reload."""
+    entry = await setup_integration(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"action": "edit"}
+    )
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"consumable": "2"}
+    )
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {
+            CONF_CONSUMABLE_NAME: "Test Brush",
+            CONF_LIFETIME_DAYS: 60,
+            CONF_WARNING_DAYS: 5,
+            CONF_TAGS: ["brush"],
+        },
+    )
+    await hass.config_entries.options.async_configure(
+        result["flow_id"], {"action": "done"}
+    )
+    await hass.async_block_till_done()
+
+    await scan(hass, "brush")
+    assert get_state(hass, BRUSH).state == "2026-01-15"
+    assert get_state(hass, FILTER).state == "unknown"
+
+
+async def test_unload_stops_listening(hass: HomeAssistant) -> None:
+    """Test the tag listener is removed with the last binding."""
+    entry = await setup_integration(hass)
+    assert hass.bus.async_listeners().get("tag_scanned") == 1
+
+    await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.bus.async_listeners().get("tag_scanned") is None
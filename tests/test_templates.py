@@ -0,0 +1,218 @@
+"""Tests for the Consumable Tracker shared templates."""
+
+import pytest
+import voluptuous as vol
+from homeassistant.core import HomeAssistant, State
+from homeassistant.exceptions import HomeAssistantError
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.consumable_tracker.const import (
+    CONF_CONSUMABLE_NAME,
+    CONF_CONSUMABLES,
+    CONF_DEVICE_NAME,
+    CONF_ICON_NORMAL,
+    CONF_ICON_OVERDUE,
+    CONF_ICON_WARNING,
+    CONF_LIFETIME_DAYS,
+    CONF_TEMPLATE,
+    CONF_WARNING_DAYS,
+    DEFAULT_ICON_NORMAL,
+    DEFAULT_ICON_OVERDUE,
+    DEFAULT_ICON_WARNING,
+    DOMAIN,
+)
+from custom_components.consumable_tracker.store import async_load_definitions
+
+ICONS = {
+    CONF_ICON_NORMAL: DEFAULT_ICON_NORMAL,
+    CONF_ICON_WARNING: DEFAULT_ICON_WARNING,
+    CONF_ICON_OVERDUE: DEFAULT_ICON_OVERDUE,
+}
+HEPA = {
+    CONF_CONSUMABLE_NAME: "HEPA Filter",
+    CONF_LIFETIME_DAYS: 90,
+    CONF_WARNING_DAYS: 15,
+    **ICONS,
+}
+TEMPLATES_KEY = f"{DOMAIN}.templates"
+
+
+def get_state(hass: HomeAssistant, entity_id: str) -> State:
+    """Return the state of an entity, which must exist."""
+    state = hass.states.get(entity_id)
+    assert state is not None
+    return state
+
+
+async def setup_integration(
+    hass: HomeAssistant, name: str, consumables: list[dict]
+) -> MockConfigEntry:
+    """Set up the integration with a config entry."""
+    entry = MockConfigEntry(
+        version=2,
+        domain=DOMAIN,
+        title=name,
+        data={CONF_DEVICE_NAME: name, CONF_CONSUMABLES: consumables},
+        unique_id=name,
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+
+@pytest.fixture
+def stored_templates(hass_storage) -> None:
+    """Store a HEPA filter template."""
+    hass_storage[TEMPLATES_KEY] = {
+        "version": 1,
+        "key": TEMPLATES_KEY,
+        "data": {"hepa": dict(HEPA)},
+    }
+
+
+async def save_template(hass: HomeAssistant, **fields) -> None:
+    """Call the save template service."""
+    await hass.services.async_call(
+        DOMAIN,
+        "save_template",
+        {"template_id": "hepa", **fields},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+
+
+@pytest.mark.usefixtures("stored_templates")
+async def test_consumables_follow_template(hass: HomeAssistant) -> None:
+    """Test editing a template updates its consumables without a reload."""
+    first = await setup_integration(hass, "Bedroom", [{CONF_TEMPLATE: "hepa"}])
+    second = await setup_integration(
+        hass, "Office", [{CONF_TEMPLATE: "hepa", CONF_LIFETIME_DAYS: 60}]
+    )
+    data = hass.data[DOMAIN][first.entry_id]
+    assert get_state(hass, "sensor.bedroom_hepa_filter_days_remaining").state == "90"
+    assert get_state(hass, "sensor.office_hepa_filter_days_remaining").state == "60"
+
+    await save_template(
+        hass, consumable_name="HEPA Filter", lifetime_days=120, warning_days=10
+    )
+
+    assert get_state(hass, "sensor.bedroom_hepa_filter_days_remaining").state == "120"
+    assert get_state(hass, "number.bedroom_hepa_filter_lifetime").state == "120"
+    assert get_state(hass, "number.bedroom_hepa_filter_warning_threshold").state == (
+        "10"
+    )
+    # The override still wins
+    assert get_state(hass, "sensor.office_hepa_filter_days_remaining").state == "60"
+    # Neither entry was reloaded
+    assert hass.data[DOMAIN][first.entry_id] is data
+    definitions = await async_load_definitions(hass, second)
+    assert definitions[CONF_CONSUMABLES] == [
+        {CONF_TEMPLATE: "hepa", CONF_LIFETIME_DAYS: 60}
+    ]
+
+
+@pytest.mark.usefixtures("stored_templates")
+async def test_rename_reloads_users_only(hass: HomeAssistant) -> None:
+    """Test renaming a template reloads only the entries using it."""
+    user = await setup_integration(hass, "Bedroom", [{CONF_TEMPLATE: "hepa"}])
+    other = await setup_integration(hass, "Office", [dict(HEPA)])
+    user_data = hass.data[DOMAIN][user.entry_id]
+    other_data = hass.data[DOMAIN][other.entry_id]
+
+    await save_template(
+        hass, consumable_name="Air Filter", lifetime_days=90, warning_days=15
+    )
+
+    state = get_state(hass, "sensor.bedroom_hepa_filter_days_remaining")
+    assert state.attributes["friendly_name"] == "Bedroom Air Filter days remaining"
+    assert hass.data[DOMAIN][user.entry_id] is not user_data
+    assert hass.data[DOMAIN][other.entry_id] is other_data
+
+
+@pytest.mark.usefixtures("stored_templates")
+async def test_delete_template(hass: HomeAssistant, hass_storage) -> None:
+    """Test a template can only be deleted once no consumable uses it."""
+    entry = await setup_integration(hass, "Bedroom", [{CONF_TEMPLATE: "hepa"}])
+
+    with pytest.raises(HomeAssistantError, match="still in use by Bedroom"):
+        await hass.services.async_call(
+            DOMAIN, "delete_template", {"template_id": "hepa"}, blocking=True
+        )
+
+    # An unloaded entry still refers to the template in its stored definitions
+    await hass.config_entries.async_unload(entry.entry_id)
+    with pytest.raises(HomeAssistantError, match="still in use by Bedroom"):
+        await hass.services.async_call(
+            DOMAIN, "delete_template", {"template_id": "hepa"}, blocking=True
+        )
+
+    await hass.config_entries.async_remove(entry.entry_id)
+    await hass.services.async_call(
+        DOMAIN, "delete_template", {"template_id": "hepa"}, blocking=True
+    )
+    await hass.async_block_till_done()
+
+    with pytest.raises(HomeAssistantError, match="Unknown"):
+        await hass.services.async_call(
+            DOMAIN, "delete_template", {"template_id": "hepa"}, blocking=True
+        )
+
+
+async def test_save_template_validates_warning(hass: HomeAssistant) -> None:
+    """Test a template's warning threshold must be below its lifetime."""
+    await setup_integration(hass, "Bedroom", [dict(HEPA)])
+
+    with pytest.raises(HomeAssistantError, match="less than lifetime"):
+        await save_template(
+            hass, consumable_name="HEPA Filter", lifetime_days=10, warning_days=10
+        )
+
+
+async def test_save_template_validates_ranges(hass: HomeAssistant) -> None:
+    """Test a template's lifetime must be in the range the form allows."""
+    await setup_integration(hass, "Bedroom", [dict(HEPA)])
+
+    with pytest.raises(vol.Invalid):
+        await save_template(
+            hass, consumable_name="HEPA Filter", lifetime_days=731, warning_days=15
+        )
+
+
+@pytest.mark.usefixtures("stored_templates")
+async def test_options_flow_templates(hass: HomeAssistant) -> None:
+    """Test adding a consumable from a template and overriding a field."""
+    entry = await setup_integration(hass, "Bedroom", [])
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"action": "add_template"}
+    )
+    assert result["step_id"] == "add_from_template"
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {CONF_TEMPLATE: "hepa"}
+    )
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"action": "edit"}
+    )
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"consumable": "0"}
+    )
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {
+            CONF_CONSUMABLE_NAME: "HEPA Filter",
+            CONF_LIFETIME_DAYS: 45,
+            CONF_WARNING_DAYS: 15,
+        },
+    )
+    await hass.config_entries.options.async_configure(
+        result["flow_id"], {"action": "done"}
+    )
+    await hass.async_block_till_done()
+
+    definitions = await async_load_definitions(hass, entry)
+    assert definitions[CONF_CONSUMABLES] == [
+        {CONF_TEMPLATE: "hepa", CONF_LIFETIME_DAYS: 45}
+    ]
+    assert get_state(hass, "sensor.bedroom_hepa_filter_days_remaining").state == "45"
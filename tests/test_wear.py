@@ -0,0 +1,139 @@
+"""Tests for the Consumable Tracker wear estimates."""
+
+from datetime import timedelta
+
+import pytest
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.consumable_tracker.const import (
+    CONF_CONSUMABLE_NAME,
+    CONF_CONSUMABLES,
+    CONF_DEVICE_NAME,
+    CONF_ICON_NORMAL,
+    CONF_ICON_OVERDUE,
+    CONF_ICON_WARNING,
+    CONF_LIFETIME_DAYS,
+    CONF_WARNING_DAYS,
+    CONF_WEAR_ENTITY,
+    CONF_WEAR_THRESHOLD,
+    DEFAULT_ICON_NORMAL,
+    DEFAULT_ICON_OVERDUE,
+    DEFAULT_ICON_WARNING,
+    DOMAIN,
+)
+from custom_components.consumable_tracker.wear import MIN_SAMPLES
+
+SIGNAL = "sensor.filter_pressure_drop"
+SENSOR = "sensor.test_device_test_filter_days_remaining"
+
+
+async def setup_integration(hass: HomeAssistant, threshold: float) -> MockConfigEntry:
+    """Set up the integration with a config entry."""
+    entry = MockConfigEntry(
+        version=2,
+        domain=DOMAIN,
+        title="Test Device",
+        data={
+            CONF_DEVICE_NAME: "Test Device",
+            CONF_CONSUMABLES: [
+                {
+                    CONF_CONSUMABLE_NAME: "Test Filter",
+                    CONF_LIFETIME_DAYS: 90,
+                    CONF_WARNING_DAYS: 15,
+                    CONF_WEAR_ENTITY: SIGNAL,
+                    CONF_WEAR_THRESHOLD: threshold,
+                    CONF_ICON_NORMAL: DEFAULT_ICON_NORMAL,
+                    CONF_ICON_WARNING: DEFAULT_ICON_WARNING,
+                    CONF_ICON_OVERDUE: DEFAULT_ICON_OVERDUE,
+                },
+            ],
+        },
+        unique_id="test_device",
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+
+async def sample_daily(hass: HomeAssistant, freezer, levels: list[float]) -> None:
+    """Report one signal level a day."""
+    for level in levels:
+        hass.states.async_set(SIGNAL, str(level))
+        await hass.async_block_till_done()
+        freezer.tick(timedelta(days=1))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+
+
+def estimate(hass: HomeAssistant) -> int | None:
+    """Return the sensor's estimated days remaining."""
+    state = hass.states.get(SENSOR)
+    assert state is not None
+    return state.attributes["estimated_remaining"]
+
+
+@pytest.mark.parametrize(
+    ("threshold", "start", "step", "expected"),
+    [
+        # Pressure drop rising 1 a day reaches 130 in 19 days
+        (130, 100, 1, 19),
+        # Airflow falling 5 a day reaches 100 in 9 days
+        (100, 200, -5, 9),
+        # Already past the threshold
+        (105, 100, 1, 0),
+    ],
+)
+async def test_extrapolates_to_threshold(
+    hass: HomeAssistant,
+    freezer,
+    threshold: float,
+    start: float,
+    step: float,
+    expected: int,
+) -> None:
+    """Test the fitted trend is extended to the failure threshold."""
+    freezer.move_to("2026-01-15 20:00:00")
+    await setup_integration(hass, threshold)
+    assert estimate(hass) is None
+
+    await sample_daily(hass, freezer, [start + step * day for day in range(12)])
+
+    assert estimate(hass) == expected
+    # The calendar lifetime is still the state
+    state = hass.states.get(SENSOR)
+    assert state is not None
+    assert state.state == "90"
+
+
+async def test_needs_samples_and_trend(hass: HomeAssistant, freezer) -> None:
+    """Test there's no estimate from too few samples or a flat signal."""
+    freezer.move_to("2026-01-15 20:00:00")
+    await setup_integration(hass, 130)
+
+    await sample_daily(hass, freezer, [100] * (MIN_SAMPLES - 1))
+    assert estimate(hass) is None
+
+    await sample_daily(hass, freezer, [100] * 5)
+    assert estimate(hass) is None
+
+
+async def test_replacement_restarts_fit(hass: HomeAssistant, freezer) -> None:
+    """Test replacing the consumable discards the old fit."""
+    freezer.move_to("2026-01-15 20:00:00")
+    await setup_integration(hass, 130)
+    await sample_daily(hass, freezer, [100 + day for day in range(12)])
+    assert estimate(hass) is not None
+
+    await hass.services.async_call(
+        "button",
+        "press",
+        {"entity_id": "button.test_device_mark_test_filter_as_replaced"},
+        blocking=True,
+    )
+
+    assert estimate(hass) is None
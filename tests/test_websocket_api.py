@@ -0,0 +1,154 @@
+"""Tests for the Consumable Tracker websocket API."""
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.consumable_tracker.const import (
+    CONF_CONSUMABLE_NAME,
+    CONF_CONSUMABLES,
+    CONF_DEVICE_NAME,
+    CONF_ICON_NORMAL,
+    CONF_ICON_OVERDUE,
+    CONF_ICON_WARNING,
+    CONF_LIFETIME_DAYS,
+    CONF_WARNING_DAYS,
+    DEFAULT_ICON_NORMAL,
+    DEFAULT_ICON_OVERDUE,
+    DEFAULT_ICON_WARNING,
+    DOMAIN,
+)
+
+ICONS = {
+    CONF_ICON_NORMAL: DEFAULT_ICON_NORMAL,
+    CONF_ICON_WARNING: DEFAULT_ICON_WARNING,
+    CONF_ICON_OVERDUE: DEFAULT_ICON_OVERDUE,
+}
+
+
+async def setup_integration(hass: HomeAssistant, name: str) -> MockConfigEntry:
+    """Set up the integration with a config entry."""
+    entry = MockConfigEntry(
+        version=2,
+        domain=DOMAIN,
+        title=name,
+        data={
+            CONF_DEVICE_NAME: name,
+            CONF_CONSUMABLES: [
+                {
+                    CONF_CONSUMABLE_NAME: "Test Filter",
+                    CONF_LIFETIME_DAYS: 90,
+                    CONF_WARNING_DAYS: 15,
+                    **ICONS,
+                },
+            ],
+        },
+        unique_id=name,
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+
+async def replace(hass: HomeAssistant, entity_id: str) -> None:
+    """Mark a consumable as replaced."""
+    await hass.services.async_call(
+        DOMAIN, "replace", {"entity_id": entity_id}, blocking=True
+    )
+    await hass.async_block_till_done()
+
+
+async def test_snapshots(hass: HomeAssistant, hass_ws_client, freezer) -> None:
+    """Test the snapshots of one or all entries are returned in one call."""
+    # Connect before freezing time, so the access token isn't from the future
+    client = await hass_ws_client(hass)
+    freezer.move_to("2026-01-15 20:00:00")
+    first = await setup_integration(hass, "First")
+    second = await setup_integration(hass, "Second")
+    await replace(hass, "sensor.first_test_filter_days_remaining")
+
+    await client.send_json_auto_id({"type": f"{DOMAIN}/snapshots"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["consumables"] == [
+        {
+            "id": f"{first.entry_id}_consumable_0",
+            "entry_id": first.entry_id,
+            "device": "First",
+            "name": "Test Filter",
+            "remaining": 90,
+            "unit": "days",
+            "status": "normal",
+            "last_replaced": "2026-01-15",
+            "due": "2026-04-15",
+        },
+        {
+            "id": f"{second.entry_id}_consumable_0",
+            "entry_id": second.entry_id,
+            "device": "Second",
+            "name": "Test Filter",
+            "remaining": 90,
+            "unit": "days",
+            "status": "normal",
+            "last_replaced": None,
+            "due": None,
+        },
+    ]
+
+    await client.send_json_auto_id(
+        {"type": f"{DOMAIN}/snapshots", "config_entry_id": second.entry_id}
+    )
+    response = await client.receive_json()
+    assert [item["device"] for item in response["result"]["consumables"]] == ["Second"]
+
+    await client.send_json_auto_id(
+        {"type": f"{DOMAIN}/snapshots", "config_entry_id": "missing"}
+    )
+    response = await client.receive_json()
+    assert response["error"]["code"] == "not_found"
+
+
+async def test_subscribe_snapshots(
+    hass: HomeAssistant, hass_ws_client, freezer
+) -> None:
+    """Test a subscription sends every snapshot, then only the changes."""
+    client = await hass_ws_client(hass)
+    freezer.move_to("2026-01-15 20:00:00")
+    first = await setup_integration(hass, "First")
+    second = await setup_integration(hass, "Second")
+
+    await client.send_json_auto_id(
+        {"type": f"{DOMAIN}/subscribe_snapshots", "config_entry_id": first.entry_id}
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    event = (await client.receive_json())["event"]
+    assert [item["device"] for item in event["consumables"]] == ["First"]
+
+    # Changes to other entries aren't sent
+    await replace(hass, "sensor.second_test_filter_days_remaining")
+    await replace(hass, "sensor.first_test_filter_days_remaining")
+    event = (await client.receive_json())["event"]
+    assert event == {
+        "changed": [
+            {
+                "id": f"{first.entry_id}_consumable_0",
+                "entry_id": first.entry_id,
+                "device": "First",
+                "name": "Test Filter",
+                "remaining": 90,
+                "unit": "days",
+                "status": "normal",
+                "last_replaced": "2026-01-15",
+                "due": "2026-04-15",
+            }
+        ]
+    }
+
+    # Replacing again the same day changes nothing
+    await replace(hass, "sensor.first_test_filter_days_remaining")
+    await hass.config_entries.async_unload(second.entry_id)
+    await hass.config_entries.async_unload(first.entry_id)
+    await hass.async_block_till_done()
+    event = (await client.receive_json())["event"]
+    assert event == {"removed": [f"{first.entry_id}_consumable_0"]}